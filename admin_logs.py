@@ -2,6 +2,7 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 import json
+from datetime import datetime, timezone
 from utils.comprehensive_logger import get_comprehensive_logger
 
 class AdminLogsCog(commands.Cog):
@@ -10,42 +11,80 @@ class AdminLogsCog(commands.Cog):
 
     @app_commands.command(name="viewlogs", description="View recent bot activity logs for this server")
     @app_commands.checks.has_permissions(administrator=True)
-    @app_commands.describe(limit="Number of recent entries to show (max 50)")
-    async def viewlogs(self, interaction: discord.Interaction, limit: int = 20):
-        if limit > 50:
-            limit = 50
-        
+    @app_commands.describe(
+        limit="Number of entries to show (max 25)",
+        category="Only show entries in this category",
+        user="Only show entries by this member",
+        since="Only show entries on or after this date (YYYY-MM-DD)",
+        until="Only show entries before this date (YYYY-MM-DD)",
+        cursor="Show entries older than this cursor (from the previous page's footer)"
+    )
+    @app_commands.choices(category=[
+        app_commands.Choice(name="Commands", value="COMMAND"),
+        app_commands.Choice(name="Bot Events", value="BOT_EVENT"),
+        app_commands.Choice(name="Teams", value="TEAM")
+    ])
+    async def viewlogs(
+        self,
+        interaction: discord.Interaction,
+        limit: int = 10,
+        category: str = None,
+        user: discord.Member = None,
+        since: str = None,
+        until: str = None,
+        cursor: int = None
+    ):
+        limit = max(1, min(limit, 25))
+        try:
+            since_ts = datetime.strptime(since, "%Y-%m-%d").replace(tzinfo=timezone.utc).timestamp() if since else None
+            until_ts = datetime.strptime(until, "%Y-%m-%d").replace(tzinfo=timezone.utc).timestamp() if until else None
+        except ValueError:
+            await interaction.response.send_message("Dates must be in YYYY-MM-DD format.", ephemeral=True)
+            return
+
+        await interaction.response.defer(ephemeral=True)
         logger = get_comprehensive_logger(self.bot)
-        logs = logger.get_guild_log_summary(interaction.guild.id, limit)
-        
+        logs, next_cursor = await logger.query(
+            interaction.guild.id,
+            category=category,
+            user_id=user.id if user else None,
+            since=since_ts,
+            until=until_ts,
+            before_id=cursor,
+            limit=limit
+        )
+
         if not logs:
-            await interaction.response.send_message("No logs found for this server.", ephemeral=True)
+            await interaction.followup.send("No logs found for this server.", ephemeral=True)
             return
-        
+
         embed = discord.Embed(
             title=f"Recent Bot Activity - {interaction.guild.name}",
-            description=f"Showing last {len(logs)} entries",
+            description=f"Showing {len(logs)} entries, newest first",
             color=discord.Color.blue(),
             timestamp=discord.utils.utcnow()
         )
-        
-        for log in logs[-10:]:  # Show last 10 in embed
+
+        for log in logs:
             timestamp = log['timestamp']
             category = log['category']
             action = log['action']
             details = log['details']
-            user = log.get('user', {}).get('name', 'System')
-            
+            user_name = log.get('user', {}).get('name', 'System')
+
             embed.add_field(
-                name=f"{category}: {action}",
-                value=f"**Time:** {timestamp}\n**User:** {user}\n**Details:** {details}"[:1024],
+                name=f"{category}: {action}"[:256],
+                value=f"**Time:** {timestamp}\n**User:** {user_name}\n**Details:** {details}"[:200],
                 inline=False
             )
-        
+
+        if next_cursor:
+            embed.set_footer(text=f"More entries available: use cursor={next_cursor}")
+
         if interaction.guild.icon:
             embed.set_thumbnail(url=interaction.guild.icon.url)
-        
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+        await interaction.followup.send(embed=embed, ephemeral=True)
 
 async def setup(bot):
     await bot.add_cog(AdminLogsCog(bot))
@@ -7,37 +7,17 @@ import os
 from datetime import datetime
 import pytz
 from utils.team_utils import team_autocomplete
-
-CONFIG_FILE = "config/setup.json"
-DRAFT_FILE = "config/draft.json"
+from utils.config_store import get_config_store
+from utils.draft_state import get_draft_registry
+from utils.team_resolver import get_team_resolver
+from utils.roster_index import get_roster_index, roster_ready
+from utils.log_sink import get_log_sink
 
 def load_config():
-    if os.path.exists(CONFIG_FILE):
-        with open(CONFIG_FILE, 'r') as f:
-            return json.load(f)
-    return {}
+    return get_config_store().get_global()
 
 def save_config(config):
-    with open(CONFIG_FILE, 'w') as f:
-        json.dump(config, f, indent=4)
-
-def load_draft():
-    if os.path.exists(DRAFT_FILE):
-        with open(DRAFT_FILE, 'r') as f:
-            return json.load(f)
-    return {
-        "draft_active": False,
-        "draft_paused": False,
-        "current_round": 0,
-        "current_pick": 0,
-        "draft_order": [],
-        "autopick_settings": {},
-        "picks": []
-    }
-
-def save_draft(draft_data):
-    with open(DRAFT_FILE, 'w') as f:
-        json.dump(draft_data, f, indent=4)
+    get_config_store().save_global(config)
 
 class ConfirmModal(discord.ui.Modal):
     def __init__(self, action, callback):
@@ -59,7 +39,7 @@ class DraftCog(commands.Cog):
         self.bot = bot
         self.config = load_config()
         self.team_emojis = self.config.get("team_emojis", {})
-        self.draft_data = load_draft()
+        self.drafts = get_draft_registry()
 
     async def log_action(self, guild, action, details):
         logs_channel_id = self.config.get("logs_channel")
@@ -72,20 +52,22 @@ class DraftCog(commands.Cog):
                     color=discord.Color.blue(),
                     timestamp=discord.utils.utcnow()
                 )
-                await logs_channel.send(embed=embed)
+                get_log_sink(self.bot).post(logs_channel, embed)
 
     def get_team_info(self, member: discord.Member):
-        for role in member.roles:
-            if role.name in self.config.get("teams", []) and role.name != "@everyone":
-                emoji = self.team_emojis.get(role.name, "")
-                return role, role.name, emoji
-        return None, None, None
+        return get_team_resolver(self.bot).get_team_info(member)
 
     def get_team_members(self, guild: discord.Guild, team_name: str):
         team_role = discord.utils.get(guild.roles, name=team_name)
         if not team_role:
             return []
-        return [member for member in guild.members if team_role in member.roles]
+        return get_roster_index(self.bot).members(guild, team_role)
+
+    def get_team_count(self, guild: discord.Guild, team_name: str):
+        team_role = discord.utils.get(guild.roles, name=team_name)
+        if not team_role:
+            return 0
+        return get_roster_index(self.bot).count(guild, team_role)
 
     # CPU Break: Pause after cog initialization
     # asyncio.sleep(2) simulated during code generation
@@ -94,7 +76,7 @@ class DraftCog(commands.Cog):
     @app_commands.checks.has_permissions(administrator=True)
     @app_commands.describe(rounds="Number of draft rounds", picks_per_round="Picks per round")
     async def startdraft(self, interaction: discord.Interaction, rounds: int, picks_per_round: int):
-        if self.draft_data.get("draft_active", False):
+        if self.drafts.is_active(interaction.guild.id):
             await interaction.response.send_message("A draft is already active.", ephemeral=True)
             return
         if rounds < 1 or picks_per_round < 1:
@@ -108,19 +90,7 @@ class DraftCog(commands.Cog):
         draft_order = teams * rounds
         random.shuffle(draft_order)
 
-        self.draft_data = {
-            "draft_active": True,
-            "draft_paused": False,
-            "current_round": 1,
-            "current_pick": 1,
-            "total_rounds": rounds,
-            "picks_per_round": picks_per_round,
-            "draft_order": draft_order,
-            "autopick_settings": {team: [] for team in teams},  # Initialize empty lists for autopick preferences
-            "picks": []
-        # Store draft picks
-        }
-        save_draft(self.draft_data)
+        self.drafts.start(interaction.guild.id, rounds, picks_per_round, draft_order, teams)
 
         current_team = draft_order[0] if draft_order else teams[0]
         team_emoji = self.team_emojis.get(current_team, "")
@@ -141,24 +111,29 @@ class DraftCog(commands.Cog):
         await interaction.response.send_message("Draft started!", ephemeral=True)
         await self.log_action(interaction.guild, "Draft Started", f"Rounds: {rounds}, Picks per Round: {picks_per_round}")
 
+    @app_commands.command(name="claimlegacydraft", description="Move the draft saved before per-server drafts to this server.")
+    @app_commands.checks.has_permissions(administrator=True)
+    async def claimlegacydraft(self, interaction: discord.Interaction):
+        if not self.drafts.has_legacy():
+            await interaction.response.send_message("There is no legacy draft to claim.", ephemeral=True)
+            return
+        if self.drafts.is_active(interaction.guild.id):
+            await interaction.response.send_message("End this server's active draft before claiming the legacy one.", ephemeral=True)
+            return
+        state = self.drafts.claim_legacy(interaction.guild.id)
+        status = "active" if state.get("draft_active", False) else "finished"
+        await interaction.response.send_message(f"Legacy draft ({status}, {len(state.get('picks', []))} picks) moved to this server.", ephemeral=True)
+        await self.log_action(interaction.guild, "Legacy Draft Claimed", f"Claimed by {interaction.user.mention}")
+
     # CPU Break: Pause after /startdraft
     @app_commands.command()
     async def enddraft(self, interaction: discord.Interaction):
-        if not self.draft_data.get("draft_active", False):
+        if not self.drafts.is_active(interaction.guild.id):
             await interaction.response.send_message("No draft is currently active.", ephemeral=True)
             return
 
         async def enddraft_callback(interaction: discord.Interaction):
-            self.draft_data = {
-                "draft_active": False,
-                "draft_paused": False,
-                "current_round": 0,
-                "current_pick": 0,
-                "draft_order": [],
-                "autopick_settings": {},
-                "picks": self.draft_data.get("picks", [])
-            }
-            save_draft(self.draft_data)
+            self.drafts.end(interaction.guild.id)
             embed = discord.Embed(
                 title="Draft Ended",
                 description="The draft has been terminated.",
@@ -178,15 +153,14 @@ class DraftCog(commands.Cog):
 
     @app_commands.command()
     async def pausedraft(self, interaction: discord.Interaction):
-        if not self.draft_data.get("draft_active", False):
+        if not self.drafts.is_active(interaction.guild.id):
             await interaction.response.send_message("No draft is currently active.", ephemeral=True)
             return
-        if self.draft_data.get("draft_paused", True):
+        if self.drafts.get(interaction.guild.id).get("draft_paused", True):
             await interaction.response.send_message("The draft is already paused.", ephemeral=True)
             return
 
-        self.draft_data["draft_paused"] = True
-        save_draft(self.draft_data)
+        self.drafts.set_paused(interaction.guild.id, True)
         embed = discord.Embed(
             title="Draft Paused",
             description="The draft has been paused.",
@@ -203,22 +177,20 @@ class DraftCog(commands.Cog):
 
     @app_commands.command()
     async def resumedraft(self, interaction: discord.Interaction):
-        if not self.draft_data.get("draft_active", False):
+        if not self.drafts.is_active(interaction.guild.id):
             await interaction.response.send_message("No draft is currently active.", ephemeral=True)
             return
-        if not self.draft_data.get("draft_paused", False):
+        draft_data = self.drafts.get(interaction.guild.id)
+        if not draft_data.get("draft_paused", False):
             await interaction.response.send_message("The draft is not paused.", ephemeral=True)
             return
 
-        self.draft_data["draft_paused"] = False
-        save_draft(self.draft_data)
-        current_team = self.draft_data["draft_order"][
-            (self.draft_data["current_round"] - 1) * self.draft_data["picks_per_round"] + self.draft_data["current_pick"] - 1
-        ]
+        self.drafts.set_paused(interaction.guild.id, False)
+        current_team = draft_data["draft_order"][self.drafts.current_index(draft_data)]
         team_emoji = self.team_emojis.get(current_team, "")
         embed = discord.Embed(
             title="Draft Resumed",
-            description=f"The draft has resumed. {team_emoji} {current_team} is on the clock for Round {self.draft_data['current_round']}, Pick {self.draft_data['current_pick']}.",
+            description=f"The draft has resumed. {team_emoji} {current_team} is on the clock for Round {draft_data['current_round']}, Pick {draft_data['current_pick']}.",
             color=discord.Color.green(),
             timestamp=discord.utils.utcnow()
         )
@@ -233,11 +205,13 @@ class DraftCog(commands.Cog):
     @app_commands.command()
     @app_commands.checks.has_any_role("Franchise Owner", "General Manager")
     @app_commands.describe(player="The player to draft", team="The team making the pick")
+    @roster_ready()
     async def setpick(self, interaction: discord.Interaction, player: discord.Member, team: str):
-        if not self.draft_data.get("draft_active", False):
+        if not self.drafts.is_active(interaction.guild.id):
             await interaction.response.send_message("No draft active.", ephemeral=True)
             return
-        if self.draft_data.get("draft_paused", False):
+        draft_data = self.drafts.get(interaction.guild.id)
+        if draft_data.get("draft_paused", False):
             await interaction.response.send_message("The draft is paused.", ephemeral=True)
             return
         if team not in self.config.get("teams", []):
@@ -249,11 +223,11 @@ class DraftCog(commands.Cog):
             await interaction.response.send_message(f"You can only make picks for your own team.", ephemeral=True)
             return
 
-        current_index = (self.draft_data["current_round"] - 1) * self.draft_data["picks_per_round"] + self.draft_data["current_pick"] - 1
-        if current_index >= len(self.draft_data["draft_order"]):
+        current_index = self.drafts.current_index(draft_data)
+        if current_index >= len(draft_data["draft_order"]):
             await interaction.response.send_message("Draft has ended.", ephemeral=True)
             return
-        current_team = self.draft_data["draft_order"][current_index]
+        current_team = draft_data["draft_order"][current_index]
         if current_team != team:
             await interaction.response.send_message(f"It’s not {team}’s turn to pick.", ephemeral=True)
             return
@@ -264,7 +238,7 @@ class DraftCog(commands.Cog):
             return
 
         roster_cap = int(self.config.get("roster_cap", 53))
-        current_roster = len(self.get_team_members(interaction.guild, team))
+        current_roster = self.get_team_count(interaction.guild, team)
         if current_roster >= roster_cap:
             await interaction.response.send_message(f"{team} has reached the roster cap ({roster_cap}).", ephemeral=True)
             return
@@ -272,42 +246,25 @@ class DraftCog(commands.Cog):
         try:
             team_role = discord.utils.get(interaction.guild.roles, name=team)
             await player.add_roles(team_role)
-            self.draft_data["picks"].append({
-                "round": self.draft_data["current_round"],
-                "pick": self.draft_data["current_pick"],
-                "team": team,
-                "player": player.display_name,
-                "player_id": str(player.id)
-            })
-
-            # Advance draft pick
-            self.draft_data["current_pick"] += 1
-            if self.draft_data["current_pick"] > self.draft_data["picks_per_round"]:
-                self.draft_data["current_round"] += 1
-                self.draft_data["current_pick"] = 1
-            if self.draft_data["current_round"] > self.draft_data["total_rounds"]:
-                self.draft_data["draft_active"] = False
-                self.draft_data["draft_paused"] = False
-
-            save_draft(self.draft_data)
+            self.drafts.record_pick(interaction.guild.id, team, player)
 
             team_emoji = self.team_emojis.get(team, "")
             embed = discord.Embed(
                 title="Draft Pick",
-                description=f"{team_emoji} {team} selects {player.mention} in Round {self.draft_data['picks'][-1]['round']}, Pick {self.draft_data['picks'][-1]['pick']}.",
+                description=f"{team_emoji} {team} selects {player.mention} in Round {draft_data['picks'][-1]['round']}, Pick {draft_data['picks'][-1]['pick']}.",
                 color=discord.Color.blue(),
                 timestamp=discord.utils.utcnow()
             )
             if interaction.guild.icon:
                 embed.set_thumbnail(url=interaction.guild.icon.url)
-            if self.draft_data.get("draft_active", True):
-                next_index = (self.draft_data["current_round"] - 1) * self.draft_data["picks_per_round"] + self.draft_data["current_pick"] - 1
-                if next_index < len(self.draft_data["draft_order"]):
-                    next_team = self.draft_data["draft_order"][next_index]
+            if draft_data.get("draft_active", True):
+                next_index = self.drafts.current_index(draft_data)
+                if next_index < len(draft_data["draft_order"]):
+                    next_team = draft_data["draft_order"][next_index]
                     next_emoji = self.team_emojis.get(next_team, "")
                     embed.add_field(
                         name="Next Pick",
-                        value=f"{next_emoji} {next_team} is on the clock for Round {self.draft_data['current_round']}, Pick {self.draft_data['current_pick']}.",
+                        value=f"{next_emoji} {next_team} is on the clock for Round {draft_data['current_round']}, Pick {draft_data['current_pick']}.",
                         inline=False
                     )
             else:
@@ -320,7 +277,7 @@ class DraftCog(commands.Cog):
             await self.log_action(
                 interaction.guild,
                 "Draft Pick",
-                f"{team} picked {player.display_name} (Round {self.draft_data['picks'][-1]['round']}, Pick {self.draft_data['picks'][-1]['pick']})"
+                f"{team} picked {player.display_name} (Round {draft_data['picks'][-1]['round']}, Pick {draft_data['picks'][-1]['pick']})"
             )
         except discord.errors.HTTPException as e:
             await interaction.response.send_message(f"Failed to set pick: {e}", ephemeral=True)
@@ -329,7 +286,7 @@ class DraftCog(commands.Cog):
     @app_commands.checks.has_any_role("Franchise Owner", "General Manager")
     @app_commands.describe(team="The team to toggle autopick for")
     async def autopick(self, interaction: discord.Interaction, team: str):
-        if not self.draft_data.get("draft_active", False):
+        if not self.drafts.is_active(interaction.guild.id):
             await interaction.response.send_message("No draft is currently active.", ephemeral=True)
             return
         if team not in self.config.get("teams", []):
@@ -341,9 +298,10 @@ class DraftCog(commands.Cog):
             await interaction.response.send_message("You can only toggle autopick for your own team.", ephemeral=True)
             return
 
-        self.draft_data["autopick_settings"][team] = not self.draft_data["autopick_settings"].get(team, False)
-        save_draft(self.draft_data)
-        status = "enabled" if self.draft_data["autopick_settings"][team] else "disabled"
+        draft_data = self.drafts.get(interaction.guild.id)
+        draft_data["autopick_settings"][team] = not draft_data["autopick_settings"].get(team, False)
+        self.drafts.save(interaction.guild.id, draft_data)
+        status = "enabled" if draft_data["autopick_settings"][team] else "disabled"
         team_emoji = self.team_emojis.get(team, "")
         embed = discord.Embed(
             title="Auto-pick Updated",
@@ -358,9 +316,10 @@ class DraftCog(commands.Cog):
 
     @app_commands.command()
     async def draftorder(self, interaction: discord.Interaction):
-        if not self.draft_data.get("draft_active", False):
+        if not self.drafts.is_active(interaction.guild.id):
             await interaction.response.send_message("No draft is currently active.", ephemeral=True)
             return
+        draft_data = self.drafts.get(interaction.guild.id)
 
         embed = discord.Embed(
             title="Draft Order",
@@ -371,10 +330,10 @@ class DraftCog(commands.Cog):
             embed.set_thumbnail(url=interaction.guild.icon.url)
 
         order_by_round = []
-        for round_num in range(1, self.draft_data["total_rounds"] + 1):
-            start_idx = (round_num - 1) * self.draft_data["picks_per_round"]
-            end_idx = start_idx + self.draft_data["picks_per_round"]
-            round_picks = self.draft_data["draft_order"][start_idx:end_idx]
+        for round_num in range(1, draft_data["total_rounds"] + 1):
+            start_idx = (round_num - 1) * draft_data["picks_per_round"]
+            end_idx = start_idx + draft_data["picks_per_round"]
+            round_picks = draft_data["draft_order"][start_idx:end_idx]
             picks = []
             for i, team in enumerate(round_picks, 1):
                 team_emoji = self.team_emojis.get(team, "")
@@ -387,9 +346,10 @@ class DraftCog(commands.Cog):
 
     @app_commands.command()
     async def draftstatus(self, interaction: discord.Interaction):
-        if not self.draft_data.get("draft_active", False):
+        if not self.drafts.is_active(interaction.guild.id):
             await interaction.response.send_message("No draft is currently active.", ephemeral=True)
             return
+        draft_data = self.drafts.get(interaction.guild.id)
 
         embed = discord.Embed(
             title="Draft Status",
@@ -398,17 +358,17 @@ class DraftCog(commands.Cog):
         )
         embed.add_field(
             name="Status",
-            value="Paused" if self.draft_data.get("draft_paused", False) else "Active",
+            value="Paused" if draft_data.get("draft_paused", False) else "Active",
             inline=True
         )
         embed.add_field(
             name="Current Pick",
-            value=f"Round {self.draft_data['current_round']}, Pick {self.draft_data['current_pick']}",
+            value=f"Round {draft_data['current_round']}, Pick {draft_data['current_pick']}",
             inline=True
         )
-        current_index = (self.draft_data["current_round"] - 1) * self.draft_data["picks_per_round"] + self.draft_data["current_pick"] - 1
-        if current_index < len(self.draft_data["draft_order"]):
-            current_team = self.draft_data["draft_order"][current_index]
+        current_index = self.drafts.current_index(draft_data)
+        if current_index < len(draft_data["draft_order"]):
+            current_team = draft_data["draft_order"][current_index]
             team_emoji = self.team_emojis.get(current_team, "")
             embed.add_field(
                 name="On the Clock",
@@ -416,9 +376,9 @@ class DraftCog(commands.Cog):
                 inline=False
             )
 
-        if self.draft_data["picks"]:
+        if draft_data["picks"]:
             picks = []
-            for pick in self.draft_data["picks"]:
+            for pick in draft_data["picks"]:
                 team_emoji = self.team_emojis.get(pick["team"], "")
                 picks.append(f"{team_emoji} {pick['team']}: {pick['player']} (Round {pick['round']}, Pick {pick['pick']})")
             embed.add_field(
@@ -438,11 +398,13 @@ class DraftCog(commands.Cog):
     @app_commands.checks.has_permissions(administrator=True)
     @app_commands.describe(team="The team making the pick", player="The player being drafted")
     @app_commands.autocomplete(team=team_autocomplete)
+    @roster_ready()
     async def draftpick(self, interaction: discord.Interaction, team: str, player: discord.Member):
-        if not self.draft_data.get("draft_active", False):
+        if not self.drafts.is_active(interaction.guild.id):
             await interaction.response.send_message("No draft active.", ephemeral=True)
             return
-        if self.draft_data.get("draft_paused", False):
+        draft_data = self.drafts.get(interaction.guild.id)
+        if draft_data.get("draft_paused", False):
             await interaction.response.send_message("The draft is paused.", ephemeral=True)
             return
         if team not in self.config.get("teams", []):
@@ -454,11 +416,11 @@ class DraftCog(commands.Cog):
             await interaction.response.send_message(f"You can only make picks for your own team.", ephemeral=True)
             return
 
-        current_index = (self.draft_data["current_round"] - 1) * self.draft_data["picks_per_round"] + self.draft_data["current_pick"] - 1
-        if current_index >= len(self.draft_data["draft_order"]):
+        current_index = self.drafts.current_index(draft_data)
+        if current_index >= len(draft_data["draft_order"]):
             await interaction.response.send_message("Draft has ended.", ephemeral=True)
             return
-        current_team = self.draft_data["draft_order"][current_index]
+        current_team = draft_data["draft_order"][current_index]
         if current_team != team:
             await interaction.response.send_message(f"It’s not {team}’s turn to pick.", ephemeral=True)
             return
@@ -469,7 +431,7 @@ class DraftCog(commands.Cog):
             return
 
         roster_cap = int(self.config.get("roster_cap", 53))
-        current_roster = len(self.get_team_members(interaction.guild, team))
+        current_roster = self.get_team_count(interaction.guild, team)
         if current_roster >= roster_cap:
             await interaction.response.send_message(f"{team} has reached the roster cap ({roster_cap}).", ephemeral=True)
             return
@@ -477,42 +439,25 @@ class DraftCog(commands.Cog):
         try:
             team_role = discord.utils.get(interaction.guild.roles, name=team)
             await player.add_roles(team_role)
-            self.draft_data["picks"].append({
-                "round": self.draft_data["current_round"],
-                "pick": self.draft_data["current_pick"],
-                "team": team,
-                "player": player.display_name,
-                "player_id": str(player.id)
-            })
-
-            # Advance draft pick
-            self.draft_data["current_pick"] += 1
-            if self.draft_data["current_pick"] > self.draft_data["picks_per_round"]:
-                self.draft_data["current_round"] += 1
-                self.draft_data["current_pick"] = 1
-            if self.draft_data["current_round"] > self.draft_data["total_rounds"]:
-                self.draft_data["draft_active"] = False
-                self.draft_data["draft_paused"] = False
-
-            save_draft(self.draft_data)
+            self.drafts.record_pick(interaction.guild.id, team, player)
 
             team_emoji = self.team_emojis.get(team, "")
             embed = discord.Embed(
                 title="Draft Pick",
-                description=f"{team_emoji} {team} selects {player.mention} in Round {self.draft_data['picks'][-1]['round']}, Pick {self.draft_data['picks'][-1]['pick']}.",
+                description=f"{team_emoji} {team} selects {player.mention} in Round {draft_data['picks'][-1]['round']}, Pick {draft_data['picks'][-1]['pick']}.",
                 color=discord.Color.blue(),
                 timestamp=discord.utils.utcnow()
             )
             if interaction.guild.icon:
                 embed.set_thumbnail(url=interaction.guild.icon.url)
-            if self.draft_data.get("draft_active", True):
-                next_index = (self.draft_data["current_round"] - 1) * self.draft_data["picks_per_round"] + self.draft_data["current_pick"] - 1
-                if next_index < len(self.draft_data["draft_order"]):
-                    next_team = self.draft_data["draft_order"][next_index]
+            if draft_data.get("draft_active", True):
+                next_index = self.drafts.current_index(draft_data)
+                if next_index < len(draft_data["draft_order"]):
+                    next_team = draft_data["draft_order"][next_index]
                     next_emoji = self.team_emojis.get(next_team, "")
                     embed.add_field(
                         name="Next Pick",
-                        value=f"{next_emoji} {next_team} is on the clock for Round {self.draft_data['current_round']}, Pick {self.draft_data['current_pick']}.",
+                        value=f"{next_emoji} {next_team} is on the clock for Round {draft_data['current_round']}, Pick {draft_data['current_pick']}.",
                         inline=False
                     )
             else:
@@ -525,7 +470,7 @@ class DraftCog(commands.Cog):
             await self.log_action(
                 interaction.guild,
                 "Draft Pick",
-                f"{team} picked {player.display_name} (Round {self.draft_data['picks'][-1]['round']}, Pick {self.draft_data['picks'][-1]['pick']})"
+                f"{team} picked {player.display_name} (Round {draft_data['picks'][-1]['round']}, Pick {draft_data['picks'][-1]['pick']})"
             )
         except discord.errors.HTTPException as e:
             await interaction.response.send_message(f"Failed to set pick: {e}", ephemeral=True)
@@ -7,20 +7,16 @@ from datetime import datetime
 import pytz
 import aiohttp
 import asyncio
+from utils.config_store import get_config_store
+from utils.log_sink import get_log_sink
 
-CONFIG_FILE = "config/setup.json"
 EMOJIS_FILE = "emojis.json"
 
 def load_config():
-    if os.path.exists(CONFIG_FILE):
-        with open(CONFIG_FILE, 'r') as f:
-            return json.load(f)
-    return {}
+    return get_config_store().get_global()
 
 def save_config(config):
-    os.makedirs(os.path.dirname(CONFIG_FILE), exist_ok=True)
-    with open(CONFIG_FILE, 'w') as f:
-        json.dump(config, f, indent=4)
+    get_config_store().save_global(config)
 
 def load_emoji_config():
     if os.path.exists(EMOJIS_FILE):
@@ -52,7 +48,7 @@ class EmojiCog(commands.Cog):
                     embed.set_footer(text=f"Guild ID: {guild.id}", icon_url=guild.icon.url)
                 else:
                     embed.set_footer(text=f"Guild ID: {guild.id}")
-                await logs_channel.send(embed=embed)
+                get_log_sink(self.bot).post(logs_channel, embed)
 
     @app_commands.command(name="addemojis", description="Add all NFL team emojis to the server.")
     @app_commands.checks.has_permissions(administrator=True)
@@ -7,31 +7,22 @@ import os
 from datetime import datetime
 import pytz
 import asyncio
+from utils.config_store import get_config_store
+from utils.team_utils import team_autocomplete
+from utils.team_resolver import get_team_resolver
+from utils.log_sink import get_log_sink
 
-CONFIG_FILE = "config/setup.json"
 
 def load_config():
-    if os.path.exists(CONFIG_FILE):
-        with open(CONFIG_FILE, 'r') as f:
-            return json.load(f)
-    return {}
+    return get_config_store().get_global()
 
 def load_guild_config(guild_id):
     """Load guild-specific configuration"""
-    config_file = f"config/setup_{guild_id}.json"
-    if os.path.exists(config_file):
-        with open(config_file, 'r') as f:
-            content = f.read().strip()
-            if content:
-                return json.loads(content)
-    return {}
+    return get_config_store().get_guild(guild_id)
 
 def save_guild_config(guild_id, config):
     """Save guild-specific configuration"""
-    os.makedirs("config", exist_ok=True)
-    config_file = f"config/setup_{guild_id}.json"
-    with open(config_file, 'w') as f:
-        json.dump(config, f, indent=4)
+    get_config_store().save_guild(guild_id, config)
 
 class FreeAgencyCog(commands.Cog):
     def __init__(self, bot):
@@ -41,13 +32,7 @@ class FreeAgencyCog(commands.Cog):
 
     def get_guild_config(self, guild_id):
         """Load guild-specific configuration from setup"""
-        config_file = f"config/setup_{guild_id}.json"
-        if os.path.exists(config_file):
-            with open(config_file, 'r') as f:
-                content = f.read().strip()
-                if content:
-                    return json.loads(content)
-        return {}
+        return get_config_store().get_guild(guild_id)
 
     def has_required_roles(self, interaction: discord.Interaction):
         """Check if user has any of the configured franchise management roles"""
@@ -95,18 +80,10 @@ class FreeAgencyCog(commands.Cog):
                     color=discord.Color.blue(),
                     timestamp=discord.utils.utcnow()
                 )
-                await logs_channel.send(embed=embed)
+                get_log_sink(self.bot).post(logs_channel, embed)
 
     def get_team_info(self, member: discord.Member):
-        config = self.get_guild_config(member.guild.id)
-        team_emojis = config.get("team_emojis", {})
-        teams = config.get("teams", [])
-
-        for role in member.roles:
-            if role.name in teams and role.name != "@everyone":
-                emoji = team_emojis.get(role.name, "")
-                return role, role.name, emoji
-        return None, None, None
+        return get_team_resolver(self.bot).get_team_info(member)
 
     def has_franchise_role(self, member: discord.Member):
         config = self.get_guild_config(member.guild.id)
@@ -145,8 +122,7 @@ class FreeAgencyCog(commands.Cog):
             return
 
         team_role, team_name, _ = self.get_team_info(interaction.user)
-        teams = config.get("teams", [])
-        has_team = team_name in teams
+        has_team = team_name is not None
         is_staff = self.has_franchise_role(interaction.user)
         is_verified = self.has_verified_role(interaction.user)
 
@@ -312,14 +288,6 @@ class FreeAgencyCog(commands.Cog):
             )
         return callback
 
-    async def team_autocomplete(self, interaction: discord.Interaction, current: str) -> list[app_commands.Choice[str]]:
-        config = self.get_guild_config(interaction.guild.id)
-        teams = config.get("teams", [])
-        return [
-            app_commands.Choice(name=team, value=team)
-            for team in teams if current.lower() in team.lower()
-        ]
-
     @app_commands.command(name="teamclaim", description="Claim a free agent for your team.")
     @app_commands.describe(player="The free agent to claim", team="The team claiming the player")
     @app_commands.autocomplete(team=team_autocomplete)
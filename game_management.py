@@ -6,25 +6,34 @@ import os
 from datetime import datetime, timedelta
 import pytz
 import asyncio
+import aiohttp
 from utils.team_utils import team_autocomplete
+from utils.config_store import get_config_store
+from utils.component_router import get_component_router
+from utils.log_sink import get_log_sink
+from utils.standings import get_standings, report_key
+from utils.ratings import get_ratings
+from utils.game_log import get_game_log
+from utils.game_registry import get_game_registry
+from utils.player_stats import LEADER_STATS, StatImport, get_player_stats, stream_csv
+
+LEAGUE_TIMEZONE = "America/Chicago"  # Game days are dated in league time by every report command
 
-CONFIG_FILE = "config/setup.json"
 
 def load_config():
-    if os.path.exists(CONFIG_FILE):
-        with open(CONFIG_FILE, 'r') as f:
-            return json.load(f)
-    return {}
+    return get_config_store().get_global()
 
 def save_config(config):
-    with open(CONFIG_FILE, 'w') as f:
-        json.dump(config, f, indent=4)
+    get_config_store().save_global(config)
 
 class GameManagementCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.config = load_config()
         self.team_emojis = self.config.get("team_emojis", {})
+        self._leaderboard_cache = {}
+        self._posted_scoreboards = {}
+        get_component_router(bot).register("scorereport", self.handle_score_report)
 
     async def log_action(self, guild, action, details):
         logs_channel_id = self.config.get("logs_channel")
@@ -37,7 +46,7 @@ class GameManagementCog(commands.Cog):
                     color=discord.Color.blue(),
                     timestamp=discord.utils.utcnow()
                 )
-                await logs_channel.send(embed=embed)
+                get_log_sink(self.bot).post(logs_channel, embed)
 
     def get_guild_config(self, guild_id):
         guild_id_str = str(guild_id)
@@ -45,6 +54,212 @@ class GameManagementCog(commands.Cog):
             self.config[guild_id_str] = {}
         return self.config[guild_id_str]
 
+    def posted_week(self, guild_id):
+        """The most recently posted schedule week, or None outside a season."""
+        schedule_cog = self.bot.get_cog("ScheduleCog")
+        data = schedule_cog.league_data.get(str(guild_id), {}) if schedule_cog else {}
+        if not isinstance(data, dict) or data.get("offseason") or data.get("current_week", 1) <= 1:
+            return None
+        return data["current_week"] - 1
+
+    def score_report_key(self, guild_id, team1, team2, played_at=None, week=None):
+        """Report key for a game and the scheduled game it belongs to, if any.
+
+        The scheduled game is the pair's game in `week` (default the week
+        last posted) or, failing that, their latest unweeked /gametime game
+        if it is still to be played or kicked off that day; it is keyed by
+        its registry ID. Anything else is keyed by the day it was played
+        (played_at, default now) in league time, so repeat reports of one
+        game share a key whichever command sends them.
+        """
+        registry = get_game_registry()
+        tz = pytz.timezone(LEAGUE_TIMEZONE)
+        day = (played_at or discord.utils.utcnow()).astimezone(tz).date()
+        target_week = week or self.posted_week(guild_id)
+        scheduled = registry.find(guild_id, team1, team2, target_week) if target_week else None
+        if not scheduled and week is None:
+            scheduled = registry.find(guild_id, team1, team2, statuses=("scheduled", "played"))
+            if scheduled and (scheduled.get("week") is not None or (
+                    scheduled["status"] == "played"
+                    and not (scheduled.get("kickoff") and datetime.fromtimestamp(scheduled["kickoff"], tz).date() == day))):
+                scheduled = None
+        scope = f"game:{scheduled['id']}" if scheduled else f"date:{day.isoformat()}"
+        return report_key(scope, team1, team2), scheduled
+
+    async def record_result(self, guild, home, away, home_score=None, away_score=None, winner=None, scheduled=None, key=None, replace=False):
+        """Log a result in the standings and bring the power rankings up to date.
+
+        Returns (game, status); with a report key the result is upserted, see
+        Standings.report_game, otherwise status is always "new". A recorded
+        result marks its scheduled game played, and a replaced one has its
+        report message deleted.
+        """
+        standings = get_standings()
+        week = scheduled.get("week") if scheduled else None
+        if key:
+            previous = standings.find_report(guild.id, key)
+            game, status = standings.report_game(guild.id, key, home, away, home_score, away_score, winner, week, replace)
+        else:
+            previous = None
+            game, status = standings.record_game(guild.id, home, away, home_score, away_score, winner, week), "new"
+        if status not in ("new", "updated"):
+            return game, status
+        if scheduled:
+            get_game_registry().update(guild.id, scheduled, status="played")
+            standings.annotate(guild.id, game, scheduled_id=scheduled["id"])
+        get_ratings().rankings(guild.id)
+        if status == "updated":
+            await self.delete_report_message(guild, previous)
+        return game, status
+
+    def reverse_result(self, guild, game):
+        """Take a result (a logged game or its ID) back out of the standings and reopen its scheduled game.
+
+        Returns the removed game, or None if it was not logged.
+        """
+        game = get_standings().remove_game(guild.id, game["id"] if isinstance(game, dict) else game)
+        if game:
+            get_ratings().rankings(guild.id)
+            registry = get_game_registry()
+            scheduled = registry.get(guild.id, game["scheduled_id"]) if game.get("scheduled_id") else None
+            if scheduled and scheduled["status"] == "played":
+                registry.update(guild.id, scheduled, status="scheduled")
+        return game
+
+    async def delete_report_message(self, guild, game):
+        """Delete the posted report for a logged game, if it has one."""
+        channel_id, message_id = game.get("report_message") or (None, None)
+        channel = guild.get_channel(channel_id) if channel_id else None
+        if channel is None:
+            return
+        try:
+            await channel.get_partial_message(message_id).delete()
+        except discord.NotFound:
+            pass
+        except discord.HTTPException as e:
+            print(f"Failed to delete superseded score report in {guild.name}: {e}")
+
+    async def flag_conflict(self, interaction, game, home, away, home_score=None, away_score=None, winner=None):
+        """Tell the reporter their result disagrees with the recorded one and flag it for admins."""
+        def describe(home, away, home_score, away_score, winner):
+            if home_score is not None and away_score is not None:
+                return f"{home} {home_score} - {away_score} {away}"
+            return f"{winner} defeated {away if winner == home else home}" if winner else f"{home} tied {away}"
+
+        recorded = describe(game["home"], game["away"], game.get("home_score"), game.get("away_score"), game.get("winner"))
+        reported = describe(home, away, home_score, away_score, winner)
+        await interaction.response.send_message(
+            f"This game is already recorded as {recorded}. Your result has been flagged for an admin to review.",
+            ephemeral=True
+        )
+        await self.log_action(
+            interaction.guild, "Score Report Conflict",
+            f"Recorded: {recorded}\nReported: {reported} by {interaction.user.mention}\n"
+            "An admin can cancel the recorded report and report the game again to correct it."
+        )
+
+    def leaderboard_embed(self, guild):
+        """The team leaderboard embed, rebuilt only when the standings change."""
+        teams = tuple(self.get_guild_config(guild.id).get("teams", []))
+        icon_url = guild.icon.url if guild.icon else None
+        key = (get_standings().version(guild.id), teams, icon_url, tuple(sorted(self.team_emojis.items())))
+        cached = self._leaderboard_cache.get(guild.id)
+        if cached and cached[0] == key:
+            return cached[1]
+
+        # Standings are kept sorted by the engine; this is a cached read between reports
+        table = get_standings().table(guild.id, list(teams))
+        embed = discord.Embed(
+            title="📊 Team Leaderboard",
+            description=f"Win/Loss records for all teams - Season {get_standings().current_season(guild.id)}",
+            color=discord.Color.gold(),
+            timestamp=discord.utils.utcnow()
+        )
+        if icon_url:
+            embed.set_thumbnail(url=icon_url)
+
+        leaderboard_text = []
+        for i, record in enumerate(table, 1):
+            record_text = f"{record.wins}-{record.losses}" + (f"-{record.ties}" if record.ties else "")
+            team_emoji = self.team_emojis.get(record.team, "")
+            leaderboard_text.append(
+                f"**{i}.** {team_emoji} {record.team}\n"
+                f"   Record: {record_text} ({record.pct * 100:.1f}%) | Diff: {record.point_diff:+d} | Streak: {record.streak_text()}"
+            )
+
+        # Split into chunks to avoid embed limit
+        chunk_size = 10
+        for i in range(0, len(leaderboard_text), chunk_size):
+            chunk = leaderboard_text[i:i + chunk_size]
+            field_name = f"Rankings ({i+1}-{min(i+chunk_size, len(leaderboard_text))})" if len(leaderboard_text) > chunk_size else "Rankings"
+            embed.add_field(
+                name=field_name,
+                value="\n\n".join(chunk),
+                inline=False
+            )
+
+        embed.set_footer(text="Use /teamleaderboard <winning_team> <losing_team> to record a game result")
+        self._leaderboard_cache[guild.id] = (key, embed)
+        return embed
+
+    async def refresh_scoreboard(self, guild):
+        """Edit the scoreboard posted in the scores channel, posting it the first time."""
+        guild_config = self.get_guild_config(guild.id)
+        scores_channel_id = guild_config.get("channels", {}).get("scores")
+        channel = guild.get_channel(int(scores_channel_id)) if scores_channel_id else None
+        if not channel or not guild_config.get("teams"):
+            return
+        embed = self.leaderboard_embed(guild)
+        if self._posted_scoreboards.get(guild.id) is embed:
+            return  # nothing changed since the last edit
+        message_id = guild_config.get("scoreboard_message")
+        try:
+            if message_id:
+                try:
+                    await channel.get_partial_message(int(message_id)).edit(embed=embed)
+                except discord.NotFound:
+                    # The old scoreboard was deleted; post a fresh one in its place
+                    message_id = None
+            if not message_id:
+                message = await channel.send(embed=embed)
+                guild_config["scoreboard_message"] = message.id
+                save_config(self.config)
+        except discord.HTTPException as e:
+            print(f"Failed to update scoreboard in {guild.name}: {e}")
+            return
+        self._posted_scoreboards[guild.id] = embed
+
+    async def handle_score_report(self, interaction: discord.Interaction, button: str, key: str):
+        # Reports posted before results were keyed carry only the reporter ID
+        reporter_id, _, game_id = key.partition(":")
+        if button == "cancel":
+            if str(interaction.user.id) != reporter_id and not interaction.user.guild_permissions.administrator:
+                await interaction.response.send_message("Only the original user or admins can cancel.", ephemeral=True)
+                return
+            # Reverse the result so the standings match what is still posted
+            game = self.reverse_result(interaction.guild, int(game_id)) if game_id.isdigit() else None
+            await interaction.message.delete()
+            await interaction.response.send_message(
+                "Game report cancelled and removed from the standings!" if game else "Game report cancelled!",
+                ephemeral=True
+            )
+            if game:
+                await self.refresh_scoreboard(interaction.guild)
+                await self.log_action(
+                    interaction.guild, "Score Report Cancelled",
+                    f"{game['home']} {game['home_score']} vs {game['away']} {game['away_score']} by {interaction.user.mention}"
+                )
+            return
+
+        label = "Streamer" if button == "streamer" else "Referee"
+        if label not in [role.name for role in interaction.user.roles]:
+            await interaction.response.send_message(f"You need the {label} role.", ephemeral=True)
+            return
+        embed = interaction.message.embeds[0]
+        embed.add_field(name=label, value=interaction.user.mention, inline=True)
+        await interaction.message.edit(embed=embed)
+        await interaction.response.send_message(f"{label} set!", ephemeral=True)
+
     # CPU Break: Pause after cog initialization
     # asyncio.sleep(2) simulated during code generation
 
@@ -84,7 +299,8 @@ class GameManagementCog(commands.Cog):
         date="Game date",
         timezone="Timezone for the game",
         channel="Channel to send the report to (optional)",
-        thread="Thread to send the report to (optional)"
+        thread="Thread to send the report to (optional)",
+        week="Schedule week of the game (defaults to the week last posted)"
     )
     @app_commands.choices(time=[
         app_commands.Choice(name=f"{h:02d}:{m:02d} {'PM' if h >= 12 else 'AM'}", value=f"{h:02d}:{m:02d}")
@@ -112,7 +328,8 @@ class GameManagementCog(commands.Cog):
         date: str,
         timezone: str = "America/Chicago",
         channel: str = None,
-        thread: str = None
+        thread: str = None,
+        week: int = None
     ):
         guild_config = self.get_guild_config(interaction.guild.id)
         if team1 not in guild_config.get("teams", []) or team2 not in guild_config.get("teams", []):
@@ -160,43 +377,6 @@ class GameManagementCog(commands.Cog):
         if interaction.guild.icon:
             embed.set_thumbnail(url=interaction.guild.icon.url)
 
-        class ScoreReportView(discord.ui.View):
-            def __init__(self, user):
-                super().__init__(timeout=None)
-                self.original_user = user
-                self.streamer = None
-                self.referee = None
-
-            @discord.ui.button(label="Set Streamer", style=discord.ButtonStyle.primary)
-            async def streamer_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-                if "Streamer" not in [role.name for role in interaction.user.roles]:
-                    await interaction.response.send_message("You need the Streamer role.", ephemeral=True)
-                    return
-                self.streamer = interaction.user
-                embed.add_field(name="Streamer", value=interaction.user.mention, inline=True)
-                await interaction.message.edit(embed=embed, view=self)
-                await interaction.response.send_message("Streamer set!", ephemeral=True)
-
-            @discord.ui.button(label="Set Referee", style=discord.ButtonStyle.green)
-            async def referee_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-                if "Referee" not in [role.name for role in interaction.user.roles]:
-                    await interaction.response.send_message("You need the Referee role.", ephemeral=True)
-                    return
-                self.referee = interaction.user
-                embed.add_field(name="Referee", value=interaction.user.mention, inline=True)
-                await interaction.message.edit(embed=embed, view=self)
-                await interaction.response.send_message("Referee set!", ephemeral=True)
-
-            @discord.ui.button(label="Cancel", style=discord.ButtonStyle.danger)
-            async def cancel_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-                if interaction.user != self.original_user and not interaction.user.guild_permissions.administrator:
-                    await interaction.response.send_message("Only the original user or admins can cancel.", ephemeral=True)
-                    return
-                await interaction.message.delete()
-                await interaction.response.send_message("Game report cancelled!", ephemeral=True)
-
-        view = ScoreReportView(interaction.user)
-        target = None
         if thread:
             target = interaction.guild.get_channel(int(thread)) if thread.isdigit() else None
         elif channel:
@@ -210,44 +390,49 @@ class GameManagementCog(commands.Cog):
             else:
                 await interaction.response.send_message("No score report channel configured. Please specify a channel or thread.", ephemeral=True)
                 return
+        if target is None:
+            await interaction.response.send_message("Score report channel not found.", ephemeral=True)
+            return
 
-        if target:
-            await target.send(embed=embed, view=view)
-        # Update team records based on scores
-        guild_config = self.get_guild_config(interaction.guild.id)
-        if "team_records" not in guild_config:
-            guild_config["team_records"] = {}
-            
-        # Initialize team records if not exists
-        for team in [team1, team2]:
-            if team not in guild_config["team_records"]:
-                guild_config["team_records"][team] = {"wins": 0, "losses": 0}
-        
-        # Determine winner and update records
-        if score_team1 > score_team2:
-            guild_config["team_records"][team1]["wins"] += 1
-            guild_config["team_records"][team2]["losses"] += 1
-            winner = team1
-            loser = team2
-        elif score_team2 > score_team1:
-            guild_config["team_records"][team2]["wins"] += 1
-            guild_config["team_records"][team1]["losses"] += 1
-            winner = team2
-            loser = team1
-        else:
-            # Tie game - no wins/losses recorded
-            winner = None
-            loser = None
-            
-        # Save updated configuration
-        self.config[str(interaction.guild.id)] = guild_config
-        save_config(self.config)
+        # Admins correct a recorded result by reporting it again; anyone else's disagreement is flagged
+        key, scheduled = self.score_report_key(interaction.guild.id, team1, team2, game_datetime, week)
+        game, status = await self.record_result(
+            interaction.guild, team1, team2, score_team1, score_team2,
+            scheduled=scheduled, key=key, replace=interaction.user.guild_permissions.administrator
+        )
+        if status == "duplicate":
+            await interaction.response.send_message("This game has already been reported with the same score.", ephemeral=True)
+            return
+        if status == "conflict":
+            await self.flag_conflict(interaction, game, team1, team2, score_team1, score_team2)
+            return
+        winner = game["winner"]
 
-        await interaction.response.send_message("Game report submitted!", ephemeral=True)
+        view = get_component_router(self.bot).make_view("scorereport", f"{interaction.user.id}:{game['id']}", [
+            ("streamer", "Set Streamer", discord.ButtonStyle.primary),
+            ("referee", "Set Referee", discord.ButtonStyle.green),
+            ("cancel", "Cancel", discord.ButtonStyle.danger)
+        ])
+        try:
+            message = await target.send(embed=embed, view=view)
+        except discord.HTTPException as e:
+            # Without a posted report there is no Cancel button, so don't count the result either
+            self.reverse_result(interaction.guild, game)
+            await interaction.response.send_message(f"Could not post the score report, so it was not recorded: {e}", ephemeral=True)
+            return
+        get_standings().annotate(interaction.guild.id, game, report_message=[target.id, message.id])
+
+        await interaction.response.send_message(
+            "Game report updated with the new score!" if status == "updated" else "Game report submitted!",
+            ephemeral=True
+        )
+        await self.refresh_scoreboard(interaction.guild)
         
         log_details = f"Reported: {team1} {score_team1} vs {team2} {score_team2}"
         if winner:
             log_details += f" | Winner: {winner}"
+        if status == "updated":
+            log_details += " | Replaced an earlier report"
         await self.log_action(interaction.guild, "Score Report", log_details)
 
     # CPU Break: Pause after /scorereport
@@ -289,25 +474,53 @@ class GameManagementCog(commands.Cog):
     # CPU Break: Pause after /sendscorereport
     # asyncio.sleep(2) simulated during code generation
 
+    @app_commands.command(name="importstats", description="Import player stats for a game from a CSV file.")
+    @app_commands.checks.has_permissions(administrator=True)
+    @app_commands.describe(
+        stats="CSV with a header row: player, team, position, then stat columns (pass_yds, rec_yds, def_int, sacks, ...)",
+        week="Week the game was played (for the log)"
+    )
+    async def importstats(self, interaction: discord.Interaction, stats: discord.Attachment, week: int = None):
+        if not stats.filename.lower().endswith(".csv"):
+            await interaction.response.send_message("Please attach a .csv file.", ephemeral=True)
+            return
+        await interaction.response.defer(ephemeral=True)
+        stat_import = StatImport()
+        try:
+            await stream_csv(stats.url, stat_import)
+        except ValueError as e:
+            await interaction.followup.send(f"Could not import {stats.filename}: {e}", ephemeral=True)
+            return
+        except aiohttp.ClientError:
+            await interaction.followup.send(f"Could not download {stats.filename}.", ephemeral=True)
+            return
+        player_stats = get_player_stats()
+        if player_stats.already_imported(interaction.guild.id, stat_import.digest):
+            await interaction.followup.send(f"{stats.filename} has already been imported.", ephemeral=True)
+            return
+        players = player_stats.commit(interaction.guild.id, stat_import)
+        summary = f"{stat_import.rows} rows, {players} players" + (f", {stat_import.skipped} rows skipped" if stat_import.skipped else "")
+        await interaction.followup.send(f"Imported {stats.filename}: {summary}.", ephemeral=True)
+        week_text = f" (week {week})" if week is not None else ""
+        await self.log_action(interaction.guild, "Stats Imported", f"{stats.filename}{week_text}: {summary}")
+
     @app_commands.command(name="leaderboard", description="Display leaderboards for top players.")
     async def leaderboard(self, interaction: discord.Interaction):
-        # Placeholder for stats (no OCR integration)
-        stats = {
-            "Passer": [],  # QB
-            "Receiver": [],  # WR
-            "Corner": [],  # DB
-            "Defender": []  # DE
-        }
+        player_stats = get_player_stats()
         embed = discord.Embed(
             title="Player Leaderboards",
             color=discord.Color.gold(),
             timestamp=discord.utils.utcnow()
         )
-        position_names = {"Passer": "QB", "Receiver": "WR", "Corner": "DB", "Defender": "DE"}
-        for position, nickname in position_names.items():
+        for position, (stat, label) in LEADER_STATS.items():
+            leaders = player_stats.leaders(interaction.guild.id, stat)
+            lines = [
+                f"**{i}.** {name}" + (f" ({team})" if team else "") + f" - {total:g}"
+                for i, (name, team, total) in enumerate(leaders, 1)
+            ]
             embed.add_field(
-                name=f"{nickname} Leader",
-                value="No stats available yet." if not stats[position] else "\n".join(stats[position]),
+                name=f"{position} Leader - {label}",
+                value="\n".join(lines) if lines else "No stats available yet.",
                 inline=False
             )
         if interaction.guild.icon:
@@ -333,39 +546,104 @@ class GameManagementCog(commands.Cog):
     # CPU Break: Pause after /leaderboard
     # asyncio.sleep(2) simulated during code generation
 
-    @app_commands.command(name="teamleaderboard", description="Show team win/loss ratios.")
-    async def teamleaderboard(self, interaction: discord.Interaction):
-        # Placeholder for team records
+    @app_commands.command(name="teamscore", description="Record a score for a team.")
+    @app_commands.checks.has_permissions(administrator=True)
+    @app_commands.describe(home_team="The home team", away_team="The away team", home_score="Home team score", away_score="Away team score", week="Schedule week of the game (defaults to the week last posted)")
+    @app_commands.autocomplete(home_team=team_autocomplete, away_team=team_autocomplete)
+    async def teamscore(self, interaction: discord.Interaction, home_team: str, away_team: str, home_score: int, away_score: int, week: int = None):
+        teams = self.get_guild_config(interaction.guild.id).get("teams", [])
+        if home_team not in teams or away_team not in teams or home_team == away_team:
+            await interaction.response.send_message("Invalid teams. Must be created via /addteam.", ephemeral=True)
+            return
+        if home_score < 0 or away_score < 0:
+            await interaction.response.send_message("Scores must be non-negative.", ephemeral=True)
+            return
+        key, scheduled = self.score_report_key(interaction.guild.id, home_team, away_team, week=week)
+        _, status = await self.record_result(
+            interaction.guild, home_team, away_team, home_score, away_score,
+            scheduled=scheduled, key=key, replace=True
+        )
+        if status == "duplicate":
+            await interaction.response.send_message("That result has already been recorded.", ephemeral=True)
+            return
+        await interaction.response.send_message(f"{'Updated' if status == 'updated' else 'Recorded'}: {home_team} {home_score} - {away_score} {away_team}", ephemeral=True)
+        await self.refresh_scoreboard(interaction.guild)
+        await self.log_action(interaction.guild, "Score Recorded", f"{home_team} {home_score} - {away_score} {away_team}")
+
+    @app_commands.command(name="powerrankings", description="Show Elo power rankings.")
+    async def powerrankings(self, interaction: discord.Interaction):
+        rankings = get_ratings().rankings(interaction.guild.id)
+        if not rankings:
+            await interaction.response.send_message("No games have been reported this season yet.", ephemeral=True)
+            return
+        standings = get_standings()
+        lines = []
+        for i, (team, rating) in enumerate(rankings[:25], 1):
+            record = standings.record(interaction.guild.id, team)
+            record_text = f"{record.wins}-{record.losses}" + (f"-{record.ties}" if record.ties else "")
+            lines.append(f"**{i}.** {self.team_emojis.get(team, '')} {team} - {rating:.0f} ({record_text})")
         embed = discord.Embed(
-            title="Team Leaderboard",
-            description="No team records available yet.",
-            color=discord.Color.blue(),
+            title="Power Rankings",
+            description="\n".join(lines),
+            color=discord.Color.gold(),
             timestamp=discord.utils.utcnow()
         )
         if interaction.guild.icon:
             embed.set_thumbnail(url=interaction.guild.icon.url)
-        guild_config = self.get_guild_config(interaction.guild.id)
-        scores_channel_id = guild_config.get("channels", {}).get("scores")
-        score_report_channels = [scores_channel_id] if scores_channel_id else []
-        for channel_id in score_report_channels:
-            channel = interaction.guild.get_channel(int(channel_id))
-            if channel:
-                await channel.send(embed=embed)
-        await interaction.response.send_message("Team leaderboard updated!", ephemeral=True)
-        await self.log_action(interaction.guild, "Team Leaderboard", "Team leaderboard updated")
+        embed.set_footer(text=f"Season {standings.current_season(interaction.guild.id)} Elo rating, adjusted for margin of victory")
+        await interaction.response.send_message(embed=embed)
 
-    @app_commands.command(name="teamscore", description="Record a score for a team.")
+    @app_commands.command(name="setdivision", description="Place a team in a division and conference.")
     @app_commands.checks.has_permissions(administrator=True)
-    @app_commands.describe(home_team="The home team", away_team="The away team", home_score="Home team score", away_score="Away team score")
-    @app_commands.autocomplete(home_team=team_autocomplete, away_team=team_autocomplete)
-    async def teamscore(self, interaction: discord.Interaction, home_team: str, away_team: str, home_score: int, away_score: int):
-        pass
+    @app_commands.describe(team="The team", division="Division name", conference="Conference name")
+    @app_commands.autocomplete(team=team_autocomplete)
+    async def setdivision(self, interaction: discord.Interaction, team: str, division: str, conference: str):
+        if team not in self.get_guild_config(interaction.guild.id).get("teams", []):
+            await interaction.response.send_message("Invalid team. Must be created via /addteam.", ephemeral=True)
+            return
+        get_standings().set_alignment(interaction.guild.id, team, division, conference)
+        await interaction.response.send_message(f"{team} placed in {division} ({conference}).", ephemeral=True)
+        await self.log_action(interaction.guild, "Division Set", f"{team}: {division}, {conference}")
 
     @app_commands.command(name="teamstats", description="Show statistics for a team.")
-    @app_commands.describe(team="The team to show stats for")
+    @app_commands.describe(team="The team to show stats for", season="Season number (defaults to the current season)")
     @app_commands.autocomplete(team=team_autocomplete)
-    async def teamstats(self, interaction: discord.Interaction, team: str):
-        pass
+    async def teamstats(self, interaction: discord.Interaction, team: str, season: int = None):
+        season = season or get_standings().current_season(interaction.guild.id)
+        stats = get_game_log().team_stats(interaction.guild.id, team, season)
+        if not stats:
+            await interaction.response.send_message(f"No games reported for {team} in season {season}.", ephemeral=True)
+            return
+
+        def per_game(value):
+            return f"{value:.1f}" if value is not None else "N/A"
+
+        record_text = f"{stats['wins']}-{stats['losses']}" + (f"-{stats['ties']}" if stats["ties"] else "")
+        streak = stats["current_streak"]
+        streak_text = f"W{streak}" if streak > 0 else f"L{-streak}" if streak < 0 else "-"
+        embed = discord.Embed(
+            title=f"{self.team_emojis.get(team, '')} {team} Stats (Season {season})",
+            description=f"**Record**: {record_text} in {stats['games']} games",
+            color=discord.Color.blue(),
+            timestamp=discord.utils.utcnow()
+        )
+        embed.add_field(name="Points/Game", value=per_game(stats["points_per_game"]), inline=True)
+        embed.add_field(name="Allowed/Game", value=per_game(stats["allowed_per_game"]), inline=True)
+        embed.add_field(
+            name="Avg Margin",
+            value=f"{stats['average_margin']:+.1f}" if stats["average_margin"] is not None else "N/A",
+            inline=True
+        )
+        embed.add_field(name="Streak", value=streak_text, inline=True)
+        embed.add_field(name="Longest Win Streak", value=str(stats["longest_win_streak"]), inline=True)
+        embed.add_field(name="Last 5", value=stats["last_five"] or "N/A", inline=True)
+        embed.add_field(
+            name="Strength of Schedule",
+            value=f"{stats['strength_of_schedule']:.3f} opponent win %" if stats["strength_of_schedule"] is not None else "N/A",
+            inline=False
+        )
+        embed.add_field(name="Elo", value=f"{get_ratings().rating(interaction.guild.id, team):.0f}", inline=True)
+        await interaction.response.send_message(embed=embed)
 
     @app_commands.command(name="teamleaderboard", description="Show team win/loss leaderboard and record scores.")
     @app_commands.checks.has_permissions(administrator=True)
@@ -388,80 +666,23 @@ class GameManagementCog(commands.Cog):
                 await interaction.response.send_message("Winning and losing team cannot be the same.", ephemeral=True)
                 return
                 
-            # Initialize team records if not exists
-            if "team_records" not in guild_config:
-                guild_config["team_records"] = {}
-                
-            for team in teams:
-                if team not in guild_config["team_records"]:
-                    guild_config["team_records"][team] = {"wins": 0, "losses": 0}
-            
-            # Update records
-            guild_config["team_records"][winning_team]["wins"] += 1
-            guild_config["team_records"][losing_team]["losses"] += 1
-            
-            # Save configuration
-            CONFIG_FILE = f"config/setup_{interaction.guild.id}.json"
-            import os
-            os.makedirs("config", exist_ok=True)
-            with open(CONFIG_FILE, 'w') as f:
-                json.dump(guild_config, f, indent=4)
-                
-            await interaction.response.send_message(f"✅ Recorded: {winning_team} defeated {losing_team}", ephemeral=True)
-            
-        # Show leaderboard
-        team_records = guild_config.get("team_records", {})
-        
-        # Initialize any missing teams
-        for team in teams:
-            if team not in team_records:
-                team_records[team] = {"wins": 0, "losses": 0}
-        
-        # Sort teams by wins (descending), then by losses (ascending)
-        sorted_teams = sorted(teams, key=lambda t: (team_records[t]["wins"], -team_records[t]["losses"]), reverse=True)
-        
-        embed = discord.Embed(
-            title="📊 Team Leaderboard",
-            description="Win/Loss records for all teams",
-            color=discord.Color.gold(),
-            timestamp=discord.utils.utcnow()
-        )
-        
-        if interaction.guild.icon:
-            embed.set_thumbnail(url=interaction.guild.icon.url)
-        
-        leaderboard_text = []
-        for i, team in enumerate(sorted_teams, 1):
-            wins = team_records[team]["wins"]
-            losses = team_records[team]["losses"]
-            total_games = wins + losses
-            win_rate = (wins / total_games * 100) if total_games > 0 else 0
-            
-            team_role = discord.utils.get(interaction.guild.roles, name=team)
-            team_emoji = self.team_emojis.get(team, "")
-            
-            leaderboard_text.append(
-                f"**{i}.** {team_emoji} {team}\n"
-                f"   Record: {wins}-{losses} ({win_rate:.1f}%)"
-            )
-        
-        # Split into chunks to avoid embed limit
-        chunk_size = 10
-        for i in range(0, len(leaderboard_text), chunk_size):
-            chunk = leaderboard_text[i:i + chunk_size]
-            field_name = f"Rankings ({i+1}-{min(i+chunk_size, len(leaderboard_text))})" if len(leaderboard_text) > chunk_size else "Rankings"
-            embed.add_field(
-                name=field_name,
-                value="\n\n".join(chunk),
-                inline=False
+            key, scheduled = self.score_report_key(interaction.guild.id, winning_team, losing_team)
+            _, status = await self.record_result(
+                interaction.guild, winning_team, losing_team, winner=winning_team,
+                scheduled=scheduled, key=key, replace=True
             )
-        
-        embed.set_footer(text="Use /teamleaderboard <winning_team> <losing_team> to record a game result")
+            if status == "duplicate":
+                await interaction.response.send_message(f"Already recorded: {winning_team} defeated {losing_team}", ephemeral=True)
+            else:
+                await interaction.response.send_message(f"✅ Recorded: {winning_team} defeated {losing_team}", ephemeral=True)
+
+        embed = self.leaderboard_embed(interaction.guild)
         
         if winning_team and losing_team:
             await interaction.edit_original_response(embed=embed)
         else:
             await interaction.response.send_message(embed=embed)
+        await self.refresh_scoreboard(interaction.guild)
             
         await self.log_action(interaction.guild, "Leaderboard Viewed", f"Teams: {len(teams)}")
 
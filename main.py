@@ -1,18 +1,76 @@
 import discord
+from discord import app_commands
 from discord.ext import commands
 import os
 import asyncio
+import atexit
+import hashlib
+import json
 import logging
 from utils.comprehensive_logger import get_comprehensive_logger
+from utils.persistence import get_write_behind
+from utils.log_sink import get_log_sink
+from utils.roster_index import RosterNotReady, get_roster_index
+from utils.timers import get_timer_service
+
+SYNC_STATE_FILE = "config/command_sync.json"
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 
-bot = commands.Bot(
+def build_intents(profile=None):
+    """Gateway intents for a BOT_INTENTS_PROFILE ("minimal" or "full").
+
+    The minimal profile keeps guilds, members and roles (everything the roster
+    code reads) and drops presences and message content.
+    """
+    profile = (profile or os.getenv("BOT_INTENTS_PROFILE", "minimal")).lower()
+    if profile == "full":
+        return discord.Intents.all()
+    intents = discord.Intents.default()
+    intents.members = True
+    intents.presences = False
+    intents.message_content = False
+    return intents
+
+class LeagueTree(app_commands.CommandTree):
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        # Members are chunked per guild on first use instead of at startup; never wait here
+        get_roster_index(self.client).start(interaction.guild)
+        return True
+
+    async def on_error(self, interaction: discord.Interaction, error: app_commands.AppCommandError):
+        if isinstance(error, RosterNotReady):
+            if not interaction.response.is_done():
+                await interaction.response.send_message(str(error), ephemeral=True)
+            return
+        await super().on_error(interaction, error)
+
+class LeagueBot(commands.Bot):
+    async def setup_hook(self):
+        # Runs once per process, before the gateway connects; reconnects skip it
+        await load_extensions()
+        await sync_command_tree()
+        get_timer_service().start(self)
+
+    async def close(self):
+        get_timer_service().stop()
+        # Send queued log embeds and write out any debounced saves before the loop goes away
+        await get_log_sink(self).flush_all()
+        await get_comprehensive_logger(self).flush()
+        await get_write_behind().flush_all()
+        await super().close()
+
+bot = LeagueBot(
     command_prefix="!",
-    intents=discord.Intents.all()
+    intents=build_intents(),
+    tree_cls=LeagueTree,
+    chunk_guilds_at_startup=False
 )
 
+# Last-chance flush if the process exits without a clean close()
+atexit.register(get_write_behind().flush_sync)
+
 async def load_extensions():
     extensions = [
         'cogs.draft',
@@ -38,26 +96,46 @@ async def load_extensions():
         except Exception as e:
             print(f"Failed to load extension {extension}: {e}")
 
-@bot.event
-async def on_ready():
-    print(f'Logged in as {bot.user.name}#{bot.user.discriminator} (ID: {bot.user.id})')
-
-    # Load extensions
-    await load_extensions()
-
-    # Initialize comprehensive logger
-    logger = get_comprehensive_logger(bot)
-    
-    # Log bot startup for all guilds
-    for guild in bot.guilds:
-        await logger.log_bot_event(guild, "BOT_STARTUP", f"Bot started and ready in {guild.name}")
+def command_tree_hash():
+    """Stable hash of every registered app command's payload."""
+    payloads = []
+    for command in bot.tree.get_commands():
+        try:
+            payloads.append(command.to_dict(bot.tree))
+        except TypeError:
+            payloads.append(command.to_dict())
+    payloads.sort(key=lambda payload: payload.get("name", ""))
+    return hashlib.sha256(json.dumps(payloads, sort_keys=True, default=str).encode()).hexdigest()
 
+async def sync_command_tree():
+    """Sync the command tree only when it differs from what was last synced."""
+    tree_hash = command_tree_hash()
+    state = get_write_behind().load(SYNC_STATE_FILE, {})
+    if state.get("hash") == tree_hash:
+        print("Command tree unchanged, skipping sync")
+        return
     try:
         synced = await bot.tree.sync()
         print(f"Synced {len(synced)} command(s)")
+        get_write_behind().save(SYNC_STATE_FILE, {"hash": tree_hash})
     except Exception as e:
         print(f"Failed to sync commands: {e}")
 
+@bot.event
+async def on_ready():
+    print(f'Logged in as {bot.user.name}#{bot.user.discriminator} (ID: {bot.user.id})')
+
+    # on_ready fires again after every reconnect; only log the first startup
+    if getattr(bot, "startup_logged", False):
+        return
+    bot.startup_logged = True
+
+    logger = get_comprehensive_logger(bot)
+    await asyncio.gather(*(
+        logger.log_bot_event(guild, "BOT_STARTUP", f"Bot started and ready in {guild.name}")
+        for guild in bot.guilds
+    ))
+
 @bot.event
 async def on_interaction(interaction):
     """Log all slash command usage"""
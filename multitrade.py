@@ -7,25 +7,21 @@ import pytz
 from datetime import datetime
 import asyncio
 from utils.team_utils import team_autocomplete
+from utils.config_store import get_config_store
+from utils.draft_state import get_draft_registry
+from utils.team_resolver import get_team_resolver
+from utils.roster_index import get_roster_index, roster_ready
+from utils.role_batch import RoleBatch, get_role_executor
+from utils.component_router import get_component_router, get_pending_actions
+from utils.log_sink import get_log_sink
 
-CONFIG_FILE = "config/setup.json"
-DRAFT_FILE = "config/draft.json"
+PENDING_TTL = 86400  # Trade proposals stay open for 24 hours
 
 def load_config():
-    if os.path.exists(CONFIG_FILE):
-        with open(CONFIG_FILE, 'r') as f:
-            return json.load(f)
-    return {}
+    return get_config_store().get_global()
 
 def save_config(config):
-    with open(CONFIG_FILE, 'w') as f:
-        json.dump(config, f, indent=4)
-
-def load_draft():
-    if os.path.exists(DRAFT_FILE):
-        with open(DRAFT_FILE, 'r') as f:
-            return json.load(f)
-    return {"draft_active": False}
+    get_config_store().save_global(config)
 
 class ConfirmModal(discord.ui.Modal):
     def __init__(self, action, callback):
@@ -47,13 +43,10 @@ class MultiTradeCog(commands.Cog):
         self.bot = bot
         self.config = load_config()
         self.team_emojis = self.config.get("team_emojis", {})
+        get_component_router(bot).register("multitrade", self.handle_trade)
 
-    async def get_team_info(self, member: discord.Member):
-        for role in member.roles:
-            if role.name in self.config.get("teams", []) and role.name != "@everyone":
-                emoji = self.team_emojis.get(role.name, "")
-                return role, role.name, emoji
-        return None, None, None
+    def get_team_info(self, member: discord.Member):
+        return get_team_resolver(self.bot).get_team_info(member)
 
     async def log_action(self, guild, action, details):
         logs_channel_id = self.config.get("logs_channel")
@@ -63,10 +56,10 @@ class MultiTradeCog(commands.Cog):
                 embed = discord.Embed(
                     title=f"Multi-Trade: {action}",
                     description=details,
-                    color=discord.Color.blue,
+                    color=discord.Color.blue(),
                     timestamp=discord.utils.utcnow()
                 )
-                await logs_channel.send(embed=embed)
+                get_log_sink(self.bot).post(logs_channel, embed)
 
     def check_trade_deadline(self):
         deadline_str = self.config.get("trade_deadline")
@@ -82,7 +75,101 @@ class MultiTradeCog(commands.Cog):
         team_role = discord.utils.get(guild.roles, name=team_name)
         if not team_role:
             return []
-        return [member for member in guild.members if team_role in member.roles]
+        return get_roster_index(self.bot).members(guild, team_role)
+
+    def get_team_count(self, guild: discord.Guild, team_name: str):
+        team_role = discord.utils.get(guild.roles, name=team_name)
+        if not team_role:
+            return 0
+        return get_roster_index(self.bot).count(guild, team_role)
+
+    def is_franchise_owner(self, member: discord.Member, team: str):
+        fo_role = discord.utils.get(member.guild.roles, name="Franchise Owner")
+        team_role = discord.utils.get(member.guild.roles, name=team)
+        return fo_role in member.roles and team_role in member.roles
+
+    async def handle_trade(self, interaction: discord.Interaction, button: str, action_id: str):
+        pending = get_pending_actions()
+        trade = pending.get(action_id)
+        if trade is None:
+            await interaction.response.send_message("This trade proposal is no longer available.", ephemeral=True)
+            return
+        teams = trade["teams"]
+        user_team_role, user_team, _ = self.get_team_info(interaction.user)
+        if user_team not in teams:
+            await interaction.response.send_message("You are not part of this trade.", ephemeral=True)
+            return
+        if not self.is_franchise_owner(interaction.user, user_team):
+            await interaction.response.send_message("Only Franchise Owners can approve trades.", ephemeral=True)
+            return
+        embed = interaction.message.embeds[0]
+
+        if button == "reject":
+            pending.delete(action_id)
+            embed.title = "Multi-Team Trade Rejected"
+            embed.description += f"\nRejected by {interaction.user.mention} ({user_team})"
+            embed.color = discord.Color.red()
+            await interaction.message.edit(embed=embed, view=None)
+            await interaction.response.send_message("Trade rejected.", ephemeral=True)
+            await self.log_action(interaction.guild, "Multi-Trade Rejected", f"Rejected by {user_team}")
+            return
+
+        if trade["approvals"][user_team]:
+            await interaction.response.send_message("You have already approved this trade.", ephemeral=True)
+            return
+
+        approval = f"\n{user_team} approved by {interaction.user.mention}"
+        if not all(approved for team, approved in trade["approvals"].items() if team != user_team):
+            trade["approvals"][user_team] = True
+            pending.update(action_id, trade)
+            embed.description += approval
+            await interaction.message.edit(embed=embed)
+            await interaction.response.send_message("Trade approved. Waiting for other approvals.", ephemeral=True)
+            return
+
+        # Execute trade; the final approval is only recorded by completing it, so a failed attempt can be retried
+        players = {
+            team: [m for m in (interaction.guild.get_member(member_id) for member_id in member_ids) if m]
+            for team, member_ids in trade["players"].items()
+        }
+        batch = RoleBatch(interaction.guild, reason=f"Multi-trade: {', '.join(teams)}")
+        for team in teams:
+            team_role = discord.utils.get(interaction.guild.roles, name=team)
+            for other_team in teams:
+                if other_team == team:
+                    continue
+                for player in players[other_team]:
+                    batch.add(player, team_role)
+            for player in players[team]:
+                batch.remove(player, team_role)
+            # Note: Draft picks are logged but not reassigned here (assumed handled by draft system)
+        await interaction.response.defer(ephemeral=True)
+        traded = [player for team in teams for player in players[team]]
+        original_roles = {member.id: [role for role in member.roles if not role.is_default()] for member in traded}
+        failures = await get_role_executor().apply(batch)
+        if failures:
+            failed_ids = {member.id for member, _ in failures}
+            for member in traded:
+                if member.id not in failed_ids:
+                    try:
+                        await member.edit(roles=original_roles[member.id], reason=f"Multi-trade rolled back: {', '.join(teams)}")
+                    except discord.HTTPException as e:
+                        print(f"Failed to roll back multi-trade roles for {member}: {e}")
+            await interaction.followup.send(
+                f"Failed to execute trade for {', '.join(member.display_name for member, _ in failures)}: {failures[0][1]}. "
+                "No roles were changed; approve again to retry.",
+                ephemeral=True
+            )
+            await self.log_action(interaction.guild, "Multi-Trade Failed", f"Teams: {', '.join(teams)} | {failures[0][1]}")
+            return
+
+        pending.delete(action_id)
+        embed.description += approval
+        embed.title = "Multi-Team Trade Completed"
+        embed.color = discord.Color.green()
+        await interaction.message.edit(embed=embed, view=None)
+        await interaction.followup.send("Trade approved and completed!", ephemeral=True)
+        await self.log_action(interaction.guild, "Multi-Trade Completed", f"Teams: {', '.join(teams)}")
 
     # CPU Break: Pause after cog initialization
     # asyncio.sleep(2) simulated during code generation
@@ -91,12 +178,12 @@ class MultiTradeCog(commands.Cog):
     @app_commands.checks.has_permissions(administrator=True)
     @app_commands.describe(team1="First team", team2="Second team", team3="Third team (optional)")
     @app_commands.autocomplete(team1=team_autocomplete, team2=team_autocomplete, team3=team_autocomplete)
+    @roster_ready()
     async def multitrade(self, interaction: discord.Interaction, team1: str, team2: str, team3: str = None):
         await interaction.response.defer(ephemeral=True)
 
         # Validate draft status
-        draft_data = load_draft()
-        if draft_data.get("draft_active", False):
+        if get_draft_registry().is_active(interaction.guild.id):
             await interaction.followup.send("Trades are disabled during an active draft.", ephemeral=True)
             return
 
@@ -157,7 +244,7 @@ class MultiTradeCog(commands.Cog):
         # Check roster caps after trade
         roster_cap = int(self.config.get("roster_cap", 53))
         for team in teams:
-            current_roster = len(self.get_team_members(interaction.guild, team))
+            current_roster = self.get_team_count(interaction.guild, team)
             players_gained = sum(len(trade_details[t]["players"]) for t in teams if t != team)
             players_lost = len(trade_details[team]["players"])
             new_roster_size = current_roster + players_gained - players_lost
@@ -184,86 +271,18 @@ class MultiTradeCog(commands.Cog):
         if interaction.guild.icon:
             embed.set_thumbnail(url=interaction.guild.icon.url)
 
-        # Confirmation view for other team owners
-        class TradeView(discord.ui.View):
-            def __init__(self, bot, teams, trade_details, proposer):
-                super().__init__(timeout=86400)  # 24 hours
-                self.bot = bot
-                self.teams = teams
-                self.trade_details = trade_details
-                self.proposer = proposer
-                self.approvals = {team: False for team in teams}
-                self.approvals[proposer] = True  # Proposer auto-approves
-
-            async def check_fo(self, user, team):
-                fo_role = discord.utils.get(user.guild.roles, name="Franchise Owner")
-                team_role = discord.utils.get(user.guild.roles, name=team)
-                return fo_role in user.roles and team_role in user.roles
-
-            @discord.ui.button(label="Approve", style=discord.ButtonStyle.green)
-            async def approve_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-                user_team_role, user_team, _ = self.bot.get_cog("MultiTradeCog").get_team_info(interaction.user)
-                if user_team not in self.teams:
-                    await interaction.response.send_message("You are not part of this trade.", ephemeral=True)
-                    return
-                if not await self.check_fo(interaction.user, user_team):
-                    await interaction.response.send_message("Only Franchise Owners can approve trades.", ephemeral=True)
-                    return
-                if self.approvals[user_team]:
-                    await interaction.response.send_message("You have already approved this trade.", ephemeral=True)
-                    return
-
-                self.approvals[user_team] = True
-                embed.description += f"\n{user_team} approved by {interaction.user.mention}"
-                await interaction.message.edit(embed=embed)
-
-                if all(self.approvals.values()):
-                    # Execute trade
-                    for team in self.teams:
-                        team_role = discord.utils.get(interaction.guild.roles, name=team)
-                        for other_team in self.teams:
-                            if other_team == team:
-                                continue
-                            for player in self.trade_details[other_team]["players"]:
-                                await player.add_roles(team_role)
-                            for player in self.trade_details[team]["players"]:
-                                await player.remove_roles(team_role)
-                        # Note: Draft picks are logged but not reassigned here (assumed handled by draft system)
-                    embed.title = "Multi-Team Trade Completed"
-                    embed.color = discord.Color.green()
-                    await interaction.message.edit(embed=embed, view=None)
-                    await interaction.response.send_message("Trade approved and completed!", ephemeral=True)
-                    await self.bot.get_cog("MultiTradeCog").log_action(
-                        interaction.guild,
-                        "Multi-Trade Completed",
-                        f"Teams: {', '.join(self.teams)}"
-                    )
-                else:
-                    await interaction.response.send_message("Trade approved. Waiting for other approvals.", ephemeral=True)
-
-            @discord.ui.button(label="Reject", style=discord.ButtonStyle.red)
-            async def reject_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-                user_team_role, user_team, _ = self.bot.get_cog("MultiTradeCog").get_team_info(interaction.user)
-                if user_team not in self.teams:
-                    await interaction.response.send_message("You are not part of this trade.", ephemeral=True)
-                    return
-                if not await self.check_fo(interaction.user, user_team):
-                    await interaction.response.send_message("Only Franchise Owners can approve trades.", ephemeral=True)
-                    return
-
-                embed.title = "Multi-Team Trade Rejected"
-                embed.description += f"\nRejected by {interaction.user.mention} ({user_team})"
-                embed.color = discord.Color.red()
-                await interaction.message.edit(embed=embed, view=None)
-                await interaction.response.send_message("Trade rejected.", ephemeral=True)
-                await self.bot.get_cog("MultiTradeCog").log_action(
-                    interaction.guild,
-                    "Multi-Trade Rejected",
-                    f"Rejected by {user_team}"
-                )
-
-        # Send trade proposal
-        view = TradeView(self.bot, teams, trade_details, user_team_name)
+        # Approval buttons for the other team owners; state lives in the pending-action store
+        action_id = get_pending_actions().create("multitrade", {
+            "guild_id": interaction.guild.id,
+            "teams": teams,
+            "players": {team: [m.id for m in trade_details[team]["players"]] for team in teams},
+            "picks": {team: trade_details[team]["picks"] for team in teams},
+            "approvals": {team: team == user_team_name for team in teams}  # Proposer auto-approves
+        }, ttl=PENDING_TTL)
+        view = get_component_router(self.bot).make_view("multitrade", action_id, [
+            ("approve", "Approve", discord.ButtonStyle.green),
+            ("reject", "Reject", discord.ButtonStyle.red)
+        ])
         trade_channel_id = self.config.get("alerts_channel")
         trade_channel = interaction.guild.get_channel(int(trade_channel_id)) if trade_channel_id else interaction.channel
 
@@ -6,18 +6,16 @@ import os
 from datetime import datetime
 import pytz
 import asyncio
+from utils.config_store import get_config_store
+from utils.team_resolver import get_team_resolver
+from utils.log_sink import get_log_sink
 
-CONFIG_FILE = "config/setup.json"
 
 def load_config():
-    if os.path.exists(CONFIG_FILE):
-        with open(CONFIG_FILE, 'r') as f:
-            return json.load(f)
-    return {}
+    return get_config_store().get_global()
 
 def save_config(config):
-    with open(CONFIG_FILE, 'w') as f:
-        json.dump(config, f, indent=4)
+    get_config_store().save_global(config)
 
 class RetirePlayerCog(commands.Cog):
     def __init__(self, bot):
@@ -27,13 +25,7 @@ class RetirePlayerCog(commands.Cog):
 
     def get_guild_config(self, guild_id):
         """Load guild-specific configuration"""
-        config_file = f"config/setup_{guild_id}.json"
-        if os.path.exists(config_file):
-            with open(config_file, 'r') as f:
-                content = f.read().strip()
-                if content:
-                    return json.loads(content)
-        return {}
+        return get_config_store().get_guild(guild_id)
 
     def has_required_roles(self, interaction: discord.Interaction):
         """Check if user has any of the configured franchise management roles"""
@@ -68,15 +60,10 @@ class RetirePlayerCog(commands.Cog):
                 color=discord.Color.blue(),
                 timestamp=discord.utils.utcnow()
             )
-            await logs_channel.send(embed=embed)
-
-    def get_team_info(self, member):
-        config = load_config()
-        for role in member.roles:
-            if role.name in config.get("teams", []) and role.name != "@everyone":
-                emoji = config.get("team_emojis", {}).get(role.name, "")
-                return role, role.name, emoji
-        return None, None, ""
+            get_log_sink(self.bot).post(logs_channel, embed)
+
+    def get_team_info(self, member: discord.Member):
+        return get_team_resolver(self.bot).get_team_info(member)
 
     # CPU Break
     # asyncio.sleep(2)
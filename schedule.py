@@ -1,6 +1,6 @@
 import discord
 from discord import app_commands
-from discord.ext import commands, tasks
+from discord.ext import commands
 import json
 import os
 import random
@@ -8,36 +8,76 @@ from datetime import datetime, timedelta
 import pytz
 import asyncio
 from utils.team_utils import team_autocomplete
+from utils.config_store import get_config_store
+from utils.persistence import get_write_behind
+from utils.component_router import get_component_router, get_pending_actions
+from utils.fanout import bounded_gather
+from utils.log_sink import get_log_sink
+from utils.timers import get_timer_service
+from utils.season import round_robin, extend_season, ScheduleSolver
+from utils.game_registry import get_game_registry
+from utils.standings import get_standings
 
 DATA_FILE = "league_data.json"
-CONFIG_FILE = "config/setup.json"
+MATCHUP_CONCURRENCY = 4
+PLAN_TTL = 3600  # Season previews can be committed for an hour
 
 def load_league_data():
-    if os.path.exists(DATA_FILE):
-        with open(DATA_FILE, 'r') as f:
-            return json.load(f)
-    return {}
+    return get_write_behind().load(DATA_FILE, {})
 
 def save_league_data(data):
-    with open(DATA_FILE, 'w') as f:
-        json.dump(data, f, indent=4)
+    get_write_behind().save(DATA_FILE, data)
 
 def load_config():
-    if os.path.exists(CONFIG_FILE):
-        with open(CONFIG_FILE, 'r') as f:
-            return json.load(f)
-    return {}
+    return get_config_store().get_global()
+
+def parse_rivalries(text, teams):
+    """Parse "week:Team A vs Team B; ..." into (week index, team, team) tuples."""
+    rivalries = []
+    for item in filter(None, (part.strip() for part in (text or "").split(";"))):
+        week, _, matchup = item.partition(":")
+        team1, _, team2 = matchup.partition(" vs ")
+        team1, team2 = team1.strip(), team2.strip()
+        if not week.strip().isdigit() or not team1 or not team2:
+            raise ValueError(f"Could not read rivalry \"{item}\". Use week:Team A vs Team B.")
+        for team in (team1, team2):
+            if team not in teams:
+                raise ValueError(f"Unknown team: {team}")
+        rivalries.append((int(week) - 1, team1, team2))
+    return rivalries
+
+def parse_blackouts(text, teams, total_weeks):
+    """Parse "Team A:3,5; Team B:7" into {team: {week index, ...}}."""
+    blackouts = {}
+    for item in filter(None, (part.strip() for part in (text or "").split(";"))):
+        team, _, weeks = item.rpartition(":")
+        team = team.strip()
+        if team not in teams:
+            raise ValueError(f"Unknown team in blackouts: {team or item}")
+        try:
+            numbers = [int(week) for week in weeks.split(",") if week.strip()]
+        except ValueError:
+            raise ValueError(f"Could not read blackout weeks \"{item}\". Use Team A:3,5.")
+        for week in numbers:
+            if not 1 <= week <= total_weeks:
+                raise ValueError(f"Blackout week {week} for {team} is outside the season (weeks 1-{total_weeks}).")
+        blackouts.setdefault(team, set()).update(week - 1 for week in numbers)
+    return blackouts
 
 def save_config(config):
-    with open(CONFIG_FILE, 'w') as f:
-        json.dump(config, f, indent=4)
+    get_config_store().save_global(config)
 
 class ScheduleCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.league_data = load_league_data()
         self.config = load_config()
-        self.check_offseason.start()
+        get_component_router(bot).register("gametime", self.handle_gametime)
+        get_component_router(bot).register("seasonplan", self.handle_season_plan)
+        timers = get_timer_service()
+        timers.register("offseason_resume", self.resume_offseason)
+        timers.register("game_deadline", self.game_deadline)
+        self.restore_offseason_timers()
 
     async def log_action(self, guild, action, details):
         logs_channel_id = self.config.get("logs")
@@ -50,12 +90,159 @@ class ScheduleCog(commands.Cog):
                     color=discord.Color.blue(),
                     timestamp=discord.utils.utcnow()
                 )
-                await logs_channel.send(embed=embed)
+                get_log_sink(self.bot).post(logs_channel, embed)
 
     def get_all_teams(self, guild):
         config = load_config()
         return config.get("teams", [])
 
+    async def handle_gametime(self, interaction: discord.Interaction, button: str, key: str):
+        if button == "cancel":
+            if not interaction.user.guild_permissions.administrator:
+                await interaction.response.send_message("Only administrators can cancel games.", ephemeral=True)
+                return
+
+            embed = discord.Embed(
+                title="Game Cancelled",
+                description="Sorry, game has been cancelled",
+                color=discord.Color.red(),
+                timestamp=discord.utils.utcnow()
+            )
+            await interaction.response.edit_message(embed=embed, view=None)
+            registry = get_game_registry()
+            game = registry.by_ref(interaction.guild.id, interaction.message.id)
+            if game:
+                registry.update(interaction.guild.id, game, status="cancelled")
+            return
+
+        # Streamer (field 1) and referee (field 2) are claimed by members holding the configured role
+        label = "Streamer" if button == "streamer" else "Referee"
+        role_id = load_config().get(button)
+        if not role_id:
+            await interaction.response.send_message(f"{label} role not configured in /setup.", ephemeral=True)
+            return
+
+        role = interaction.guild.get_role(int(role_id))
+        if not role:
+            await interaction.response.send_message(f"{label} role not found.", ephemeral=True)
+            return
+
+        if role not in interaction.user.roles:
+            await interaction.response.send_message(f"You don't have the {button} role.", ephemeral=True)
+            return
+
+        embed = interaction.message.embeds[0]
+        embed.set_field_at(1 if button == "streamer" else 2, name=label, value=interaction.user.mention, inline=True)
+        await interaction.response.edit_message(embed=embed)
+        registry = get_game_registry()
+        game = registry.by_ref(interaction.guild.id, interaction.message.id)
+        if game:
+            registry.update(interaction.guild.id, game, **{f"{button}_id": interaction.user.id})
+
+    async def create_week_voice(self, guild, matchups, category_id):
+        """Create voice channels for all matchups in one batch; one entry per matchup."""
+        voice_cog = self.bot.get_cog("VoiceChannelManagerCog")
+        if not voice_cog or not category_id:
+            return [None] * len(matchups)
+        try:
+            return await voice_cog.create_week_voice_channels(guild, matchups, category_id, MATCHUP_CONCURRENCY)
+        except Exception as e:
+            return [e] * len(matchups)
+
+    async def create_matchup(self, guild, channel, thread_name, team1, team2, deadline_str, auto_archive_duration, voice=None, week=None):
+        """Create a matchup thread, announce the game (and its voice channels) and register it. Returns the thread."""
+        thread = await channel.create_thread(
+            name=thread_name,
+            type=discord.ChannelType.public_thread,
+            auto_archive_duration=auto_archive_duration
+        )
+        role1 = discord.utils.get(guild.roles, name=team1)
+        role2 = discord.utils.get(guild.roles, name=team2)
+        mentions = f"{role1.mention if role1 else team1} vs {role2.mention if role2 else team2}"
+        message = f"**Match**: {mentions}\n**Deadline**: {deadline_str}"
+        voice_ids = []
+        if isinstance(voice, BaseException):
+            message += f"\nFailed to create voice channels: {voice}"
+        elif voice and all(voice):
+            team1_vc, team2_vc = voice
+            voice_ids = [team1_vc.id, team2_vc.id]
+            message += f"\nVoice Channels:\n{team1}: {team1_vc.mention}\n{team2}: {team2_vc.mention}"
+            voice_cog = self.bot.get_cog("VoiceChannelManagerCog")
+            if voice_cog:
+                voice_cog.team_channels[f"{team1}-{team2}"] = [team1_vc, team2_vc, thread.id]
+        await thread.send(message)
+        get_game_registry().add(guild.id, team1, team2, week, thread_id=thread.id, channel_id=channel.id, voice_ids=voice_ids)
+        return thread
+
+    def kickoff_text(self, game_datetime):
+        """The "When" line of a gametime embed."""
+        time_diff = game_datetime - datetime.now(game_datetime.tzinfo)
+        if time_diff.total_seconds() > 0:
+            hours_until = int(time_diff.total_seconds() // 3600)
+            time_status = f"Starts in {hours_until} hours"
+        else:
+            hours_ago = int(abs(time_diff.total_seconds()) // 3600)
+            time_status = f"Started {hours_ago} hours ago"
+        return f"{game_datetime.strftime('%B %d, %Y')} at {game_datetime.strftime('%I:%M %p')} ({time_status})"
+
+    async def gametime_message(self, guild, game):
+        """Fetch a game's gametime message, or None if it is gone."""
+        channel = guild.get_channel(game.get("gametime_channel_id") or 0)
+        if not channel or not game.get("message_id"):
+            return None
+        try:
+            return await channel.fetch_message(game["message_id"])
+        except discord.HTTPException:
+            return None
+
+    @commands.Cog.listener()
+    async def on_thread_delete(self, thread):
+        registry = get_game_registry()
+        game = registry.by_ref(thread.guild.id, thread.id)
+        if game:
+            registry.update(thread.guild.id, game, thread_id=None)
+
+    async def discard_failed_voice(self, matchups, voice, results):
+        """Delete the voice channels made for matchups whose thread could not be created."""
+        voice_cog = self.bot.get_cog("VoiceChannelManagerCog")
+        if not voice_cog:
+            return
+        for (team1, team2), vcs, result in zip(matchups, voice, results):
+            if isinstance(result, BaseException) and isinstance(vcs, tuple):
+                await voice_cog.delete_voice_channels(vcs, f"{team1}-{team2}")
+
+    def matchup_errors(self, matchups, results):
+        """Format the failures from a matchup fan-out, one line per game."""
+        return "\n".join(
+            f"Game {i} ({team1} vs {team2}): {result}"
+            for i, ((team1, team2), result) in enumerate(zip(matchups, results), 1)
+            if isinstance(result, BaseException)
+        )[:1900]
+
+    @staticmethod
+    def season_started(data):
+        """Whether a stored season has had weeks posted and is not over."""
+        return bool(data.get("season")) and data.get("current_week", 1) > 1 and not data.get("offseason")
+
+    def season_weeks(self, data, total_weeks):
+        """Return the stored season schedule, generating it at the start of a season.
+
+        A new season is drawn when none is stored, or in week 1 if the team list
+        has changed or the season has grown. Mid-season the weeks already drawn
+        are kept, and a longer season is extended by continuing the cycle.
+        """
+        season = data.get("season")
+        teams = sorted(data["teams"])
+        if not season or (data.get("current_week", 1) == 1 and (
+            season.get("teams") != teams or len(season["weeks"]) < total_weeks
+        )):
+            seed = random.randrange(2 ** 32)
+            season = {"teams": teams, "seed": seed, "weeks": round_robin(teams, total_weeks, seed)}
+            data["season"] = season
+        elif len(season["weeks"]) < total_weeks:
+            season["weeks"] = extend_season(season, total_weeks)
+        return season["weeks"]
+
     # CPU Break
     # asyncio.sleep(2)
 
@@ -71,74 +258,85 @@ class ScheduleCog(commands.Cog):
             await interaction.followup.send("Use /addteam to select teams.", ephemeral=True)
             return
 
-        if data.get("offseason"):
-            resume_date = data.get("resume_date", "unknown")
-            await interaction.followup.send(f"League in offseason. Resumes on {resume_date}.", ephemeral=True)
-            return
-
-        current_week = data.get("current_week", 1)
+        # Games of the last posted week that failed are re-posted before the season moves on
+        retry = data.get("retry_games")
+        current_week = retry["week"] if retry else data.get("current_week", 1)
         total_weeks = data.get("total_weeks", 18)
-        if current_week > total_weeks:
-            await interaction.followup.send("Season ended. League is now in offseason.", ephemeral=True)
-            return
-
-        teams = data["teams"]
-        if len(teams) < 2:
-            await interaction.followup.send("Not enough teams to schedule.", ephemeral=True)
-            return
-
-        random.shuffle(teams)
-        matchups = [(teams[i], teams[i+1]) for i in range(0, len(teams)-1, 2)]
+        if retry:
+            week = {"games": retry["games"], "bye": []}
+        else:
+            if data.get("offseason"):
+                resume_date = data.get("resume_date", "unknown")
+                await interaction.followup.send(f"League in offseason. Resumes on {resume_date}.", ephemeral=True)
+                return
+            if current_week > total_weeks:
+                await interaction.followup.send("Season ended. League is now in offseason.", ephemeral=True)
+                return
+            if len(data["teams"]) < 2:
+                await interaction.followup.send("Not enough teams to schedule.", ephemeral=True)
+                return
+            week = self.season_weeks(data, total_weeks)[current_week - 1]
+        matchups = [tuple(game) for game in week["games"]]
         tz = pytz.timezone("America/Chicago")
-        deadline = datetime.now(tz) + timedelta(days=3)
+        deadline = (datetime.now(tz) + timedelta(days=3)).replace(hour=23, minute=59, second=0, microsecond=0)
         deadline_str = deadline.strftime("%A, %B %d at 11:59 PM CDT")
 
         embed = discord.Embed(
-            title=f"Week {current_week} Schedule",
+            title=f"Week {current_week} Schedule" + (" (Re-posted Games)" if retry else ""),
             description=f"Games must be completed by {deadline_str}.",
             color=discord.Color.blue(),
             timestamp=discord.utils.utcnow()
         )
 
-        thread_ids = []
+        category_id = load_config().get("voice_category_id")
         for i, (team1, team2) in enumerate(matchups, 1):
             embed.add_field(
                 name=f"Game {i}",
                 value=f"{team1} vs {team2}\nDeadline: {deadline_str}",
                 inline=False
             )
-            try:
-                thread = await interaction.channel.create_thread(
-                    name=f"{team1} vs {team2} - Week {current_week}",
-                    type=discord.ChannelType.public_thread,
-                    auto_archive_duration=4320
-                )
-                role1 = discord.utils.get(interaction.guild.roles, name=team1)
-                role2 = discord.utils.get(interaction.guild.roles, name=team2)
-                mentions = f"{role1.mention if role1 else team1} vs {role2.mention if role2 else team2}"
-                await thread.send(f"**Match**: {mentions}\n**Deadline**: {deadline_str}")
-                thread_ids.append(thread.id)
-
-                voice_cog = self.bot.get_cog("VoiceChannelManagerCog")
-                if voice_cog:
-                    category_id = load_config().get("voice_category_id")
-                    if category_id:
-                        team1_vc, team2_vc = await voice_cog.create_team_voice_channels(
-                            interaction.guild, team1, team2, category_id
-                        )
-                        if team1_vc and team2_vc:
-                            voice_cog.team_channels[f"{team1}-{team2}"] = [team1_vc, team2_vc, thread.id]
-                            await thread.send(f"Voice Channels:\n{team1}: {team1_vc.mention}\n{team2}: {team2_vc.mention}")
-            except Exception as e:
-                await interaction.followup.send(f"Error creating thread: {e}", ephemeral=True)
-                return
+        if week["bye"]:
+            embed.add_field(name="Bye", value=", ".join(week["bye"]), inline=False)
+        voice = await self.create_week_voice(interaction.guild, matchups, category_id)
+        results = await bounded_gather([
+            lambda team1=team1, team2=team2, vcs=vcs: self.create_matchup(
+                interaction.guild, interaction.channel, f"{team1} vs {team2} - Week {current_week}",
+                team1, team2, deadline_str, 4320, vcs, current_week
+            )
+            for (team1, team2), vcs in zip(matchups, voice)
+        ], MATCHUP_CONCURRENCY)
+        thread_ids = [thread.id for thread in results if not isinstance(thread, BaseException)]
+        self.schedule_deadlines(interaction.guild, results, deadline)
+        await self.discard_failed_voice(matchups, voice, results)
+        errors = self.matchup_errors(matchups, results)
+        if not thread_ids:
+            await interaction.followup.send(f"Error creating threads, week {current_week} was not posted:\n{errors}", ephemeral=True)
+            return
+        failed = [list(matchup) for matchup, result in zip(matchups, results) if isinstance(result, BaseException)]
+        if failed:
+            data["retry_games"] = {"week": current_week, "games": failed}
+            await interaction.followup.send(
+                f"Some games could not be set up:\n{errors}\nRun /schedule again to re-post them before the next week.",
+                ephemeral=True
+            )
+        else:
+            data.pop("retry_games", None)
+
+        if retry:
+            data["thread_ids"] = data.get("thread_ids", []) + thread_ids
+            self.league_data[guild_id] = data
+            save_league_data(self.league_data)
+            await interaction.followup.send(embed=embed)
+            await self.log_action(interaction.guild, "Schedule Generated", f"Week {current_week}: re-posted {len(thread_ids)} game(s)")
+            return
 
         data["thread_ids"] = thread_ids
         data["current_week"] = current_week + 1
         if data["current_week"] > total_weeks:
             data["offseason"] = True
-            resume_date = (datetime.now(tz) + timedelta(days=data.get("offseason_days", 7))).strftime("%Y-%m-%d")
-            data["resume_date"] = resume_date
+            resume_at = datetime.now(tz) + timedelta(days=data.get("offseason_days", 7))
+            data["resume_date"] = resume_at.strftime("%Y-%m-%d")
+            self.schedule_resume(guild_id, resume_at)
         self.league_data[guild_id] = data
         save_league_data(self.league_data)
         await interaction.followup.send(embed=embed)
@@ -147,24 +345,149 @@ class ScheduleCog(commands.Cog):
     # CPU Break
     # asyncio.sleep(2)
 
-    @tasks.loop(hours=24)
-    async def check_offseason(self):
+    @app_commands.command(name="planseason", description="Preview a season that follows rivalry and rematch rules.")
+    @app_commands.checks.has_permissions(administrator=True)
+    @app_commands.describe(
+        weeks="Season length (defaults to the league's total weeks)",
+        max_meetings="Most times any two teams may meet",
+        rivalries="Required games, e.g. 3:Team A vs Team B; 9:Team C vs Team D",
+        blackouts="Weeks teams sit out, e.g. Team A:4,5; Team B:7"
+    )
+    async def planseason(self, interaction: discord.Interaction, weeks: int = None, max_meetings: int = None, rivalries: str = None, blackouts: str = None):
+        guild_id = str(interaction.guild.id)
+        data = self.league_data.get(guild_id, {})
+        teams = data.get("teams", [])
+        if len(teams) < 2:
+            await interaction.response.send_message("Use /addteam to select teams.", ephemeral=True)
+            return
+        total_weeks = weeks or data.get("total_weeks", 18)
+        if not 1 <= total_weeks <= 52:
+            await interaction.response.send_message("Season must be 1-52 weeks.", ephemeral=True)
+            return
+        if self.season_started(data):
+            await interaction.response.send_message(
+                f"Week {data['current_week'] - 1} has already been posted; a new season can only be planned before week 1.",
+                ephemeral=True
+            )
+            return
+
+        await interaction.response.defer(ephemeral=True)
+        try:
+            solver = ScheduleSolver(
+                teams, total_weeks, max_meetings,
+                parse_rivalries(rivalries, teams), parse_blackouts(blackouts, teams, total_weeks)
+            )
+            season = await asyncio.to_thread(solver.solve)
+        except ValueError as e:
+            await interaction.followup.send(f"Could not build a season: {e}", ephemeral=True)
+            return
+
+        action_id = get_pending_actions().create("seasonplan", {
+            "guild_id": guild_id,
+            "teams": sorted(teams),
+            "total_weeks": total_weeks,
+            "weeks": season
+        }, ttl=PLAN_TTL)
+        view = get_component_router(self.bot).make_view("seasonplan", action_id, [
+            ("commit", "Commit Season", discord.ButtonStyle.green),
+            ("cancel", "Discard", discord.ButtonStyle.red)
+        ])
+        lines = []
+        for number, week in enumerate(season, 1):
+            line = f"**Week {number}:** " + ", ".join(f"{home} vs {away}" for home, away in week["games"])
+            if week["bye"]:
+                line += f" (bye: {', '.join(week['bye'])})"
+            lines.append(line)
+        description = "\n".join(lines)
+        if len(description) > 4000:
+            description = description[:3990].rsplit("\n", 1)[0] + "\n..."
+        embed = discord.Embed(
+            title=f"Season Preview: {total_weeks} weeks, {len(teams)} teams",
+            description=description,
+            color=discord.Color.blue(),
+            timestamp=discord.utils.utcnow()
+        )
+        embed.set_footer(text=f"At most {solver.max_meetings} meeting(s) per pair, no back-to-back rematches")
+        await interaction.followup.send(embed=embed, view=view, ephemeral=True)
+
+    async def handle_season_plan(self, interaction: discord.Interaction, button: str, key: str):
+        if not interaction.user.guild_permissions.administrator:
+            await interaction.response.send_message("Only administrators can commit a season.", ephemeral=True)
+            return
+        pending = get_pending_actions()
+        plan = pending.get(key)
+        if plan is None:
+            await interaction.response.edit_message(content="This preview has expired. Run /planseason again.", embed=None, view=None)
+            return
+        pending.delete(key)
+        if button == "cancel":
+            await interaction.response.edit_message(content="Season preview discarded.", embed=None, view=None)
+            return
+
+        data = self.league_data.setdefault(plan["guild_id"], {})
+        if self.season_started(data):
+            await interaction.response.edit_message(
+                content="The current season has started since this preview; it was not replaced.", embed=None, view=None
+            )
+            return
+        data["season"] = {"teams": plan["teams"], "weeks": plan["weeks"]}
+        data["total_weeks"] = plan["total_weeks"]
+        save_league_data(self.league_data)
+        await interaction.response.edit_message(content="Season committed. /schedule will post it week by week.", view=None)
+        await self.log_action(interaction.guild, "Season Planned", f"{plan['total_weeks']} weeks committed by {interaction.user.display_name}")
+
+    # CPU Break
+    # asyncio.sleep(2)
+
+    def schedule_resume(self, guild_id, resume_at: datetime):
+        """Arm (or move) the timer that ends a guild's offseason."""
+        get_timer_service().schedule("offseason_resume", resume_at.timestamp(), {"guild_id": guild_id}, f"offseason:{guild_id}")
+
+    def restore_offseason_timers(self):
+        # Offseasons started before resumes were timer-driven only have a resume_date
         for guild_id, data in self.league_data.items():
-            if isinstance(data, dict) and data.get("offseason"):
-                resume_date_str = data.get("resume_date")
-                if resume_date_str == resume_date_str:
-                    try:
-                        resume_date = datetime.strptime(resume_date_str, "%Y-%m-%d")
-                        if datetime.utcnow().date() >= resume_date.date():
-                            data["offseason"] = False
-                            data["current_week"] = 1
-                            save_league_data(self.league_data)
-                            guild = self.bot.get_guild(int(guild_id))
-                            if guild and guild.system_channel:
-                                await guild.system_channel.send("League resumed! Week 1 matchups coming soon.")
-                                await self.log_action(guild, "Offseason Ended", "League resumed")
-                    except ValueError:
-                        pass
+            if not isinstance(data, dict) or not data.get("offseason"):
+                continue
+            if get_timer_service().has(f"offseason:{guild_id}"):
+                continue
+            try:
+                resume_date = datetime.strptime(data.get("resume_date", ""), "%Y-%m-%d")
+            except ValueError:
+                continue
+            self.schedule_resume(guild_id, resume_date.replace(tzinfo=pytz.UTC))
+
+    async def resume_offseason(self, timer):
+        guild_id = timer["guild_id"]
+        data = self.league_data.get(guild_id)
+        if not isinstance(data, dict) or not data.get("offseason"):
+            return
+        data["offseason"] = False
+        data["current_week"] = 1
+        data.pop("season", None)
+        data.pop("retry_games", None)
+        save_league_data(self.league_data)
+        # Results from here on count towards the new season's standings
+        get_standings().start_season(guild_id)
+        guild = self.bot.get_guild(int(guild_id))
+        if guild and guild.system_channel:
+            await guild.system_channel.send("League resumed! Week 1 matchups coming soon.")
+            await self.log_action(guild, "Offseason Ended", "League resumed")
+
+    def schedule_deadlines(self, guild, threads, deadline: datetime):
+        """Arm a deadline timer for each matchup thread that was created."""
+        for thread in threads:
+            if isinstance(thread, discord.Thread):
+                get_timer_service().schedule(
+                    "game_deadline", deadline.timestamp(),
+                    {"guild_id": guild.id, "thread_id": thread.id}, f"deadline:{thread.id}"
+                )
+
+    async def game_deadline(self, timer):
+        guild = self.bot.get_guild(timer["guild_id"])
+        thread = guild.get_thread(timer["thread_id"]) if guild else None
+        if thread is None or thread.archived:
+            return
+        await thread.send("**Deadline reached.** Report the result with /scorereport.")
 
     @app_commands.command(name="setupteams", description="Add team roles for the league.")
     @app_commands.checks.has_permissions(administrator=True)
@@ -222,7 +545,7 @@ class ScheduleCog(commands.Cog):
             await interaction.response.send_message("Need at least 2 teams for playoffs. Please add teams using /addteam and then /addplayoffteams.", ephemeral=True)
             return
 
-        random.shuffle(teams)
+        teams = random.sample(teams, len(teams))
         matchups = [(teams[i], teams[i+1]) for i in range(0, len(teams)-1, 2)]
         title = f"{superbowl_name if superbowl_name and len(teams) == 2 else 'Playoff Matches'}"
         embed = discord.Embed(
@@ -279,6 +602,7 @@ class ScheduleCog(commands.Cog):
         tz = pytz.timezone("America/Chicago")
         resume_date = datetime.now(tz) + timedelta(days=days)
         self.league_data[guild_id]["resume_date"] = resume_date.strftime("%Y-%m-%d")
+        self.schedule_resume(guild_id, resume_date)
 
         embed = discord.Embed(
             title="Offseason Started",
@@ -345,7 +669,6 @@ class ScheduleCog(commands.Cog):
                 
             tz = pytz.timezone("America/Chicago")
             game_datetime = tz.localize(datetime(year, month, day, hour, minute))
-            current_time = datetime.now(tz)
             
         except ValueError as e:
             await interaction.response.send_message(f"Invalid date/time: {e}", ephemeral=True)
@@ -371,15 +694,6 @@ class ScheduleCog(commands.Cog):
         team1_role = discord.utils.get(interaction.guild.roles, name=team1)
         team2_role = discord.utils.get(interaction.guild.roles, name=team2)
         
-        # Calculate time difference
-        time_diff = game_datetime - current_time
-        if time_diff.total_seconds() > 0:
-            hours_until = int(time_diff.total_seconds() // 3600)
-            time_status = f"Starts in {hours_until} hours"
-        else:
-            hours_ago = int(abs(time_diff.total_seconds()) // 3600)
-            time_status = f"Started {hours_ago} hours ago"
-
         embed = discord.Embed(
             title="Game Scheduled",
             description=f"{team1_emoji} {team1_role.mention if team1_role else team1} vs {team2_role.mention if team2_role else team2} {team2_emoji}",
@@ -390,82 +704,27 @@ class ScheduleCog(commands.Cog):
         if interaction.guild.icon:
             embed.set_author(name=interaction.guild.name, icon_url=interaction.guild.icon.url)
         
-        embed.add_field(
-            name="When",
-            value=f"{game_datetime.strftime('%B %d, %Y')} at {game_datetime.strftime('%I:%M %p')} ({time_status})",
-            inline=False
-        )
+        embed.add_field(name="When", value=self.kickoff_text(game_datetime), inline=False)
         embed.add_field(name="Streamer", value="Click button to assign", inline=True)
         embed.add_field(name="Referee", value="Click button to assign", inline=True)
 
-        class GameTimeView(discord.ui.View):
-            def __init__(self, bot, config, team1, team2):
-                super().__init__(timeout=None)
-                self.bot = bot
-                self.config = config
-                self.team1 = team1
-                self.team2 = team2
-                self.streamer = None
-                self.referee = None
-
-            @discord.ui.button(label="Streamer", style=discord.ButtonStyle.primary)
-            async def streamer_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-                streamer_role_id = self.config.get("streamer")
-                if not streamer_role_id:
-                    await interaction.response.send_message("Streamer role not configured in /setup.", ephemeral=True)
-                    return
-                    
-                streamer_role = interaction.guild.get_role(int(streamer_role_id))
-                if not streamer_role:
-                    await interaction.response.send_message("Streamer role not found.", ephemeral=True)
-                    return
-                    
-                if streamer_role not in interaction.user.roles:
-                    await interaction.response.send_message("You don't have the streamer role.", ephemeral=True)
-                    return
-                    
-                self.streamer = interaction.user
-                embed = interaction.message.embeds[0]
-                embed.set_field_at(1, name="Streamer", value=self.streamer.mention, inline=True)
-                await interaction.response.edit_message(embed=embed, view=self)
-
-            @discord.ui.button(label="Referee", style=discord.ButtonStyle.secondary)
-            async def referee_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-                referee_role_id = self.config.get("referee")
-                if not referee_role_id:
-                    await interaction.response.send_message("Referee role not configured in /setup.", ephemeral=True)
-                    return
-                    
-                referee_role = interaction.guild.get_role(int(referee_role_id))
-                if not referee_role:
-                    await interaction.response.send_message("Referee role not found.", ephemeral=True)
-                    return
-                    
-                if referee_role not in interaction.user.roles:
-                    await interaction.response.send_message("You don't have the referee role.", ephemeral=True)
-                    return
-                    
-                self.referee = interaction.user
-                embed = interaction.message.embeds[0]
-                embed.set_field_at(2, name="Referee", value=self.referee.mention, inline=True)
-                await interaction.response.edit_message(embed=embed, view=self)
-
-            @discord.ui.button(label="Cancel", style=discord.ButtonStyle.danger)
-            async def cancel_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-                if not interaction.user.guild_permissions.administrator:
-                    await interaction.response.send_message("Only administrators can cancel games.", ephemeral=True)
-                    return
-                    
-                embed = discord.Embed(
-                    title="Game Cancelled",
-                    description="Sorry, game has been cancelled",
-                    color=discord.Color.red(),
-                    timestamp=discord.utils.utcnow()
-                )
-                await interaction.response.edit_message(embed=embed, view=None)
-
-        view = GameTimeView(self.bot, config, team1, team2)
-        await gametime_channel.send(embed=embed, view=view)
+        view = get_component_router(self.bot).make_view("gametime", str(interaction.guild.id), [
+            ("streamer", "Streamer", discord.ButtonStyle.primary),
+            ("referee", "Referee", discord.ButtonStyle.secondary),
+            ("cancel", "Cancel", discord.ButtonStyle.danger)
+        ])
+        message = await gametime_channel.send(embed=embed, view=view)
+        registry = get_game_registry()
+        fields = {
+            "kickoff": game_datetime.timestamp(),
+            "message_id": message.id,
+            "gametime_channel_id": gametime_channel.id
+        }
+        game = registry.find(interaction.guild.id, team1, team2)
+        if game:
+            registry.update(interaction.guild.id, game, **fields)
+        else:
+            registry.add(interaction.guild.id, team1, team2, **fields)
         await interaction.response.send_message("Game time scheduled successfully!", ephemeral=True)
         await self.log_action(interaction.guild, "Game Time Scheduled", f"{team1} vs {team2}")
 
@@ -579,8 +838,8 @@ class ScheduleCog(commands.Cog):
                 await interaction.followup.send("Not enough teams for auto matchups.", ephemeral=True)
                 return
                 
-            random.shuffle(teams)
-            matchups = [(teams[i], teams[i+1]) for i in range(0, len(teams)-1, 2)]
+            shuffled = random.sample(teams, len(teams))
+            matchups = [(shuffled[i], shuffled[i+1]) for i in range(0, len(shuffled)-1, 2)]
             
             embed = discord.Embed(
                 title="League Schedule",
@@ -589,41 +848,37 @@ class ScheduleCog(commands.Cog):
                 timestamp=discord.utils.utcnow()
             )
             
+            deadline_str = deadline_time.strftime('%A, %B %d at %I:%M %p CDT')
+            category_id = config.get("voice_category_id") if autovcs == "enable" else None
             for i, (t1, t2) in enumerate(matchups, 1):
                 embed.add_field(
                     name=f"Game {i}",
                     value=f"{t1} vs {t2}",
                     inline=False
                 )
-                
-                # Create thread
-                thread = await schedule_channel.create_thread(
-                    name=f"{t1} vs {t2} - Game {i}",
-                    type=discord.ChannelType.public_thread,
-                    auto_archive_duration=deadline * 60 if deadline <= 72 else 4320
+            voice = await self.create_week_voice(interaction.guild, matchups, category_id)
+            results = await bounded_gather([
+                lambda i=i, t1=t1, t2=t2, vcs=vcs: self.create_matchup(
+                    interaction.guild, schedule_channel, f"{t1} vs {t2} - Game {i}",
+                    t1, t2, deadline_str, deadline * 60 if deadline <= 72 else 4320, vcs
                 )
-                
-                role1 = discord.utils.get(interaction.guild.roles, name=t1)
-                role2 = discord.utils.get(interaction.guild.roles, name=t2)
-                mentions = f"{role1.mention if role1 else t1} vs {role2.mention if role2 else t2}"
-                await thread.send(f"**Match**: {mentions}\n**Deadline**: {deadline_time.strftime('%A, %B %d at %I:%M %p CDT')}")
-                
-                if autovcs == "enable":
-                    voice_cog = self.bot.get_cog("VoiceChannelManagerCog")
-                    if voice_cog:
-                        category_id = config.get("voice_category_id")
-                        if category_id:
-                            try:
-                                team1_vc, team2_vc = await voice_cog.create_team_voice_channels(
-                                    interaction.guild, t1, t2, category_id
-                                )
-                                if team1_vc and team2_vc:
-                                    await thread.send(f"Voice Channels:\n{t1}: {team1_vc.mention}\n{t2}: {team2_vc.mention}")
-                            except Exception as e:
-                                await thread.send(f"Failed to create voice channels: {e}")
-                                
+                for i, ((t1, t2), vcs) in enumerate(zip(matchups, voice), 1)
+            ], MATCHUP_CONCURRENCY)
+            self.schedule_deadlines(interaction.guild, results, deadline_time)
+            await self.discard_failed_voice(matchups, voice, results)
+            errors = self.matchup_errors(matchups, results)
+            failed = sum(1 for result in results if isinstance(result, BaseException))
+            if failed == len(matchups):
+                await interaction.followup.send(f"Auto-schedule failed: none of the {failed} games could be set up.\n{errors}", ephemeral=True)
+                return
+
             await schedule_channel.send(embed=embed)
-            await interaction.followup.send("Auto-schedule completed!")
+            if failed:
+                await interaction.followup.send(
+                    f"Auto-schedule finished with {failed} of {len(matchups)} games failed:\n{errors}", ephemeral=True
+                )
+            else:
+                await interaction.followup.send("Auto-schedule completed!")
             
         else:
             # Create single thread for specified teams
@@ -637,7 +892,9 @@ class ScheduleCog(commands.Cog):
             role2 = discord.utils.get(interaction.guild.roles, name=team2)
             mentions = f"{role1.mention if role1 else team1} vs {role2.mention if role2 else team2}"
             await thread.send(f"**Match**: {mentions}\n**Deadline**: {deadline_time.strftime('%A, %B %d at %I:%M %p CDT')}")
+            self.schedule_deadlines(interaction.guild, [thread], deadline_time)
             
+            voice_ids = []
             if autovcs == "enable":
                 voice_cog = self.bot.get_cog("VoiceChannelManagerCog")
                 if voice_cog:
@@ -648,9 +905,14 @@ class ScheduleCog(commands.Cog):
                                 interaction.guild, team1, team2, category_id
                             )
                             if team1_vc and team2_vc:
+                                voice_ids = [team1_vc.id, team2_vc.id]
                                 await thread.send(f"Voice Channels:\n{team1}: {team1_vc.mention}\n{team2}: {team2_vc.mention}")
                         except Exception as e:
                             await thread.send(f"Failed to create voice channels: {e}")
+            get_game_registry().add(
+                interaction.guild.id, team1, team2,
+                thread_id=thread.id, channel_id=schedule_channel.id, voice_ids=voice_ids
+            )
             
             embed = discord.Embed(
                 title="Game Scheduled",
@@ -666,23 +928,92 @@ class ScheduleCog(commands.Cog):
 
     @app_commands.command(name="reschedule", description="Reschedule an existing game.")
     @app_commands.checks.has_permissions(administrator=True)
-    @app_commands.describe(home_team="The home team", away_team="The away team", new_date="New game date (YYYY-MM-DD)", new_time="New game time (HH:MM)")
+    @app_commands.describe(home_team="The home team", away_team="The away team", new_date="New game date (YYYY-MM-DD)", new_time="New game time (HH:MM)", week="Week of the game (defaults to the latest scheduled game)")
     @app_commands.autocomplete(home_team=team_autocomplete, away_team=team_autocomplete)
-    async def reschedule(self, interaction: discord.Interaction, home_team: str, away_team: str, new_date: str, new_time: str):
-        await interaction.response.send_message("This command is under development.", ephemeral=True)
+    async def reschedule(self, interaction: discord.Interaction, home_team: str, away_team: str, new_date: str, new_time: str, week: int = None):
+        registry = get_game_registry()
+        game = registry.find(interaction.guild.id, home_team, away_team, week)
+        if not game:
+            await interaction.response.send_message(f"No scheduled game found for {home_team} vs {away_team}.", ephemeral=True)
+            return
+        try:
+            tz = pytz.timezone("America/Chicago")
+            game_datetime = tz.localize(datetime.strptime(f"{new_date} {new_time}", "%Y-%m-%d %H:%M"))
+        except ValueError:
+            await interaction.response.send_message("Invalid date/time. Use YYYY-MM-DD and HH:MM (24-hour).", ephemeral=True)
+            return
+
+        await interaction.response.defer(ephemeral=True)
+        registry.update(interaction.guild.id, game, kickoff=game_datetime.timestamp(), status="scheduled")
+        when = self.kickoff_text(game_datetime)
+
+        async def edit_gametime():
+            message = await self.gametime_message(interaction.guild, game)
+            if message and message.embeds:
+                embed = message.embeds[0]
+                embed.set_field_at(0, name="When", value=when, inline=False)
+                await message.edit(embed=embed)
+
+        async def notify_thread():
+            thread = interaction.guild.get_thread(game.get("thread_id") or 0)
+            if thread:
+                await thread.send(f"**Rescheduled**: {home_team} vs {away_team} now kicks off {when}.")
+
+        async def notify_voice():
+            for channel_id in game.get("voice_ids", []):
+                channel = interaction.guild.get_channel(channel_id)
+                if channel:
+                    await channel.send(f"Game rescheduled to {when}.")
+
+        results = await asyncio.gather(edit_gametime(), notify_thread(), notify_voice(), return_exceptions=True)
+        failed = [str(result) for result in results if isinstance(result, BaseException)]
+        message = f"Rescheduled {home_team} vs {away_team} to {when}."
+        if failed:
+            message += "\nSome updates failed: " + "; ".join(failed)
+        await interaction.followup.send(message, ephemeral=True)
+        await self.log_action(interaction.guild, "Game Rescheduled", f"{home_team} vs {away_team}: {when}")
 
     @app_commands.command(name="deletegame", description="Delete a scheduled game.")
     @app_commands.checks.has_permissions(administrator=True)
-    @app_commands.describe(home_team="The home team", away_team="The away team")
+    @app_commands.describe(home_team="The home team", away_team="The away team", week="Week of the game (defaults to the latest scheduled game)")
     @app_commands.autocomplete(home_team=team_autocomplete, away_team=team_autocomplete)
-    async def deletegame(self, interaction: discord.Interaction, home_team: str, away_team: str):
-        await interaction.response.send_message("This command is under development.", ephemeral=True)
+    async def deletegame(self, interaction: discord.Interaction, home_team: str, away_team: str, week: int = None):
+        registry = get_game_registry()
+        game = registry.find(interaction.guild.id, home_team, away_team, week)
+        if not game:
+            await interaction.response.send_message(f"No scheduled game found for {home_team} vs {away_team}.", ephemeral=True)
+            return
+
+        await interaction.response.defer(ephemeral=True)
+        guild = interaction.guild
+        registry.remove(guild.id, game)
+        if game.get("thread_id"):
+            get_timer_service().cancel(f"deadline:{game['thread_id']}")
+        voice_cog = self.bot.get_cog("VoiceChannelManagerCog")
+        if voice_cog:
+            voice_cog.team_channels.pop(f"{game['home']}-{game['away']}", None)
+            for channel_id in game.get("voice_ids", []):
+                voice_cog.channel_ids.discard(str(channel_id))
+
+        async def delete_gametime():
+            message = await self.gametime_message(guild, game)
+            if message:
+                await message.delete()
+
+        deletions = [delete_gametime()]
+        for channel in (guild.get_thread(game.get("thread_id") or 0), *(guild.get_channel(cid) for cid in game.get("voice_ids", []))):
+            if channel:
+                deletions.append(channel.delete())
+        results = await asyncio.gather(*deletions, return_exceptions=True)
+        failed = [str(result) for result in results if isinstance(result, BaseException)]
+        message = f"Deleted {game['home']} vs {game['away']}."
+        if failed:
+            message += "\nSome cleanup failed: " + "; ".join(failed)
+        await interaction.followup.send(message, ephemeral=True)
+        await self.log_action(guild, "Game Deleted", f"{game['home']} vs {game['away']}")
 
     # CPU Break
     # asyncio.sleep(2)
 
-    def cog_unload(self):
-        self.check_offseason.cancel()
-
 async def setup(bot):
     await bot.add_cog(ScheduleCog(bot))
\ No newline at end of file
@@ -4,6 +4,7 @@ from discord.ext import commands
 import json
 import os
 from datetime import datetime, timedelta
+from utils.config_store import get_config_store
 
 class SetupCog(commands.Cog):
     def __init__(self, bot):
@@ -11,88 +12,69 @@ class SetupCog(commands.Cog):
         self.config = self.load_config()
 
     def load_config(self):
-        CONFIG_FILE = "config/setup.json"
-        if os.path.exists(CONFIG_FILE):
-            with open(CONFIG_FILE, 'r') as f:
-                return json.load(f)
-        return {}
+        return get_config_store().get_global()
 
     def load_guild_config(self, guild_id):
         """Load guild-specific configuration"""
-        config_file = f"config/setup_{guild_id}.json"
-        if os.path.exists(config_file):
-            with open(config_file, 'r') as f:
-                return json.load(f)
-        return {}
+        return get_config_store().get_guild(guild_id)
 
     def save_config(self, guild_id, config):
-        os.makedirs("config", exist_ok=True)
-        with open(f"config/setup_{guild_id}.json", 'w') as f:
-            json.dump(config, f, indent=4)
+        get_config_store().save_guild(guild_id, config)
 
     @app_commands.command(name="setupstatus", description="Check the current setup configuration.")
     @app_commands.checks.has_permissions(administrator=True)
     async def setupstatus(self, interaction: discord.Interaction):
-        guild_id = str(interaction.guild.id)
-        guild_config_file = f"config/setup_{guild_id}.json"
-
-        if not os.path.exists(guild_config_file):
+        store = get_config_store()
+        if not store.has_guild(interaction.guild.id):
             await interaction.response.send_message("❌ No setup configuration found. Please run `/setup` first.", ephemeral=True)
             return
 
-        try:
-            with open(guild_config_file, 'r') as f:
-                content = f.read().strip()
-                if not content:
-                    await interaction.response.send_message("❌ Setup configuration file is empty. Please run `/setup` and save the configuration.", ephemeral=True)
-                    return
+        guild_config = store.get_guild(interaction.guild.id)
+        if not guild_config:
+            await interaction.response.send_message("❌ Setup configuration file is empty or corrupted. Please run `/setup` and save the configuration.", ephemeral=True)
+            return
 
-                guild_config = json.loads(content)
+        embed = discord.Embed(
+            title="🏈 Setup Configuration Status",
+            color=discord.Color.green(),
+            timestamp=discord.utils.utcnow()
+        )
 
-                embed = discord.Embed(
-                    title="🏈 Setup Configuration Status",
-                    color=discord.Color.green(),
-                    timestamp=discord.utils.utcnow()
-                )
+        # Check roles
+        roles_config = guild_config.get("roles", {})
+        role_status = []
+        required_roles = ["candidate", "franchise_owner"]
 
-                # Check roles
-                roles_config = guild_config.get("roles", {})
-                role_status = []
-                required_roles = ["candidate", "franchise_owner"]
-
-                for role_key in required_roles:
-                    role_id = roles_config.get(role_key)
-                    if role_id:
-                        role = interaction.guild.get_role(role_id)
-                        status = f"✅ {role.mention}" if role else f"❌ Role ID {role_id} not found"
-                    else:
-                        status = "❌ Not configured"
-                    role_status.append(f"**{role_key.replace('_', ' ').title()}:** {status}")
-
-                embed.add_field(
-                    name="Required Roles", 
-                    value="\n".join(role_status),
-                    inline=False
-                )
+        for role_key in required_roles:
+            role_id = roles_config.get(role_key)
+            if role_id:
+                role = interaction.guild.get_role(role_id)
+                status = f"✅ {role.mention}" if role else f"❌ Role ID {role_id} not found"
+            else:
+                status = "❌ Not configured"
+            role_status.append(f"**{role_key.replace('_', ' ').title()}:** {status}")
 
-                # Show all configured roles
-                all_roles = []
-                for role_key, role_id in roles_config.items():
-                    role = interaction.guild.get_role(role_id)
-                    role_name = role.mention if role else f"ID: {role_id} (deleted)"
-                    all_roles.append(f"{role_key}: {role_name}")
+        embed.add_field(
+            name="Required Roles", 
+            value="\n".join(role_status),
+            inline=False
+        )
 
-                if all_roles:
-                    embed.add_field(
-                        name="All Configured Roles",
-                        value="\n".join(all_roles[:10]),  # Limit to avoid embed limit
-                        inline=False
-                    )
+        # Show all configured roles
+        all_roles = []
+        for role_key, role_id in roles_config.items():
+            role = interaction.guild.get_role(role_id)
+            role_name = role.mention if role else f"ID: {role_id} (deleted)"
+            all_roles.append(f"{role_key}: {role_name}")
 
-                await interaction.response.send_message(embed=embed, ephemeral=True)
+        if all_roles:
+            embed.add_field(
+                name="All Configured Roles",
+                value="\n".join(all_roles[:10]),  # Limit to avoid embed limit
+                inline=False
+            )
 
-        except json.JSONDecodeError:
-            await interaction.response.send_message("❌ Setup configuration file is corrupted. Please run `/setup` again.", ephemeral=True)
+        await interaction.response.send_message(embed=embed, ephemeral=True)
 
     @app_commands.command(name="setup", description="Configure the league settings with /setup.")
     @app_commands.checks.has_permissions(administrator=True)
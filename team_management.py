@@ -7,18 +7,18 @@ from datetime import datetime
 import pytz
 import asyncio
 from utils.team_utils import team_autocomplete
+from utils.config_store import get_config_store
+from utils.team_resolver import get_team_resolver
+from utils.roster_index import get_roster_index, roster_ready
+from utils.role_batch import RoleBatch, get_role_executor, interaction_progress
+from utils.log_sink import get_log_sink
 
-CONFIG_FILE = "config/setup.json"
 
 def load_config():
-    if os.path.exists(CONFIG_FILE):
-        with open(CONFIG_FILE, 'r') as f:
-            return json.load(f)
-    return {}
+    return get_config_store().get_global()
 
 def save_config(config):
-    with open(CONFIG_FILE, 'w') as f:
-        json.dump(config, f, indent=4)
+    get_config_store().save_global(config)
 
 class ConfirmModal(discord.ui.Modal):
     def __init__(self, action, callback):
@@ -43,13 +43,33 @@ class TeamManagementCog(commands.Cog):
 
     def get_guild_config(self, guild_id):
         """Load guild-specific configuration from setup"""
-        config_file = f"config/setup_{guild_id}.json"
-        if os.path.exists(config_file):
-            with open(config_file, 'r') as f:
-                content = f.read().strip()
-                if content:
-                    return json.loads(content)
-        return {}
+        return get_config_store().get_guild(guild_id)
+
+    def queue_disband(self, batch, guild: discord.Guild, team_role: discord.Role):
+        """Queue removal of a team's staff and player roles. Returns (staff_info, players)."""
+        roster_index = get_roster_index(self.bot)
+        staff_roles = ["Franchise Owner", "General Manager", "Head Coach", "Assistant Coach"]
+        staff_info = []
+        staff_ids = set()
+        for staff in staff_roles:
+            role = discord.utils.get(guild.roles, name=staff)
+            if not role:
+                continue
+            member = roster_index.first_with_all(guild, role, team_role)
+            if member:
+                staff_info.append(f"{staff[:2]}: {member.display_name}")
+                staff_ids.add(member.id)
+                batch.remove(member, role, team_role)
+        players = [m for m in roster_index.members(guild, team_role) if m.id not in staff_ids]
+        for player in players:
+            batch.remove(player, team_role)
+        return staff_info, players
+
+    def batch_summary(self, message, failures):
+        if not failures:
+            return message
+        names = ", ".join(member.display_name for member, _ in failures[:10])
+        return f"{message}\n⚠️ Failed to update {len(failures)} member(s): {names}"
 
     def has_admin_roles(self, interaction: discord.Interaction):
         """Check if user has admin or moderator roles"""
@@ -97,20 +117,22 @@ class TeamManagementCog(commands.Cog):
                 )
                 if user:
                     embed.set_footer(text=f"Action by {user.display_name}", icon_url=user.avatar.url if user.avatar else None)
-                await logs_channel.send(embed=embed)
+                get_log_sink(self.bot).post(logs_channel, embed)
 
     def get_team_info(self, member: discord.Member):
-        for role in member.roles:
-            if role.name in self.config.get("teams", []) and role.name != "@everyone":
-                emoji = self.team_emojis.get(role.name, "")
-                return role, role.name, emoji
-        return None, None, None
+        return get_team_resolver(self.bot).get_team_info(member)
 
     def get_team_members(self, guild: discord.Guild, team_name: str):
         team_role = discord.utils.get(guild.roles, name=team_name)
         if not team_role:
             return []
-        return [member for member in guild.members if team_role in member.roles]
+        return get_roster_index(self.bot).members(guild, team_role)
+
+    def get_team_count(self, guild: discord.Guild, team_name: str):
+        team_role = discord.utils.get(guild.roles, name=team_name)
+        if not team_role:
+            return 0
+        return get_roster_index(self.bot).count(guild, team_role)
 
     # CPU Break: Pause after cog initialization
     # asyncio.sleep(2) simulated during code generation
@@ -127,19 +149,7 @@ class TeamManagementCog(commands.Cog):
             return
 
         # Load guild-specific setup configuration
-        guild_config_file = f"config/setup_{interaction.guild.id}.json"
-        guild_config = {}
-        if os.path.exists(guild_config_file):
-            try:
-                with open(guild_config_file, 'r') as f:
-                    content = f.read().strip()
-                    if content:
-                        guild_config = json.loads(content)
-                    else:
-                        guild_config = {}
-            except (json.JSONDecodeError, ValueError):
-                # File exists but is empty or malformed, use empty config
-                guild_config = {}
+        guild_config = self.get_guild_config(interaction.guild.id)
 
         # Get roles from setup configuration
         candidate_role_id = guild_config.get("roles", {}).get("candidate")
@@ -148,7 +158,7 @@ class TeamManagementCog(commands.Cog):
         # Debug: Check what's actually in the config
         if not candidate_role_id or not fo_role_id:
             debug_msg = f"Configuration missing roles:\n"
-            debug_msg += f"Config file exists: {os.path.exists(guild_config_file)}\n"
+            debug_msg += f"Config saved: {get_config_store().has_guild(interaction.guild.id)}\n"
             debug_msg += f"Config content: {guild_config}\n"
             debug_msg += f"Candidate role ID: {candidate_role_id}\n"
             debug_msg += f"Franchise Owner role ID: {fo_role_id}"
@@ -201,20 +211,6 @@ class TeamManagementCog(commands.Cog):
                 emoji_url = f"https://cdn.discordapp.com/emojis/{emoji_id}.png"
                 embed.set_author(name="", icon_url=emoji_url)
 
-        # Load guild-specific setup configuration for alerts channel
-        guild_config_file = f"config/setup_{interaction.guild.id}.json"
-        guild_config = {}
-        if os.path.exists(guild_config_file):
-            try:
-                with open(guild_config_file, 'r') as f:
-                    content = f.read().strip()
-                    if content:
-                        guild_config = json.loads(content)
-                    else:
-                        guild_config = {}
-            except (json.JSONDecodeError, ValueError):
-                guild_config = {}
-
         # Get alerts channel from guild-specific config
         alerts_channel_id = guild_config.get("channels", {}).get("alerts")
         if alerts_channel_id:
@@ -233,21 +229,10 @@ class TeamManagementCog(commands.Cog):
 
     @app_commands.command(name="appointall", description="Appoint all candidates to teams without an FO.")
     @app_commands.checks.has_permissions(administrator=True)
+    @roster_ready()
     async def appointall(self, interaction: discord.Interaction):
         # Load guild-specific setup configuration
-        guild_config_file = f"config/setup_{interaction.guild.id}.json"
-        guild_config = {}
-        if os.path.exists(guild_config_file):
-            try:
-                with open(guild_config_file, 'r') as f:
-                    content = f.read().strip()
-                    if content:
-                        guild_config = json.loads(content)
-                    else:
-                        guild_config = {}
-            except (json.JSONDecodeError, ValueError):
-                # File exists but is empty or malformed, use empty config
-                guild_config = {}
+        guild_config = self.get_guild_config(interaction.guild.id)
 
         # Get roles from setup configuration
         candidate_role_id = guild_config.get("roles", {}).get("candidate")
@@ -263,14 +248,15 @@ class TeamManagementCog(commands.Cog):
         if not candidate_role or not fo_role:
             await interaction.response.send_message("Required roles not found or have been deleted.", ephemeral=True)
             return
-        candidates = [member for member in interaction.guild.members if candidate_role in member.roles]
+        roster_index = get_roster_index(self.bot)
+        candidates = roster_index.members(interaction.guild, candidate_role)
         teams = self.config.get("teams", [])
         teams_without_fo = []
         for team in teams:
             team_role = discord.utils.get(interaction.guild.roles, name=team)
             if not team_role:
                 continue
-            has_fo = any(fo_role in member.roles and team_role in member.roles for member in interaction.guild.members)
+            has_fo = roster_index.first_with_all(interaction.guild, fo_role, team_role) is not None
             if not has_fo:
                 teams_without_fo.append(team)
         # Only appoint up to the number of available teams
@@ -278,6 +264,7 @@ class TeamManagementCog(commands.Cog):
         if max_appointments == 0:
             await interaction.response.send_message("No candidates or teams available to appoint.", ephemeral=True)
             return
+        await interaction.response.defer(ephemeral=True, thinking=True)
 
         # Take only the first N candidates where N is the number of teams without FO
         candidates_to_appoint = candidates[:max_appointments]
@@ -292,13 +279,21 @@ class TeamManagementCog(commands.Cog):
         )
 
         appointment_list = []
-        for i, (candidate, team) in enumerate(zip(candidates_to_appoint, teams_to_fill)):
+        batch = RoleBatch(interaction.guild, reason="/appointall")
+        appointed = []
+        for candidate, team in zip(candidates_to_appoint, teams_to_fill):
             team_role = discord.utils.get(interaction.guild.roles, name=team)
             if not team_role:
                 continue
-
-            await candidate.remove_roles(candidate_role)
-            await candidate.add_roles(fo_role, team_role)
+            batch.remove(candidate, candidate_role)
+            batch.add(candidate, fo_role, team_role)
+            appointed.append((candidate, team, team_role))
+
+        failures = await get_role_executor().apply(batch, interaction_progress(interaction, "Appointing"))
+        failed_ids = {member.id for member, _ in failures}
+        for candidate, team, team_role in appointed:
+            if candidate.id in failed_ids:
+                continue
             team_emoji = self.team_emojis.get(team, "")
             appointment_list.append(f"{candidate.mention} {team_emoji} {team_role.mention}")
             await self.log_action(interaction.guild, "FO Appointed", f"{candidate.display_name} appointed to {team}", interaction.user)
@@ -306,7 +301,7 @@ class TeamManagementCog(commands.Cog):
         # Add all appointments as a single field
         embed.add_field(
             name="",
-            value="\n".join(appointment_list),
+            value="\n".join(appointment_list) or "None",
             inline=False
         )
 
@@ -324,27 +319,16 @@ class TeamManagementCog(commands.Cog):
                 print(f"Alerts channel not found: {alerts_channel_id}")
         else:
             print("Alerts channel not configured in setup")
-        await interaction.response.send_message(f"Appointed {max_appointments} candidates!", ephemeral=True)
+        await interaction.edit_original_response(content=self.batch_summary(f"Appointed {len(appointment_list)} candidates!", failures))
 
     # CPU Break: Pause after /appointall
     # asyncio.sleep(2) simulated during code generation
 
     @app_commands.command(name="waitlist", description="Show the list of candidates waiting for a team.")
+    @roster_ready()
     async def waitlist(self, interaction: discord.Interaction):
         # Load guild-specific setup configuration
-        guild_config_file = f"config/setup_{interaction.guild.id}.json"
-        guild_config = {}
-        if os.path.exists(guild_config_file):
-            try:
-                with open(guild_config_file, 'r') as f:
-                    content = f.read().strip()
-                    if content:
-                        guild_config = json.loads(content)
-                    else:
-                        guild_config = {}
-            except (json.JSONDecodeError, ValueError):
-                # File exists but is empty or malformed, use empty config
-                guild_config = {}
+        guild_config = self.get_guild_config(interaction.guild.id)
 
         # Get candidate role from setup configuration
         candidate_role_id = guild_config.get("roles", {}).get("candidate")
@@ -358,7 +342,7 @@ class TeamManagementCog(commands.Cog):
         if not candidate_role:
             await interaction.response.send_message("Candidate role not found or has been deleted.", ephemeral=True)
             return
-        candidates = [member for member in interaction.guild.members if candidate_role in member.roles]
+        candidates = get_roster_index(self.bot).members(interaction.guild, candidate_role)
         embed = discord.Embed(
             title="Candidate Waitlist",
             color=discord.Color.blue(),
@@ -376,21 +360,10 @@ class TeamManagementCog(commands.Cog):
     # asyncio.sleep(2) simulated during code generation
 
     @app_commands.command(name="franchiselist", description="Show the list of Franchise Owners and their teams.")
+    @roster_ready()
     async def franchiselist(self, interaction: discord.Interaction):
         # Load guild-specific setup configuration
-        guild_config_file = f"config/setup_{interaction.guild.id}.json"
-        guild_config = {}
-        if os.path.exists(guild_config_file):
-            try:
-                with open(guild_config_file, 'r') as f:
-                    content = f.read().strip()
-                    if content:
-                        guild_config = json.loads(content)
-                    else:
-                        guild_config = {}
-            except (json.JSONDecodeError, ValueError):
-                # File exists but is empty or malformed, use empty config
-                guild_config = {}
+        guild_config = self.get_guild_config(interaction.guild.id)
 
         # Get franchise owner role from setup configuration
         fo_role_id = guild_config.get("roles", {}).get("franchise_owner")
@@ -410,18 +383,18 @@ class TeamManagementCog(commands.Cog):
             timestamp=discord.utils.utcnow()
         )
         roster_cap = int(self.config.get("roster_cap", 53))
+        roster_index = get_roster_index(self.bot)
         for team in self.config.get("teams", []):
             team_role = discord.utils.get(interaction.guild.roles, name=team)
             if not team_role:
                 continue
-            fo = next((member for member in interaction.guild.members if fo_role in member.roles and team_role in member.roles), None)
+            fo = roster_index.first_with_all(interaction.guild, fo_role, team_role)
             if not fo:
                 continue
-            team_members = self.get_team_members(interaction.guild, team)
             team_emoji = self.team_emojis.get(team, "")
             embed.add_field(
                 name=f"{team_emoji} {team} ({fo.display_name})",
-                value=f"Roster: {len(team_members)}/{roster_cap}",
+                value=f"Roster: {roster_index.count(interaction.guild, team_role)}/{roster_cap}",
                 inline=False
             )
         if interaction.guild.icon:
@@ -450,6 +423,10 @@ class TeamManagementCog(commands.Cog):
             return
 
         async def disband_callback(interaction: discord.Interaction):
+            await interaction.response.defer(ephemeral=True, thinking=True)
+            if not await get_roster_index(self.bot).wait_chunked(interaction.guild):
+                await interaction.edit_original_response(content="This server's member list is still loading. Please try again in a moment.")
+                return
             team_emoji = self.team_emojis.get(team, "")
             embed = discord.Embed(
                 title=f"{interaction.guild.name} Disbandment Report",
@@ -457,19 +434,9 @@ class TeamManagementCog(commands.Cog):
                 color=discord.Color.red(),
                 timestamp=discord.utils.utcnow()
             )
-            staff_roles = ["Franchise Owner", "General Manager", "Head Coach", "Assistant Coach"]
-            staff_info = []
-            for staff in staff_roles:
-                role = discord.utils.get(interaction.guild.roles, name=staff)
-                if not role:
-                    continue
-                member = next((m for m in interaction.guild.members if role in m.roles and team_role in m.roles), None)
-                if member:
-                    staff_info.append(f"{staff[:2]}: {member.display_name}")
-                    await member.remove_roles(role, team_role)
-            players = [m for m in interaction.guild.members if team_role in m.roles]
-            for player in players:
-                await player.remove_roles(team_role)
+            batch = RoleBatch(interaction.guild, reason=f"/disband {team}")
+            staff_info, players = self.queue_disband(batch, interaction.guild, team_role)
+            failures = await get_role_executor().apply(batch, interaction_progress(interaction, f"Disbanding {team}"))
             embed.add_field(
                 name="Staff Removed",
                 value="\n".join(staff_info) or "None",
@@ -482,26 +449,15 @@ class TeamManagementCog(commands.Cog):
             )
             if interaction.guild.icon:
                 embed.set_thumbnail(url=interaction.guild.icon.url)
-            # Load guild-specific setup configuration for alerts channel
-            guild_config_file = f"config/setup_{interaction.guild.id}.json"
-            guild_config = {}
-            if os.path.exists(guild_config_file):
-                try:
-                    with open(guild_config_file, 'r') as f:
-                        content = f.read().strip()
-                        if content:
-                            guild_config = json.loads(content)
-                        else:
-                            guild_config = {}
-                except (json.JSONDecodeError, ValueError):
-                    guild_config = {}
+            # Load guild-specific setup configuration
+            guild_config = self.get_guild_config(interaction.guild.id)
 
             alerts_channel_id = guild_config.get("channels", {}).get("alerts")
             if alerts_channel_id:
                 alerts_channel = interaction.guild.get_channel(int(alerts_channel_id))
                 if alerts_channel:
                     await alerts_channel.send(embed=embed)
-            await interaction.response.send_message("Team disbanded!", ephemeral=True)
+            await interaction.edit_original_response(content=self.batch_summary("Team disbanded!", failures))
             await self.log_action(interaction.guild, "Team Disbanded", f"Team {team} disbanded", interaction.user)
 
         modal = ConfirmModal("Disband Team", disband_callback)
@@ -514,58 +470,44 @@ class TeamManagementCog(commands.Cog):
     @app_commands.checks.has_permissions(administrator=True)
     async def disbandall(self, interaction: discord.Interaction):
         async def disbandall_callback(interaction: discord.Interaction):
+            await interaction.response.defer(ephemeral=True, thinking=True)
+            if not await get_roster_index(self.bot).wait_chunked(interaction.guild):
+                await interaction.edit_original_response(content="This server's member list is still loading. Please try again in a moment.")
+                return
             embed = discord.Embed(
                 title=f"{interaction.guild.name} League Disbandment",
                 description="All teams have been disbanded.",
                 color=discord.Color.red(),
                 timestamp=discord.utils.utcnow()
             )
-            staff_roles = ["Franchise Owner", "General Manager", "Head Coach", "Assistant Coach"]
+            batch = RoleBatch(interaction.guild, reason="/disbandall")
+            disbanded = []
             for team in self.config.get("teams", []):
                 team_role = discord.utils.get(interaction.guild.roles, name=team)
                 if not team_role:
                     continue
                 team_emoji = self.team_emojis.get(team, "")
-                staff_info = []
-                for staff in staff_roles:
-                    role = discord.utils.get(interaction.guild.roles, name=staff)
-                    if not role:
-                        continue
-                    member = next((m for m in interaction.guild.members if role in m.roles and team_role in m.roles), None)
-                    if member:
-                        staff_info.append(f"{staff[:2]}: {member.display_name}")
-                        await member.remove_roles(role, team_role)
-                players = [m for m in interaction.guild.members if team_role in m.roles]
-                for player in players:
-                    await player.remove_roles(team_role)
+                staff_info, players = self.queue_disband(batch, interaction.guild, team_role)
+                disbanded.append(team)
                 embed.add_field(
                     name=f"{team_emoji} {team}",
                     value=f"Staff: {', '.join(staff_info) or 'None'}\nPlayers: {', '.join(m.display_name for m in players) or 'None'}",
                     inline=False
                 )
+            failures = await get_role_executor().apply(batch, interaction_progress(interaction, "Disbanding all teams"))
+            for team in disbanded:
                 await self.log_action(interaction.guild, "Team Disbanded", f"Team {team} disbanded", interaction.user)
             if interaction.guild.icon:
                 embed.set_thumbnail(url=interaction.guild.icon.url)
-            # Load guild-specific setup configuration for alerts channel
-            guild_config_file = f"config/setup_{interaction.guild.id}.json"
-            guild_config = {}
-            if os.path.exists(guild_config_file):
-                try:
-                    with open(guild_config_file, 'r') as f:
-                        content = f.read().strip()
-                        if content:
-                            guild_config = json.loads(content)
-                        else:
-                            guild_config = {}
-                except (json.JSONDecodeError, ValueError):
-                    guild_config = {}
+            # Load guild-specific setup configuration
+            guild_config = self.get_guild_config(interaction.guild.id)
 
             alerts_channel_id = guild_config.get("channels", {}).get("alerts")
             if alerts_channel_id:
                 alerts_channel = interaction.guild.get_channel(int(alerts_channel_id))
                 if alerts_channel:
                     await alerts_channel.send(embed=embed)
-            await interaction.response.send_message("All teams disbanded!", ephemeral=True)
+            await interaction.edit_original_response(content=self.batch_summary("All teams disbanded!", failures))
             await self.log_action(interaction.guild, "All Teams Disbanded", "All teams disbanded", interaction.user)
 
         modal = ConfirmModal("Disband All Teams", disbandall_callback)
@@ -577,6 +519,7 @@ class TeamManagementCog(commands.Cog):
     @app_commands.command(name="roster", description="Show the roster of a team.")
     @app_commands.describe(team="The team to display the roster for")
     @app_commands.autocomplete(team=team_autocomplete)
+    @roster_ready()
     async def roster(self, interaction: discord.Interaction, team: str):
         if team not in self.config.get("teams", []):
             await interaction.response.send_message("Invalid team. Must be created via /setup.", ephemeral=True)
@@ -596,13 +539,13 @@ class TeamManagementCog(commands.Cog):
             role = discord.utils.get(interaction.guild.roles, name=staff)
             if not role:
                 continue
-            member = next((m for m in interaction.guild.members if role in m.roles and team_role in m.roles), None)
+            member = get_roster_index(self.bot).first_with_all(interaction.guild, role, team_role)
             embed.add_field(
                 name=staff,
                 value=member.display_name if member else "None",
                 inline=True
             )
-        players = [m for m in interaction.guild.members if team_role in m.roles and not any(discord.utils.get(m.roles, name=staff) for staff in staff_roles)]
+        players = [m for m in get_roster_index(self.bot).members(interaction.guild, team_role) if not any(discord.utils.get(m.roles, name=staff) for staff in staff_roles)]
         embed.add_field(
             name="Players",
             value=", ".join(m.display_name for m in players) or "None",
@@ -611,7 +554,7 @@ class TeamManagementCog(commands.Cog):
         roster_cap = int(self.config.get("roster_cap", 53))
         embed.add_field(
             name="Roster Cap",
-            value=f"{len(self.get_team_members(interaction.guild, team))}/{roster_cap}",
+            value=f"{self.get_team_count(interaction.guild, team)}/{roster_cap}",
             inline=False
         )
         if interaction.guild.icon:
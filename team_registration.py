@@ -8,19 +8,14 @@ from utils.comprehensive_logger import get_comprehensive_logger
 from utils.team_utils import team_autocomplete
 from datetime import datetime
 import pytz
+from utils.config_store import get_config_store
 
-CONFIG_FILE = "config/setup.json"
 
 def load_config():
-    if os.path.exists(CONFIG_FILE):
-        with open(CONFIG_FILE, 'r') as f:
-            return json.load(f)
-    return {}
+    return get_config_store().get_global()
 
 def save_config(config):
-    os.makedirs(os.path.dirname(CONFIG_FILE), exist_ok=True)
-    with open(CONFIG_FILE, 'w') as f:
-        json.dump(config, f, indent=4)
+    get_config_store().save_global(config)
 
 class TeamRegistrationCog(commands.Cog):
     def __init__(self, bot):
@@ -29,13 +24,7 @@ class TeamRegistrationCog(commands.Cog):
 
     def get_guild_config(self, guild_id):
         """Load guild-specific configuration from setup"""
-        config_file = f"config/setup_{guild_id}.json"
-        if os.path.exists(config_file):
-            with open(config_file, 'r') as f:
-                content = f.read().strip()
-                if content:
-                    return json.loads(content)
-        return {}
+        return get_config_store().get_guild(guild_id)
 
     def has_admin_roles(self, interaction: discord.Interaction):
         """Check if user has admin or moderator roles"""
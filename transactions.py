@@ -9,25 +9,21 @@ from utils.team_utils import team_autocomplete
 from datetime import datetime
 import pytz
 import asyncio
+from utils.config_store import get_config_store
+from utils.draft_state import get_draft_registry
+from utils.team_resolver import get_team_resolver
+from utils.roster_index import get_roster_index, roster_ready
+from utils.role_batch import RoleBatch, get_role_executor
+from utils.component_router import get_component_router, get_pending_actions
+from utils.log_sink import get_log_sink
 
-CONFIG_FILE = "config/setup.json"
-DRAFT_FILE = "config/draft.json"
+PENDING_TTL = 86400  # Offers and trade proposals stay open for 24 hours
 
 def load_config():
-    if os.path.exists(CONFIG_FILE):
-        with open(CONFIG_FILE, 'r') as f:
-            return json.load(f)
-    return {}
+    return get_config_store().get_global()
 
 def save_config(config):
-    with open(CONFIG_FILE, 'w') as f:
-        json.dump(config, f, indent=4)
-
-def load_draft():
-    if os.path.exists(DRAFT_FILE):
-        with open(DRAFT_FILE, 'r') as f:
-            return json.load(f)
-    return {"draft_active": False}
+    get_config_store().save_global(config)
 
 class ConfirmModal(discord.ui.Modal):
     def __init__(self, action, callback):
@@ -49,6 +45,9 @@ class TransactionsCog(commands.Cog):
         self.bot = bot
         self.config = load_config()
         self.team_emojis = self.config.get("team_emojis", {})
+        router = get_component_router(bot)
+        router.register("offer", self.handle_offer)
+        router.register("trade", self.handle_trade)
 
     async def log_action(self, guild, action, details):
         logs_channel_id = self.config.get("logs_channel")
@@ -61,20 +60,22 @@ class TransactionsCog(commands.Cog):
                     color=discord.Color.blue(),
                     timestamp=discord.utils.utcnow()
                 )
-                await logs_channel.send(embed=embed)
+                get_log_sink(self.bot).post(logs_channel, embed)
 
     def get_team_info(self, member: discord.Member):
-        for role in member.roles:
-            if role.name in self.config.get("teams", []) and role.name != "@everyone":
-                emoji = self.team_emojis.get(role.name, "")
-                return role, role.name, emoji
-        return None, None, None
+        return get_team_resolver(self.bot).get_team_info(member)
 
     def get_team_members(self, guild: discord.Guild, team_name: str):
         team_role = discord.utils.get(guild.roles, name=team_name)
         if not team_role:
             return []
-        return [member for member in guild.members if team_role in member.roles]
+        return get_roster_index(self.bot).members(guild, team_role)
+
+    def get_team_count(self, guild: discord.Guild, team_name: str):
+        team_role = discord.utils.get(guild.roles, name=team_name)
+        if not team_role:
+            return 0
+        return get_roster_index(self.bot).count(guild, team_role)
 
     def check_trade_deadline(self):
         deadline_str = self.config.get("trade_deadline")
@@ -116,11 +117,155 @@ class TransactionsCog(commands.Cog):
             return guild.get_channel(int(transactions_channel_id))
         return None
 
+    async def handle_offer(self, interaction: discord.Interaction, button: str, action_id: str):
+        pending = get_pending_actions()
+        offer = pending.get(action_id)
+        if offer is None:
+            await interaction.response.send_message("This offer is no longer available.", ephemeral=True)
+            return
+        if interaction.user.id != offer["player_id"]:
+            await interaction.response.send_message(f"Only the offered player can {button}.", ephemeral=True)
+            return
+        guild = self.bot.get_guild(offer["guild_id"])
+        if not guild:
+            await interaction.response.send_message("The league server for this offer is unavailable.", ephemeral=True)
+            return
+        team_name = offer["team_name"]
+        team_emoji = offer["team_emoji"]
+
+        if button == "decline":
+            pending.delete(action_id)
+            await interaction.response.send_message("Contract declined.", ephemeral=True)
+            await self.log_action(guild, "Contract Declined", f"{interaction.user.display_name} declined {team_name}")
+            return
+
+        if not get_roster_index(self.bot).ready(guild):
+            await interaction.response.send_message("The league's member list is still loading. Please try again in a few seconds.", ephemeral=True)
+            return
+        player = guild.get_member(offer["player_id"])
+        team_role = discord.utils.get(guild.roles, name=team_name)
+        if not player or not team_role:
+            pending.delete(action_id)
+            await interaction.response.send_message("This offer is no longer valid.", ephemeral=True)
+            return
+        try:
+            await player.add_roles(team_role)
+            pending.delete(action_id)
+            current_roster = self.get_team_count(guild, team_name)
+            coach = guild.get_member(offer["coach_id"])
+            embed = discord.Embed(
+                title="Offer Accepted",
+                description=f"{player.mention} has accepted the offer to join {team_emoji} {team_name}",
+                color=discord.Color.green(),
+                timestamp=discord.utils.utcnow()
+            )
+            if guild.icon:
+                embed.set_author(name=guild.name, icon_url=guild.icon.url)
+            embed.add_field(name="Coach:", value=f"{offer['coach_role']} {coach.mention if coach else ''}", inline=False)
+            embed.add_field(name="Roster:", value=f"{current_roster}/{offer['roster_cap']}", inline=False)
+            if team_emoji:
+                embed.set_thumbnail(url=team_emoji)  # Full-size team emoji
+            # Send to transactions channel from guild-specific setup
+            transactions_channel = self.get_transactions_channel(guild)
+            if transactions_channel:
+                await transactions_channel.send(embed=embed)
+            await interaction.response.send_message("Contract accepted!", ephemeral=True)
+            await self.log_action(guild, "Contract Accepted", f"{player.display_name} joined {team_name}")
+        except discord.errors.HTTPException as e:
+            await interaction.response.send_message(f"Failed to accept contract: {e}", ephemeral=True)
+
+    async def handle_trade(self, interaction: discord.Interaction, button: str, action_id: str):
+        pending = get_pending_actions()
+        trade = pending.get(action_id)
+        if trade is None:
+            await interaction.response.send_message("This trade proposal is no longer available.", ephemeral=True)
+            return
+        if interaction.user.id not in (trade["proposer_id"], trade["target_fo_id"]):
+            await interaction.response.send_message(f"Only the proposing or target Franchise Owner can {button}.", ephemeral=True)
+            return
+        embed = interaction.message.embeds[0]
+        user_team = trade["user_team"]
+        targeted_team = trade["targeted_team"]
+
+        if button == "reject":
+            pending.delete(action_id)
+            embed.title = "Trade Rejected"
+            embed.description = (embed.description or "") + f"\nRejected by {interaction.user.mention}"
+            embed.color = discord.Color.red()
+            await interaction.message.edit(embed=embed, view=None)
+            await interaction.response.send_message("Trade rejected.", ephemeral=True)
+            await self.log_action(interaction.guild, "Trade Rejected", f"Rejected by {interaction.user.display_name}")
+            return
+
+        if interaction.user.id in trade["approved_by"]:
+            await interaction.response.send_message("You have already approved this trade.", ephemeral=True)
+            return
+        if not {trade["proposer_id"], trade["target_fo_id"]}.issubset(trade["approved_by"] + [interaction.user.id]):
+            trade["approved_by"].append(interaction.user.id)
+            pending.update(action_id, trade)
+            await interaction.response.send_message("Trade approved. Waiting for other team.", ephemeral=True)
+            return
+
+        offered_player = interaction.guild.get_member(trade["offered_player_id"])
+        targeted_player = interaction.guild.get_member(trade["targeted_player_id"])
+        user_team_role = discord.utils.get(interaction.guild.roles, name=user_team)
+        targeted_team_role = discord.utils.get(interaction.guild.roles, name=targeted_team)
+        if not all([offered_player, targeted_player, user_team_role, targeted_team_role]):
+            pending.delete(action_id)
+            await interaction.response.send_message("A player or team in this trade no longer exists.", ephemeral=True)
+            return
+        team_emoji = trade["team_emoji"]
+        target_team_emoji = trade["target_team_emoji"]
+        batch = RoleBatch(interaction.guild, reason=f"Trade: {user_team} / {targeted_team}")
+        batch.remove(offered_player, user_team_role)
+        batch.add(offered_player, targeted_team_role)
+        batch.remove(targeted_player, targeted_team_role)
+        batch.add(targeted_player, user_team_role)
+        # The final approval is only recorded by completing the trade, so a failed attempt can be retried
+        original_roles = {
+            member.id: [role for role in member.roles if not role.is_default()]
+            for member in (offered_player, targeted_player)
+        }
+        failures = await get_role_executor().apply(batch)
+        if failures:
+            failed_ids = {member.id for member, _ in failures}
+            for member in (offered_player, targeted_player):
+                if member.id not in failed_ids:
+                    try:
+                        await member.edit(roles=original_roles[member.id], reason=f"Trade rolled back: {user_team} / {targeted_team}")
+                    except discord.HTTPException as e:
+                        print(f"Failed to roll back trade roles for {member}: {e}")
+            await interaction.response.send_message(
+                f"Failed to execute trade: {failures[0][1]}. No roles were changed; approve again to retry.",
+                ephemeral=True
+            )
+            return
+        try:
+            pending.delete(action_id)
+            embed.title = "Trade Accepted"
+            embed.color = discord.Color.green()
+            embed.description = f"{target_team_emoji} {targeted_team} has accepted a trade from {team_emoji} {user_team}"
+            embed.add_field(name=f"{team_emoji} {user_team} Receives", value=targeted_player.mention, inline=False)
+            embed.add_field(name=f"{target_team_emoji} {targeted_team} Receives", value=offered_player.mention, inline=False)
+            await interaction.message.edit(embed=embed, view=None)
+            transactions_channel_id = self.config.get("transactions_channel")
+            transactions_channel = interaction.guild.get_channel(int(transactions_channel_id)) if transactions_channel_id else interaction.channel
+            await transactions_channel.send(embed=embed)
+            await interaction.response.send_message("Trade completed!", ephemeral=True)
+            await self.log_action(
+                interaction.guild,
+                "Trade Completed",
+                f"{offered_player.display_name} to {targeted_team}, {targeted_player.display_name} to {user_team}"
+            )
+        except discord.errors.HTTPException as e:
+            await interaction.response.send_message(f"Failed to execute trade: {e}", ephemeral=True)
+
     # CPU Break: Pause after cog initialization
     # asyncio.sleep(2) simulated during code generation
 
     @app_commands.command(name="sign", description="Sign a player to your team.")
     @app_commands.describe(player="The player to sign")
+    @roster_ready()
     async def sign(self, interaction: discord.Interaction, player: discord.Member):
         # Check if user has required roles from setup
         if not self.has_required_roles(interaction):
@@ -139,7 +284,7 @@ class TransactionsCog(commands.Cog):
             return
 
         roster_cap = int(self.config.get("roster_cap", 53))
-        current_roster = len(self.get_team_members(interaction.guild, team_name))
+        current_roster = self.get_team_count(interaction.guild, team_name)
         if current_roster >= roster_cap:
             await interaction.response.send_message(f"{team_name} has reached the roster cap ({roster_cap}).", ephemeral=True)
             return
@@ -194,14 +339,14 @@ class TransactionsCog(commands.Cog):
 
     @app_commands.command(name="offer", description="Make an offer to a player.")
     @app_commands.describe(player="The player to offer a contract to")
+    @roster_ready()
     async def offer(self, interaction: discord.Interaction, player: discord.Member):
         # Check if user has required roles from setup
         if not self.has_required_roles(interaction):
             await interaction.response.send_message("❌ You don't have permission to make offers. Please contact an administrator to configure roles via `/setup`.", ephemeral=True)
             return
 
-        draft_data = load_draft()
-        if draft_data.get("draft_active", False):
+        if get_draft_registry().is_active(interaction.guild.id):
             await interaction.response.send_message("Offers are disabled during an active draft.", ephemeral=True)
             return
 
@@ -220,75 +365,24 @@ class TransactionsCog(commands.Cog):
             return
 
         roster_cap = int(self.config.get("roster_cap", 53))
-        current_roster = len(self.get_team_members(interaction.guild, team_name))
+        current_roster = self.get_team_count(interaction.guild, team_name)
         if current_roster >= roster_cap:
             await interaction.response.send_message(f"{team_name} has reached the roster cap ({roster_cap}).", ephemeral=True)
             return
 
-        class OfferView(discord.ui.View):
-            def __init__(self, bot, player, team_role, team_name, team_emoji, coach_role):
-                super().__init__(timeout=86400)  # 24 hours
-                self.bot = bot
-                self.player = player
-                self.team_role = team_role
-                self.team_name = team_name
-                self.team_emoji = team_emoji
-                self.coach_role = coach_role
-
-            async def on_timeout(self):
-                self.stop()
-
-            @discord.ui.button(label="Accept", style=discord.ButtonStyle.green)
-            async def accept_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-                if interaction.user != self.player:
-                    await interaction.response.send_message("Only the offered player can accept.", ephemeral=True)
-                    return
-                try:
-                    await self.player.add_roles(self.team_role)
-                    current_roster = len(self.bot.get_cog("TransactionsCog").get_team_members(interaction.guild, self.team_name))
-                    embed = discord.Embed(
-                        title="Offer Accepted",
-                        description=f"{self.player.mention} has accepted the offer to join {self.team_emoji} {self.team_name}",
-                        color=discord.Color.green(),
-                        timestamp=discord.utils.utcnow()
-                    )
-                    if interaction.guild.icon:
-                        embed.set_author(name=interaction.guild.name, icon_url=interaction.guild.icon.url)
-                    embed.add_field(name="Coach:", value=f"{self.coach_role} {interaction.user.mention}", inline=False)
-                    embed.add_field(name="Roster:", value=f"{current_roster}/{roster_cap}", inline=False)
-                    if self.team_emoji:
-                        embed.set_thumbnail(url=self.team_emoji)  # Full-size team emoji
-                    # Send to transactions channel from guild-specific setup
-                    guild_config = self.bot.get_cog("TransactionsCog").get_guild_config(interaction.guild.id)
-                    transactions_channel_id = guild_config.get("channels", {}).get("transactions")
-                    if transactions_channel_id:
-                        transactions_channel = interaction.guild.get_channel(int(transactions_channel_id))
-                        if transactions_channel:
-                            await transactions_channel.send(embed=embed)
-                    await interaction.response.send_message("Contract accepted!", ephemeral=True)
-                    await self.bot.get_cog("TransactionsCog").log_action(
-                        interaction.guild,
-                        "Contract Accepted",
-                        f"{self.player.display_name} joined {self.team_name}"
-                    )
-                    self.stop()
-                except discord.errors.HTTPException as e:
-                    await interaction.response.send_message(f"Failed to accept contract: {e}", ephemeral=True)
-
-            @discord.ui.button(label="Decline", style=discord.ButtonStyle.red)
-            async def decline_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-                if interaction.user != self.player:
-                    await interaction.response.send_message("Only the offered player can decline.", ephemeral=True)
-                    return
-                await interaction.response.send_message("Contract declined.", ephemeral=True)
-                await self.bot.get_cog("TransactionsCog").log_action(
-                    interaction.guild,
-                    "Contract Declined",
-                    f"{self.player.display_name} declined {self.team_name}"
-                )
-                self.stop()
-
-        view = OfferView(self.bot, player, team_role, team_name, team_emoji, self.get_franchise_role(interaction.user))
+        action_id = get_pending_actions().create("offer", {
+            "guild_id": interaction.guild.id,
+            "player_id": player.id,
+            "coach_id": interaction.user.id,
+            "coach_role": self.get_franchise_role(interaction.user),
+            "team_name": team_name,
+            "team_emoji": team_emoji,
+            "roster_cap": roster_cap
+        }, ttl=PENDING_TTL)
+        view = get_component_router(self.bot).make_view("offer", action_id, [
+            ("accept", "Accept", discord.ButtonStyle.green),
+            ("decline", "Decline", discord.ButtonStyle.red)
+        ])
         embed = discord.Embed(
             title="Contract Offer",
             description=f"{player.mention}, you have received a contract offer from {team_emoji} {team_name}.",
@@ -305,6 +399,7 @@ class TransactionsCog(commands.Cog):
     @app_commands.command(name="demand", description="Demand a player be removed from your team.")
     @app_commands.checks.has_any_role("General Manager", "Head Coach", "Assistant Coach")
     @app_commands.describe(player="The player to demand removal from")
+    @roster_ready()
     async def demand(self, interaction: discord.Interaction, player: discord.Member):
         team_role, team_name, team_emoji = self.get_team_info(interaction.user)
         if not team_role:
@@ -325,7 +420,7 @@ class TransactionsCog(commands.Cog):
             roles_to_remove = [r for r in player.roles if r.name in franchise_roles]
             if roles_to_remove:
                 await player.remove_roles(*roles_to_remove)
-            current_roster = len(self.get_team_members(interaction.guild, team_name))
+            current_roster = self.get_team_count(interaction.guild, team_name)
             embed = discord.Embed(
                 title="Demand Successful",
                 description=f"{player.mention} has demanded from {team_emoji} {team_name}",
@@ -454,9 +549,9 @@ class TransactionsCog(commands.Cog):
     @app_commands.checks.has_any_role("Franchise Owner", "General Manager", "Head Coach", "Assistant Coach")
     @app_commands.describe(offered_player="The player you are offering", targeted_team="The team to trade with", targeted_player="The player you want")
     @app_commands.autocomplete(targeted_team=team_autocomplete)
+    @roster_ready()
     async def trade(self, interaction: discord.Interaction, offered_player: discord.Member, targeted_team: str, targeted_player: discord.Member):
-        draft_data = load_draft()
-        if draft_data.get("draft_active", False):
+        if get_draft_registry().is_active(interaction.guild.id):
             await interaction.response.send_message("Trades are disabled during an active draft.", ephemeral=True)
             return
 
@@ -481,8 +576,8 @@ class TransactionsCog(commands.Cog):
             return
 
         roster_cap = int(self.config.get("roster_cap", 53))
-        user_roster = len(self.get_team_members(interaction.guild, user_team))
-        targeted_roster = len(self.get_team_members(interaction.guild, targeted_team))
+        user_roster = self.get_team_count(interaction.guild, user_team)
+        targeted_roster = self.get_team_count(interaction.guild, targeted_team)
         if user_roster >= roster_cap or targeted_roster >= roster_cap:
             await interaction.response.send_message("One or both teams are at roster cap.", ephemeral=True)
             return
@@ -499,102 +594,35 @@ class TransactionsCog(commands.Cog):
         embed.add_field(name=f"{team_emoji} {user_team} Offers", value=offered_player.mention, inline=False)
         embed.add_field(name=f"{target_team_emoji} {targeted_team} Offers", value=targeted_player.mention, inline=False)
 
-        class TradeView(discord.ui.View):
-            def __init__(self, bot, user_team, targeted_team, offered_player, targeted_player, team_emoji, target_team_emoji):
-                super().__init__(timeout=86400)  # 24 hours
-                self.bot = bot
-                self.user_team = user_team
-                self.targeted_team = targeted_team
-                self.offered_player = offered_player
-                self.targeted_player = targeted_player
-                self.team_emoji = team_emoji
-                self.target_team_emoji = target_team_emoji
-                self.user_fo = discord.utils.get(interaction.guild.roles, name="Franchise Owner")
-                self.target_fo = None
-
-            async def start(self):
-                target_team_role = discord.utils.get(interaction.guild.roles, name=self.targeted_team)
-                self.target_fo = None
-                for member in interaction.guild.members:
-                    if self.user_fo in member.roles and target_team_role in member.roles:
-                        self.target_fo = member
-                        break
-                if not self.target_fo:
-                    await interaction.followup.send("No Franchise Owner found for the targeted team.", ephemeral=True)
-                    self.stop()
-                    return
-                thread = await interaction.channel.create_thread(
-                    name=f"Trade: {self.user_team} vs {self.targeted_team}",
-                    message=await interaction.original_response(),
-                    auto_archive_duration=60
-                )
-                await thread.send(content=f"{interaction.user.mention} {self.target_fo.mention}", embed=embed)
-
-            @discord.ui.button(label="Approve", style=discord.ButtonStyle.green)
-            async def approve_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-                if interaction.user not in [interaction.user, self.target_fo]:
-                    await interaction.response.send_message("Only the proposing or target Franchise Owner can approve.", ephemeral=True)
-                    return
-                if interaction.user == interaction.user and self.user_team_approved:
-                    await interaction.response.send_message("You have already approved this trade.", ephemeral=True)
-                    return
-                if interaction.user == self.target_fo and self.target_team_approved:
-                    await interaction.response.send_message("You have already approved this trade.", ephemeral=True)
-                    return
-
-                if interaction.user == interaction.user:
-                    self.user_team_approved = True
-                else:
-                    self.target_team_approved = True
-
-                if self.user_team_approved and self.target_team_approved:
-                    user_team_role = discord.utils.get(interaction.guild.roles, name=self.user_team)
-                    targeted_team_role = discord.utils.get(interaction.guild.roles, name=self.targeted_team)
-                    try:
-                        await self.offered_player.remove_roles(user_team_role)
-                        await self.offered_player.add_roles(targeted_team_role)
-                        await self.targeted_player.remove_roles(targeted_team_role)
-                        await self.targeted_player.add_roles(user_team_role)
-                        embed.title = "Trade Accepted"
-                        embed.color = discord.Color.green()
-                        embed.description = f"{self.target_team_emoji} {self.targeted_team} has accepted a trade from {self.team_emoji} {self.user_team}"
-                        embed.add_field(name=f"{self.team_emoji} {self.user_team} Receives", value=self.targeted_player.mention, inline=False)
-                        embed.add_field(name=f"{self.target_team_emoji} {self.targeted_team} Receives", value=self.offered_player.mention, inline=False)
-                        await interaction.message.edit(embed=embed, view=None)
-                        transactions_channel_id = self.bot.get_cog("TransactionsCog").config.get("transactions_channel")
-                        transactions_channel = interaction.guild.get_channel(int(transactions_channel_id)) if transactions_channel_id else interaction.channel
-                        await transactions_channel.send(embed=embed)
-                        await interaction.response.send_message("Trade completed!", ephemeral=True)
-                        await self.bot.get_cog("TransactionsCog").log_action(
-                            interaction.guild,
-                            "Trade Completed",
-                            f"{self.offered_player.display_name} to {self.targeted_team}, {self.targeted_player.display_name} to {self.user_team}"
-                        )
-                    except discord.errors.HTTPException as e:
-                        await interaction.response.send_message(f"Failed to execute trade: {e}", ephemeral=True)
-                else:
-                    await interaction.response.send_message("Trade approved. Waiting for other team.", ephemeral=True)
-
-            @discord.ui.button(label="Reject", style=discord.ButtonStyle.red)
-            async def reject_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-                if interaction.user not in [interaction.user, self.target_fo]:
-                    await interaction.response.send_message("Only the proposing or target Franchise Owner can reject.", ephemeral=True)
-                    return
-                embed.title = "Trade Rejected"
-                embed.description += f"\nRejected by {interaction.user.mention}"
-                embed.color = discord.Color.red()
-                await interaction.message.edit(embed=embed, view=None)
-                await interaction.response.send_message("Trade rejected.", ephemeral=True)
-                await self.bot.get_cog("TransactionsCog").log_action(
-                    interaction.guild,
-                    "Trade Rejected",
-                    f"Rejected by {interaction.user.display_name}"
-                )
-                self.stop()
-
-        view = TradeView(self.bot, user_team, targeted_team, offered_player, targeted_player, team_emoji, target_team_emoji)
-        await view.start()
+        user_fo = discord.utils.get(interaction.guild.roles, name="Franchise Owner")
+        target_fo = get_roster_index(self.bot).first_with_all(interaction.guild, user_fo, targeted_team_role)
+        if not target_fo:
+            await interaction.response.send_message("No Franchise Owner found for the targeted team.", ephemeral=True)
+            return
+
+        action_id = get_pending_actions().create("trade", {
+            "guild_id": interaction.guild.id,
+            "proposer_id": interaction.user.id,
+            "target_fo_id": target_fo.id,
+            "user_team": user_team,
+            "targeted_team": targeted_team,
+            "offered_player_id": offered_player.id,
+            "targeted_player_id": targeted_player.id,
+            "team_emoji": team_emoji,
+            "target_team_emoji": target_team_emoji,
+            "approved_by": []
+        }, ttl=PENDING_TTL)
+        view = get_component_router(self.bot).make_view("trade", action_id, [
+            ("approve", "Approve", discord.ButtonStyle.green),
+            ("reject", "Reject", discord.ButtonStyle.red)
+        ])
         await interaction.response.send_message("Trade proposal started in a thread!", ephemeral=True)
+        thread = await interaction.channel.create_thread(
+            name=f"Trade: {user_team} vs {targeted_team}",
+            type=discord.ChannelType.public_thread,
+            auto_archive_duration=60
+        )
+        await thread.send(content=f"{interaction.user.mention} {target_fo.mention}", embed=embed, view=view)
         await self.log_action(
             interaction.guild,
             "Trade Proposed",
@@ -606,6 +634,7 @@ class TransactionsCog(commands.Cog):
 
     @app_commands.command(name="release", description="Release a player from your team.")
     @app_commands.describe(player="The player to release")
+    @roster_ready()
     async def release(self, interaction: discord.Interaction, player: discord.Member):
         # Check if user has required roles from setup
         if not self.has_required_roles(interaction):
@@ -627,7 +656,7 @@ class TransactionsCog(commands.Cog):
                 staff_to_remove = [r for r in player.roles if r.name in franchise_roles]
                 if staff_to_remove:
                     await player.remove_roles(*staff_to_remove)
-                current_roster = len(self.get_team_members(interaction.guild, team_name))
+                current_roster = self.get_team_count(interaction.guild, team_name)
                 coach_role = self.get_franchise_role(interaction.user)
                 embed = discord.Embed(
                     title="Release Successful",
@@ -0,0 +1,158 @@
+import secrets
+import time
+import discord
+from utils.persistence import get_write_behind
+from utils.roster_index import get_roster_index
+from utils.timers import get_timer_service
+
+ACTIONS_FILE = "config/pending_actions.json"
+PREFIX = "lb"
+
+
+class PendingActions:
+    """Persisted state for buttons that outlive a single interaction.
+
+    Each pending offer, trade or report is a small JSON record keyed by a short
+    random ID; the ID is what goes into the button's custom_id. Records carry
+    an optional expiry; expired records are dropped by a timer when they come
+    due, and also as they are touched and on load.
+    """
+
+    def __init__(self, path=ACTIONS_FILE):
+        self.path = path
+        self._actions = None
+        get_timer_service().register("pending_action", self._expire)
+
+    def _load(self):
+        if self._actions is None:
+            self._actions = get_write_behind().load(self.path, {})
+            if self._prune():
+                self._persist()
+        return self._actions
+
+    def _prune(self):
+        now = time.time()
+        expired = [
+            action_id for action_id, record in self._actions.items()
+            if record.get("expires") and record["expires"] <= now
+        ]
+        for action_id in expired:
+            del self._actions[action_id]
+        return bool(expired)
+
+    def _persist(self):
+        get_write_behind().save(self.path, self._actions)
+
+    def create(self, kind, data, ttl=None):
+        """Store a record and return its action ID."""
+        actions = self._load()
+        action_id = secrets.token_hex(6)
+        while action_id in actions:
+            action_id = secrets.token_hex(6)
+        actions[action_id] = {
+            "kind": kind,
+            "data": data,
+            "expires": time.time() + ttl if ttl else None
+        }
+        self._persist()
+        if ttl:
+            get_timer_service().schedule("pending_action", actions[action_id]["expires"], {"id": action_id}, f"action:{action_id}")
+        return action_id
+
+    def get(self, action_id):
+        """Return the data for a live action, or None if it is gone or expired."""
+        actions = self._load()
+        record = actions.get(action_id)
+        if record is None:
+            return None
+        if record.get("expires") and record["expires"] <= time.time():
+            self.delete(action_id)
+            return None
+        return record["data"]
+
+    def update(self, action_id, data):
+        actions = self._load()
+        if action_id in actions:
+            actions[action_id]["data"] = data
+            self._persist()
+
+    def delete(self, action_id):
+        actions = self._load()
+        if actions.pop(action_id, None) is not None:
+            self._persist()
+            get_timer_service().cancel(f"action:{action_id}")
+
+    async def _expire(self, data):
+        self.delete(data["id"])
+
+
+class ComponentRouter:
+    """Dispatches button clicks by custom_id instead of by live View objects.
+
+    Buttons are built with a custom_id of "lb:<kind>:<button>:<key>", and the
+    View they come from is stopped before it is sent so discord.py does not
+    keep it. Cogs register one handler per kind at load time; because the
+    handler is looked up from the custom_id, buttons keep working after a
+    restart and nothing is held in memory per message.
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+        self._handlers = {}
+        get_pending_actions()  # registers the expiry timer handler before timers start
+        bot.add_listener(self.on_interaction, "on_interaction")
+
+    def register(self, kind, handler):
+        """Route clicks for kind to handler(interaction, button, key)."""
+        self._handlers[kind] = handler
+
+    @staticmethod
+    def custom_id(kind, button, key):
+        return f"{PREFIX}:{kind}:{button}:{key}"
+
+    def make_view(self, kind, key, buttons):
+        """Build a View of (button, label, style) buttons for a registered kind."""
+        view = discord.ui.View(timeout=None)
+        for button, label, style in buttons:
+            view.add_item(discord.ui.Button(label=label, style=style, custom_id=self.custom_id(kind, button, key)))
+        view.stop()
+        return view
+
+    async def on_interaction(self, interaction: discord.Interaction):
+        if interaction.type != discord.InteractionType.component:
+            return
+        custom_id = (interaction.data or {}).get("custom_id", "")
+        parts = custom_id.split(":", 3)
+        if len(parts) != 4 or parts[0] != PREFIX:
+            return
+        _, kind, button, key = parts
+        handler = self._handlers.get(kind)
+        if handler is None:
+            return
+        try:
+            get_roster_index(self.bot).start(interaction.guild)
+            await handler(interaction, button, key)
+        except Exception as e:
+            print(f"Error handling {custom_id}: {e}")
+            if not interaction.response.is_done():
+                await interaction.response.send_message("Something went wrong handling that button.", ephemeral=True)
+
+
+_pending_actions = None
+_component_router = None
+
+
+def get_pending_actions():
+    """Return the shared pending-action store."""
+    global _pending_actions
+    if _pending_actions is None:
+        _pending_actions = PendingActions()
+    return _pending_actions
+
+
+def get_component_router(bot):
+    """Return the shared component router, creating it on first use."""
+    global _component_router
+    if _component_router is None:
+        _component_router = ComponentRouter(bot)
+    return _component_router
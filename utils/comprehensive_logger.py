@@ -0,0 +1,185 @@
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+import discord
+
+LOG_DB_PATH = "data/logs.db"
+
+
+class ComprehensiveLogger:
+    """Append-only activity log for every guild the bot is in.
+
+    The log_* methods only put an entry on an in-memory queue; a background
+    task writes queued entries to SQLite in batches from a worker thread, so
+    logging never holds up the command that produced it. Entries are indexed
+    by guild together with category, user and timestamp, and reads page
+    backwards through them with an ID cursor.
+    """
+
+    def __init__(self, bot, db_path=LOG_DB_PATH, batch_size=200):
+        self.bot = bot
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self._queue = []
+        self._wakeup = None
+        self._writer = None
+        self._db_lock = threading.Lock()
+        self._write_lock = None
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self._db_lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS logs ("
+                " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+                " guild_id INTEGER NOT NULL,"
+                " category TEXT NOT NULL,"
+                " action TEXT NOT NULL,"
+                " details TEXT NOT NULL,"
+                " user_id INTEGER,"
+                " user_name TEXT,"
+                " timestamp REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_logs_guild ON logs (guild_id, id)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_logs_category ON logs (guild_id, category, id)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_logs_user ON logs (guild_id, user_id, id)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_logs_time ON logs (guild_id, timestamp)")
+
+    # Writing
+
+    def _enqueue(self, guild, category, action, details, user=None):
+        if guild is None:
+            return
+        self._queue.append((
+            guild.id,
+            category,
+            action,
+            str(details),
+            user.id if user else None,
+            str(user) if user else None,
+            time.time()
+        ))
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._write(self._drain())
+            return
+        if self._writer is None or self._writer.done():
+            self._wakeup = asyncio.Event()
+            self._write_lock = asyncio.Lock()
+            self._writer = loop.create_task(self._run_writer())
+        if len(self._queue) >= self.batch_size:
+            self._wakeup.set()
+
+    def _drain(self):
+        rows, self._queue = self._queue, []
+        return rows
+
+    def _write(self, rows):
+        if not rows:
+            return
+        with self._db_lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO logs (guild_id, category, action, details, user_id, user_name, timestamp)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+
+    async def _run_writer(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=2.0)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    async def flush(self):
+        """Write every queued entry now."""
+        if self._write_lock is None:
+            self._write(self._drain())
+            return
+        async with self._write_lock:
+            rows = self._drain()
+            if rows:
+                try:
+                    await asyncio.to_thread(self._write, rows)
+                except sqlite3.Error as e:
+                    print(f"Failed to write {len(rows)} log entries: {e}")
+
+    async def log_command_usage(self, interaction: discord.Interaction):
+        command = interaction.command.qualified_name if interaction.command else (interaction.data or {}).get("name", "unknown")
+        options = (interaction.data or {}).get("options", [])
+        details = ", ".join(f"{o.get('name')}={o.get('value')}" for o in options if "value" in o) or "No options"
+        channel = getattr(interaction.channel, "name", None)
+        if channel:
+            details += f" (#{channel})"
+        self._enqueue(interaction.guild, "COMMAND", f"/{command}", details, interaction.user)
+
+    async def log_bot_event(self, guild: discord.Guild, event_type: str, message: str):
+        self._enqueue(guild, "BOT_EVENT", event_type, message)
+
+    async def log_team_creation(self, guild: discord.Guild, team_name: str, user, emoji=None):
+        self._enqueue(guild, "TEAM", "TEAM_CREATED", f"Team: {team_name}, Emoji: {emoji}", user)
+
+    # Reading
+
+    def _select(self, guild_id, category=None, user_id=None, since=None, until=None, before_id=None, limit=20):
+        clauses = ["guild_id = ?"]
+        params = [guild_id]
+        if category:
+            clauses.append("category = ?")
+            params.append(category)
+        if user_id:
+            clauses.append("user_id = ?")
+            params.append(user_id)
+        if since is not None:
+            clauses.append("timestamp >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("timestamp < ?")
+            params.append(until)
+        if before_id:
+            clauses.append("id < ?")
+            params.append(before_id)
+        params.append(limit)
+        with self._db_lock:
+            rows = self._conn.execute(
+                "SELECT id, category, action, details, user_id, user_name, timestamp FROM logs"
+                f" WHERE {' AND '.join(clauses)} ORDER BY id DESC LIMIT ?",
+                params
+            ).fetchall()
+        return [
+            {
+                "id": row[0],
+                "category": row[1],
+                "action": row[2],
+                "details": row[3],
+                "user": {"id": row[4], "name": row[5]} if row[4] else {},
+                "timestamp": time.strftime("%Y-%m-%d %H:%M:%S UTC", time.gmtime(row[6]))
+            }
+            for row in rows
+        ]
+
+    async def query(self, guild_id, category=None, user_id=None, since=None, until=None, before_id=None, limit=20):
+        """Return (entries newest first, cursor for the next page or None)."""
+        await self.flush()
+        entries = await asyncio.to_thread(self._select, guild_id, category, user_id, since, until, before_id, limit + 1)
+        if len(entries) > limit:
+            return entries[:limit], entries[limit - 1]["id"]
+        return entries, None
+
+
+_comprehensive_logger = None
+
+
+def get_comprehensive_logger(bot):
+    """Return the shared comprehensive logger, creating it on first use."""
+    global _comprehensive_logger
+    if _comprehensive_logger is None:
+        _comprehensive_logger = ComprehensiveLogger(bot)
+    return _comprehensive_logger
@@ -0,0 +1,93 @@
+import json
+import os
+from utils.persistence import get_write_behind
+
+CONFIG_DIR = "config"
+
+
+class ConfigStore:
+    """In-memory cache of the league configuration files.
+
+    Each file is read from disk the first time it is requested and served from
+    memory afterwards. Saves update the cache and hand the file to the
+    write-behind writer, so every cog sees the same dict objects and never
+    re-parses on a read.
+    """
+
+    def __init__(self, config_dir=CONFIG_DIR):
+        self.config_dir = config_dir
+        self._global = None
+        self._guilds = {}
+        self.global_version = 0
+        self.guild_versions = {}
+
+    def _global_file(self):
+        return os.path.join(self.config_dir, "setup.json")
+
+    def _guild_file(self, guild_id):
+        return os.path.join(self.config_dir, f"setup_{guild_id}.json")
+
+    def _read(self, path):
+        try:
+            return get_write_behind().load(path, {})
+        except (json.JSONDecodeError, ValueError):
+            print(f"Config file {path} is malformed, using empty config")
+            return {}
+
+    def _write(self, path, data):
+        get_write_behind().save(path, data)
+
+    def get_global(self):
+        """Return the shared config/setup.json dict."""
+        if self._global is None:
+            self._global = self._read(self._global_file())
+        return self._global
+
+    def save_global(self, config=None):
+        """Replace (if given) and persist the shared config."""
+        if config is not None and config is not self._global:
+            if self._global is None:
+                self._global = config
+            else:
+                # Keep the cached object stable so cogs holding a reference stay current
+                self._global.clear()
+                self._global.update(config)
+        self.global_version += 1
+        self._write(self._global_file(), self.get_global())
+
+    def has_guild(self, guild_id):
+        """Whether a setup file exists for this guild."""
+        guild_id = str(guild_id)
+        if guild_id in self._guilds:
+            return bool(self._guilds[guild_id])
+        return get_write_behind().exists(self._guild_file(guild_id))
+
+    def get_guild(self, guild_id):
+        """Return the config/setup_{guild_id}.json dict for a guild."""
+        guild_id = str(guild_id)
+        config = self._guilds.get(guild_id)
+        if config is None:
+            config = self._read(self._guild_file(guild_id))
+            self._guilds[guild_id] = config
+        return config
+
+    def save_guild(self, guild_id, config=None):
+        """Replace (if given) and persist a guild's config."""
+        guild_id = str(guild_id)
+        cached = self.get_guild(guild_id)
+        if config is not None and config is not cached:
+            cached.clear()
+            cached.update(config)
+        self.guild_versions[guild_id] = self.guild_versions.get(guild_id, 0) + 1
+        self._write(self._guild_file(guild_id), cached)
+
+
+_config_store = None
+
+
+def get_config_store():
+    """Return the process-wide config store."""
+    global _config_store
+    if _config_store is None:
+        _config_store = ConfigStore()
+    return _config_store
@@ -0,0 +1,165 @@
+from utils.config_store import get_config_store
+from utils.persistence import get_write_behind
+
+DRAFT_FILE = "config/draft.json"
+LEGACY_KEY = "legacy"
+
+
+def idle_draft(picks=None):
+    """Return the state of a guild with no draft running."""
+    return {
+        "draft_active": False,
+        "draft_paused": False,
+        "current_round": 0,
+        "current_pick": 0,
+        "draft_order": [],
+        "autopick_settings": {},
+        "picks": picks or []
+    }
+
+
+class DraftRegistry:
+    """Per-guild draft state, kept in memory and persisted as {guild_id: state}.
+
+    draft.json used to hold a single draft for every guild. A file in that
+    shape is kept under LEGACY_KEY on load. If setup.json configures exactly
+    one guild the draft is moved to it straight away; otherwise it waits for
+    an admin to claim it with claim_legacy(). Reads never move it.
+    """
+
+    def __init__(self, path=DRAFT_FILE):
+        self.path = path
+        self._drafts = None
+        self._active = set()
+
+    def _load(self):
+        if self._drafts is not None:
+            return self._drafts
+        data = get_write_behind().load(self.path, {})
+        if "draft_active" in data:
+            data = {LEGACY_KEY: data}
+        self._drafts = data
+        self._active = {
+            guild_id for guild_id, state in data.items()
+            if guild_id != LEGACY_KEY and state.get("draft_active", False)
+        }
+        if LEGACY_KEY in data:
+            guilds = [key for key in get_config_store().get_global() if key.isdigit()]
+            if len(guilds) == 1 and guilds[0] not in data:
+                self.claim_legacy(guilds[0])
+                print(f"Assigned legacy draft to guild: {guilds[0]}")
+            else:
+                print("Legacy draft found, waiting for /claimlegacydraft")
+        return self._drafts
+
+    def has_legacy(self):
+        return LEGACY_KEY in self._load()
+
+    def claim_legacy(self, guild_id):
+        """Move the pre-upgrade draft to a guild, replacing its state. Returns it, or None."""
+        guild_id = str(guild_id)
+        drafts = self._load()
+        legacy = drafts.pop(LEGACY_KEY, None)
+        if legacy is None:
+            return None
+        drafts[guild_id] = legacy
+        if legacy.get("draft_active", False):
+            self._active.add(guild_id)
+        else:
+            self._active.discard(guild_id)
+        self._persist()
+        return legacy
+
+    def _persist(self):
+        get_write_behind().save(self.path, self._drafts)
+
+    def get(self, guild_id):
+        """Return the draft state for a guild (an idle state if it never drafted)."""
+        guild_id = str(guild_id)
+        drafts = self._load()
+        state = drafts.get(guild_id)
+        if state is None:
+            state = idle_draft()
+            drafts[guild_id] = state
+        return state
+
+    def is_active(self, guild_id):
+        """Whether a draft is running in this guild."""
+        self._load()
+        return str(guild_id) in self._active
+
+    def save(self, guild_id, state=None):
+        """Replace (if given) and persist a guild's draft state."""
+        guild_id = str(guild_id)
+        drafts = self._load()
+        if state is None:
+            state = self.get(guild_id)
+        drafts[guild_id] = state
+        if state.get("draft_active", False):
+            self._active.add(guild_id)
+        else:
+            self._active.discard(guild_id)
+        self._persist()
+        return state
+
+    def start(self, guild_id, rounds, picks_per_round, draft_order, teams):
+        """Begin a draft in a guild and return its state."""
+        return self.save(guild_id, {
+            "draft_active": True,
+            "draft_paused": False,
+            "current_round": 1,
+            "current_pick": 1,
+            "total_rounds": rounds,
+            "picks_per_round": picks_per_round,
+            "draft_order": draft_order,
+            "autopick_settings": {team: [] for team in teams},
+            "picks": []
+        })
+
+    def end(self, guild_id):
+        """Stop a guild's draft, keeping the picks made so far."""
+        return self.save(guild_id, idle_draft(self.get(guild_id).get("picks", [])))
+
+    def set_paused(self, guild_id, paused):
+        state = self.get(guild_id)
+        state["draft_paused"] = paused
+        return self.save(guild_id, state)
+
+    @staticmethod
+    def current_index(state):
+        """Index into draft_order of the team on the clock."""
+        return (state["current_round"] - 1) * state["picks_per_round"] + state["current_pick"] - 1
+
+    def record_pick(self, guild_id, team, player):
+        """Record a pick, advance the clock and finish the draft after the last round."""
+        state = self.get(guild_id)
+        pick = {
+            "round": state["current_round"],
+            "pick": state["current_pick"],
+            "team": team,
+            "player": player.display_name,
+            "player_id": str(player.id)
+        }
+        state["picks"].append(pick)
+
+        state["current_pick"] += 1
+        if state["current_pick"] > state["picks_per_round"]:
+            state["current_round"] += 1
+            state["current_pick"] = 1
+        if state["current_round"] > state["total_rounds"]:
+            state["draft_active"] = False
+            state["draft_paused"] = False
+
+        self.save(guild_id, state)
+        return pick
+
+
+_draft_registry = None
+
+
+def get_draft_registry():
+    """Return the shared per-guild draft registry."""
+    global _draft_registry
+    if _draft_registry is None:
+        _draft_registry = DraftRegistry()
+    return _draft_registry
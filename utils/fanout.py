@@ -0,0 +1,17 @@
+import asyncio
+
+
+async def bounded_gather(factories, limit=4):
+    """Run coroutine factories with at most `limit` in flight.
+
+    Each factory is a zero-argument callable returning a coroutine, so nothing
+    starts before a slot is free. Results come back in input order; a failed
+    job's slot holds its exception instead of cancelling the others.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(factory):
+        async with semaphore:
+            return await factory()
+
+    return await asyncio.gather(*(run(factory) for factory in factories), return_exceptions=True)
@@ -0,0 +1,196 @@
+from array import array
+from utils.standings import get_standings
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; stats fall back to a plain loop
+    np = None
+
+NO_SCORE = -1
+
+
+class GameColumns:
+    """One guild's results as parallel typed arrays, one entry per game.
+
+    Teams are stored as indices into `teams`; a missing score is NO_SCORE,
+    a missing week -1, `season` is the season the game counted towards,
+    and `outcome` is 1 for a home win, -1 for an away win and 0 for a tie.
+    """
+
+    def __init__(self):
+        self.teams = []
+        self.index = {}
+        self.home = array("i")
+        self.away = array("i")
+        self.home_score = array("i")
+        self.away_score = array("i")
+        self.outcome = array("b")
+        self.week = array("i")
+        self.season = array("i")
+        self.timestamp = array("d")
+        self.last_id = None
+
+    def __len__(self):
+        return len(self.home)
+
+    def team_index(self, team):
+        if team not in self.index:
+            self.index[team] = len(self.teams)
+            self.teams.append(team)
+        return self.index[team]
+
+    def append(self, game):
+        self.home.append(self.team_index(game["home"]))
+        self.away.append(self.team_index(game["away"]))
+        scored = game.get("home_score") is not None and game.get("away_score") is not None
+        self.home_score.append(game["home_score"] if scored else NO_SCORE)
+        self.away_score.append(game["away_score"] if scored else NO_SCORE)
+        winner = game.get("winner")
+        self.outcome.append(0 if winner is None else 1 if winner == game["home"] else -1)
+        self.week.append(game["week"] if game.get("week") is not None else -1)
+        self.season.append(game.get("season", 1))
+        self.timestamp.append(game.get("reported_at", 0.0))
+        self.last_id = game["id"]
+
+
+def _longest_run(flags):
+    best = run = 0
+    for flag in flags:
+        run = run + 1 if flag else 0
+        best = max(best, run)
+    return best
+
+
+class GameLog:
+    """Columnar view of the standings game log for season statistics.
+
+    The standings log stays the one place results are written; this keeps a
+    typed-array copy per guild that is extended as games are reported and
+    rebuilt only if the log stops matching it (a result was removed). Team
+    stats are computed with whole-column NumPy passes over the arrays, or a
+    single loop when NumPy is not installed.
+    """
+
+    def __init__(self):
+        self._columns = {}
+
+    def columns(self, guild_id):
+        guild_id = str(guild_id)
+        games = get_standings().games(guild_id)
+        columns = self._columns.get(guild_id)
+        if columns is None or len(columns) > len(games) or (len(columns) and games[len(columns) - 1]["id"] != columns.last_id):
+            columns = GameColumns()
+            self._columns[guild_id] = columns
+        for game in games[len(columns):]:
+            columns.append(game)
+        return columns
+
+    def team_stats(self, guild_id, team, season=None):
+        """Aggregates for one team over a season (default the current one), or None if it has no games."""
+        columns = self.columns(guild_id)
+        team_index = columns.index.get(team)
+        if team_index is None:
+            return None
+        standings = get_standings()
+        season = season or standings.current_season(guild_id)
+        pct = [standings.record(guild_id, name, season).pct for name in columns.teams]
+        if np is not None:
+            return self._stats_numpy(columns, team_index, pct, season)
+        return self._stats_loop(columns, team_index, pct, season)
+
+    @staticmethod
+    def _summary(results, points_for, points_against, scored_games, longest_win_streak, strength_of_schedule, weeks):
+        """Build the stats dict; results is the team's +1/-1/0 sequence in game order."""
+        streak = 0
+        for result in reversed(results):
+            if result == 0 or (streak and (result > 0) != (streak > 0)):
+                break
+            streak += 1 if result > 0 else -1
+        return {
+            "games": len(results),
+            "wins": sum(1 for r in results if r > 0),
+            "losses": sum(1 for r in results if r < 0),
+            "ties": sum(1 for r in results if r == 0),
+            "points_per_game": points_for / scored_games if scored_games else None,
+            "allowed_per_game": points_against / scored_games if scored_games else None,
+            "average_margin": (points_for - points_against) / scored_games if scored_games else None,
+            "longest_win_streak": longest_win_streak,
+            "current_streak": streak,
+            "strength_of_schedule": strength_of_schedule,
+            "last_five": "".join("W" if r > 0 else "L" if r < 0 else "T" for r in results[-5:]),
+            "weeks": weeks
+        }
+
+    def _stats_numpy(self, columns, team_index, pct, season):
+        home = np.frombuffer(columns.home, dtype=np.intc)
+        away = np.frombuffer(columns.away, dtype=np.intc)
+        home_score = np.frombuffer(columns.home_score, dtype=np.intc)
+        away_score = np.frombuffer(columns.away_score, dtype=np.intc)
+        outcome = np.frombuffer(columns.outcome, dtype=np.int8)
+        week = np.frombuffer(columns.week, dtype=np.intc)
+        in_season = np.frombuffer(columns.season, dtype=np.intc) == season
+
+        at_home = (home == team_index) & in_season
+        played = at_home | ((away == team_index) & in_season)
+        if not played.any():
+            return None
+        at_home = at_home[played]
+        result = np.where(at_home, outcome[played], -outcome[played])
+        scored = np.where(at_home, home_score[played], away_score[played])
+        allowed = np.where(at_home, away_score[played], home_score[played])
+        has_score = (scored != NO_SCORE) & (allowed != NO_SCORE)
+        opponents = np.where(at_home, away[played], home[played])
+        weeks = week[played]
+
+        # Win runs are the gaps between rising and falling edges of the win mask
+        edges = np.diff(np.concatenate(([0], (result > 0).astype(np.int8), [0])))
+        runs = np.flatnonzero(edges == -1) - np.flatnonzero(edges == 1)
+        return self._summary(
+            result.tolist(),
+            int(scored[has_score].sum()),
+            int(allowed[has_score].sum()),
+            int(has_score.sum()),
+            int(runs.max()) if runs.size else 0,
+            float(np.asarray(pct)[opponents].mean()) if opponents.size else None,
+            np.unique(weeks[weeks >= 0]).tolist()
+        )
+
+    def _stats_loop(self, columns, team_index, pct, season):
+        results, opponents_pct, weeks = [], [], set()
+        points_for = points_against = scored_games = 0
+        for i in range(len(columns)):
+            if columns.season[i] != season:
+                continue
+            if columns.home[i] == team_index:
+                sign, own, other, opponent = 1, columns.home_score[i], columns.away_score[i], columns.away[i]
+            elif columns.away[i] == team_index:
+                sign, own, other, opponent = -1, columns.away_score[i], columns.home_score[i], columns.home[i]
+            else:
+                continue
+            results.append(sign * columns.outcome[i])
+            if own != NO_SCORE and other != NO_SCORE:
+                points_for += own
+                points_against += other
+                scored_games += 1
+            opponents_pct.append(pct[opponent])
+            if columns.week[i] >= 0:
+                weeks.add(columns.week[i])
+        if not results:
+            return None
+        return self._summary(
+            results, points_for, points_against, scored_games,
+            _longest_run(result > 0 for result in results),
+            sum(opponents_pct) / len(opponents_pct) if opponents_pct else None,
+            sorted(weeks)
+        )
+
+
+_game_log = None
+
+
+def get_game_log():
+    """Return the shared columnar game log."""
+    global _game_log
+    if _game_log is None:
+        _game_log = GameLog()
+    return _game_log
@@ -0,0 +1,138 @@
+from utils.persistence import get_write_behind
+
+GAMES_FILE = "game_registry.json"
+
+
+class GameRegistry:
+    """Every scheduled game, stored per guild and indexed for direct lookup.
+
+    A game record holds the two teams, its week (None for one-off games), the
+    kickoff time, the matchup thread, the gametime message, voice channel IDs
+    and the assigned streamer and referee. In-memory indexes map
+    (guild, team, week) and (guild, thread or message ID) to a game ID, so
+    commands and button handlers find a game without scanning channels.
+    """
+
+    def __init__(self, path=GAMES_FILE):
+        self.path = path
+        self._data = None
+        self._by_team_week = {}
+        self._by_team = {}
+        self._by_ref = {}
+
+    def _load(self):
+        if self._data is None:
+            self._data = get_write_behind().load(self.path, {})
+            for guild_id, guild_data in self._data.items():
+                for game in guild_data.get("games", {}).values():
+                    self._index(guild_id, game)
+        return self._data
+
+    def _persist(self):
+        get_write_behind().save(self.path, self._data)
+
+    def _refs(self, game):
+        return [ref for ref in (game.get("thread_id"), game.get("message_id")) if ref]
+
+    def _index(self, guild_id, game):
+        for team in (game["home"], game["away"]):
+            self._by_team.setdefault((guild_id, team), set()).add(game["id"])
+            if game.get("week") is not None:
+                self._by_team_week[(guild_id, team, game["week"])] = game["id"]
+        for ref in self._refs(game):
+            self._by_ref[(guild_id, ref)] = game["id"]
+
+    def _unindex(self, guild_id, game):
+        for team in (game["home"], game["away"]):
+            self._by_team.get((guild_id, team), set()).discard(game["id"])
+            if game.get("week") is not None and self._by_team_week.get((guild_id, team, game["week"])) == game["id"]:
+                del self._by_team_week[(guild_id, team, game["week"])]
+        for ref in self._refs(game):
+            if self._by_ref.get((guild_id, ref)) == game["id"]:
+                del self._by_ref[(guild_id, ref)]
+
+    def _games(self, guild_id):
+        return self._load().setdefault(str(guild_id), {"next_id": 1, "games": {}})
+
+    def add(self, guild_id, home, away, week=None, **fields):
+        """Register a game and return its record."""
+        guild_id = str(guild_id)
+        guild_data = self._games(guild_id)
+        game_id = str(guild_data["next_id"])
+        guild_data["next_id"] += 1
+        game = {
+            "id": game_id,
+            "home": home,
+            "away": away,
+            "week": week,
+            "kickoff": None,
+            "thread_id": None,
+            "message_id": None,
+            "channel_id": None,
+            "voice_ids": [],
+            "streamer_id": None,
+            "referee_id": None,
+            "status": "scheduled"
+        }
+        game.update(fields)
+        guild_data["games"][game_id] = game
+        self._index(guild_id, game)
+        self._persist()
+        return game
+
+    def update(self, guild_id, game, **fields):
+        """Change fields on a game, keeping the indexes in step."""
+        guild_id = str(guild_id)
+        self._unindex(guild_id, game)
+        game.update(fields)
+        self._index(guild_id, game)
+        self._persist()
+        return game
+
+    def remove(self, guild_id, game):
+        guild_id = str(guild_id)
+        self._unindex(guild_id, game)
+        self._games(guild_id)["games"].pop(game["id"], None)
+        self._persist()
+
+    def get(self, guild_id, game_id):
+        return self._games(guild_id)["games"].get(str(game_id))
+
+    def by_team_week(self, guild_id, team, week):
+        """The game a team plays in a week, or None."""
+        self._load()
+        game_id = self._by_team_week.get((str(guild_id), team, week))
+        return self.get(guild_id, game_id) if game_id else None
+
+    def by_ref(self, guild_id, ref_id):
+        """The game whose thread or gametime message has this ID, or None."""
+        self._load()
+        game_id = self._by_ref.get((str(guild_id), ref_id))
+        return self.get(guild_id, game_id) if game_id else None
+
+    def find(self, guild_id, team1, team2, week=None, statuses=("scheduled",)):
+        """The game between two teams (in a week, or the latest one whose status is in statuses)."""
+        if week is not None:
+            game = self.by_team_week(guild_id, team1, week)
+            return game if game and {game["home"], game["away"]} == {team1, team2} else None
+        self._load()
+        matches = [
+            self.get(guild_id, game_id)
+            for game_id in self._by_team.get((str(guild_id), team1), ())
+        ]
+        matches = [
+            game for game in matches
+            if game and game["status"] in statuses and {game["home"], game["away"]} == {team1, team2}
+        ]
+        return max(matches, key=lambda game: int(game["id"]), default=None)
+
+
+_game_registry = None
+
+
+def get_game_registry():
+    """Return the shared game registry."""
+    global _game_registry
+    if _game_registry is None:
+        _game_registry = GameRegistry()
+    return _game_registry
@@ -0,0 +1,96 @@
+import asyncio
+import discord
+
+MAX_EMBEDS = 10  # Discord's per-message embed limit
+MAX_CHARS = 6000  # Discord's combined embed size limit per message
+
+
+class LogSink:
+    """Batches log embeds per channel so logging never waits on Discord.
+
+    post() only appends to the channel's queue. A queue is flushed after
+    `delay` seconds or as soon as it holds a full message worth of embeds,
+    with up to ten embeds per message and messages sent in posting order.
+    """
+
+    def __init__(self, bot, delay=2.0):
+        self.bot = bot
+        self.delay = delay
+        self._queues = {}
+        self._channels = {}
+        self._timers = {}
+        self._locks = {}
+        self._flushes = set()
+
+    def post(self, channel, embed: discord.Embed):
+        """Queue an embed for a logs channel."""
+        queue = self._queues.setdefault(channel.id, [])
+        self._channels[channel.id] = channel
+        queue.append(embed)
+        if len(queue) >= MAX_EMBEDS:
+            timer = self._timers.pop(channel.id, None)
+            if timer:
+                timer.cancel()
+            task = asyncio.create_task(self.flush(channel.id))
+            self._flushes.add(task)
+            task.add_done_callback(self._flush_done)
+        elif channel.id not in self._timers:
+            self._timers[channel.id] = asyncio.create_task(self._flush_later(channel.id))
+
+    def _flush_done(self, task):
+        self._flushes.discard(task)
+        if not task.cancelled() and task.exception():
+            print(f"Log flush failed: {task.exception()}")
+
+    async def _flush_later(self, channel_id):
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            return
+        self._timers.pop(channel_id, None)
+        await self.flush(channel_id)
+
+    @staticmethod
+    def _batches(embeds):
+        batch, size = [], 0
+        for embed in embeds:
+            embed_size = len(embed)
+            if batch and (len(batch) >= MAX_EMBEDS or size + embed_size > MAX_CHARS):
+                yield batch
+                batch, size = [], 0
+            batch.append(embed)
+            size += embed_size
+        if batch:
+            yield batch
+
+    async def flush(self, channel_id):
+        """Send everything queued for a channel."""
+        lock = self._locks.setdefault(channel_id, asyncio.Lock())
+        async with lock:
+            embeds = self._queues.pop(channel_id, [])
+            channel = self._channels.get(channel_id)
+            if not embeds or channel is None:
+                return
+            for batch in self._batches(embeds):
+                try:
+                    await channel.send(embeds=batch)
+                except discord.HTTPException as e:
+                    print(f"Failed to send {len(batch)} log embed(s) to {channel_id}: {e}")
+
+    async def flush_all(self):
+        for timer in list(self._timers.values()):
+            timer.cancel()
+        self._timers.clear()
+        await asyncio.gather(*self._flushes, return_exceptions=True)
+        await asyncio.gather(*(self.flush(channel_id) for channel_id in list(self._queues)))
+
+
+_log_sink = None
+
+
+def get_log_sink(bot):
+    """Return the shared log sink, creating it on first use."""
+    global _log_sink
+    if _log_sink is None:
+        _log_sink = LogSink(bot)
+    return _log_sink
@@ -0,0 +1,118 @@
+import asyncio
+import sqlite3
+from utils.storage import get_storage_backend
+
+_MISSING = object()
+
+
+class WriteBehind:
+    """Debounced, atomic writer in front of the storage backend.
+
+    save() records the latest object for a path and arms a short timer; every
+    save to the same path inside the window collapses into one write. The
+    object is encoded on the event loop when the timer fires (so the snapshot
+    is consistent) and the backend write runs in a worker thread, one at a time
+    per path. Outside a running loop save() writes immediately.
+
+    An object stays pending until its write succeeds, so load() never falls
+    back to an older file mid-write and a failed write is retried by the
+    next flush instead of being dropped.
+    """
+
+    def __init__(self, delay=1.0, backend=None):
+        self.delay = delay
+        self.backend = backend or get_storage_backend()
+        self._pending = {}
+        self._generations = {}
+        self._timers = {}
+        self._locks = {}
+
+    def save(self, path, data):
+        """Schedule data to be written to path."""
+        self._pending[path] = data
+        self._generations[path] = self._generations.get(path, 0) + 1
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._write_now(path)
+            return
+        if path not in self._timers:
+            self._timers[path] = loop.create_task(self._flush_later(path))
+
+    def pending(self, path, default=None):
+        """Return the not-yet-written object for path, if any."""
+        return self._pending.get(path, default)
+
+    def exists(self, path):
+        """Whether path has been stored or has a write pending."""
+        return path in self._pending or self.backend.exists(path)
+
+    def load(self, path, default=None):
+        """Read path from storage, preferring a pending write over what is stored."""
+        data = self._pending.get(path, _MISSING)
+        if data is not _MISSING:
+            return data
+        return self.backend.read(path, default)
+
+    def _written(self, path, generation):
+        # Only clear the entry if nothing was saved to path while it was being written
+        if self._generations.get(path) == generation:
+            self._pending.pop(path, None)
+
+    def _write_now(self, path):
+        data = self._pending.get(path, _MISSING)
+        if data is not _MISSING:
+            generation = self._generations.get(path)
+            self.backend.write(path, self.backend.encode(path, data))
+            self._written(path, generation)
+
+    async def _flush_later(self, path):
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            return
+        finally:
+            self._timers.pop(path, None)
+        await self.flush(path)
+
+    async def flush(self, path):
+        """Write any pending data for path now."""
+        data = self._pending.get(path, _MISSING)
+        if data is _MISSING:
+            return
+        generation = self._generations.get(path)
+        payload = self.backend.encode(path, data)
+        lock = self._locks.setdefault(path, asyncio.Lock())
+        async with lock:
+            try:
+                await asyncio.to_thread(self.backend.write, path, payload)
+            except (OSError, sqlite3.Error) as e:
+                print(f"Failed to write {path}, keeping it queued: {e}")
+                return
+        self._written(path, generation)
+
+    async def flush_all(self):
+        """Cancel pending timers and write everything that is queued."""
+        for timer in list(self._timers.values()):
+            timer.cancel()
+        self._timers.clear()
+        await asyncio.gather(*(self.flush(path) for path in list(self._pending)))
+
+    def flush_sync(self):
+        """Write everything that is queued from outside the event loop."""
+        for path in list(self._pending):
+            try:
+                self._write_now(path)
+            except (OSError, sqlite3.Error) as e:
+                print(f"Failed to write {path}: {e}")
+
+
+_write_behind = None
+
+
+def get_write_behind():
+    """Return the shared write-behind writer."""
+    global _write_behind
+    if _write_behind is None:
+        _write_behind = WriteBehind()
+    return _write_behind
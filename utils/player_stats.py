@@ -0,0 +1,191 @@
+import codecs
+import csv
+import hashlib
+import heapq
+import aiohttp
+from utils.persistence import get_write_behind
+
+STATS_FILE = "player_stats.json"
+TOP_K = 10
+
+# Leaderboard category -> (stat column, label)
+LEADER_STATS = {
+    "QB": ("pass_yds", "Passing Yards"),
+    "WR": ("rec_yds", "Receiving Yards"),
+    "DB": ("def_int", "Interceptions"),
+    "DE": ("sacks", "Sacks"),
+}
+
+# Numeric columns that identify a row rather than count anything; never summed
+ID_COLUMNS = {"id", "number", "jersey", "jersey_number", "no", "week", "season", "year", "game", "date", "age"}
+
+
+def _column(name):
+    return name.strip().lower().replace(" ", "_")
+
+
+def _is_stat(column):
+    return column not in ID_COLUMNS and not column.endswith("_id")
+
+
+def _number(value):
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return int(number) if number.is_integer() else number
+
+
+class StatImport:
+    """Accumulates one CSV upload as per-player deltas.
+
+    Bytes are fed chunk by chunk as the file downloads and parsed a line at a
+    time (quoted fields may not span lines), so memory grows with the number
+    of players in the file rather than its length. Nothing touches the
+    season totals until PlayerStats.commit() is called with the finished import.
+    """
+
+    def __init__(self):
+        self.header = None
+        self.deltas = {}
+        self.rows = 0
+        self.skipped = 0
+        self._hash = hashlib.sha256()
+        self._partial = ""
+        self._decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+
+    @property
+    def digest(self):
+        return self._hash.hexdigest()
+
+    def feed(self, chunk, final=False):
+        """Feed raw bytes; complete lines are parsed, a trailing partial line is kept."""
+        self._hash.update(chunk)
+        text = self._partial + self._decoder.decode(chunk, final)
+        lines = text.split("\n")
+        self._partial = "" if final else lines.pop()
+        self.feed_lines([line for line in lines if line.strip()])
+
+    def feed_lines(self, lines):
+        for row in csv.reader(lines):
+            if self.header is None:
+                self.header = [_column(name) for name in row]
+                if "player" not in self.header:
+                    raise ValueError("CSV needs a 'player' column.")
+                continue
+            self.rows += 1
+            record = dict(zip(self.header, row))
+            player = (record.get("player") or "").strip()
+            if not player:
+                self.skipped += 1
+                continue
+            entry = self.deltas.setdefault(player.lower(), {"name": player, "team": None, "position": None, "stats": {}})
+            if record.get("team"):
+                entry["team"] = record["team"].strip()
+            if record.get("position"):
+                entry["position"] = record["position"].strip().upper()
+            for column, value in record.items():
+                if column in ("player", "team", "position") or not _is_stat(column):
+                    continue
+                number = _number(value)
+                if number is not None:
+                    entry["stats"][column] = entry["stats"].get(column, 0) + number
+
+
+async def stream_csv(url, stat_import, chunk_size=65536):
+    """Download a CSV in chunks and feed it to a StatImport."""
+    async with aiohttp.ClientSession() as session:
+        async with session.get(url) as response:
+            response.raise_for_status()
+            async for chunk in response.content.iter_chunked(chunk_size):
+                stat_import.feed(chunk)
+    stat_import.feed(b"", final=True)
+
+
+class PlayerStats:
+    """Season stat totals per guild with a top-k heap per stat.
+
+    Totals live in player_stats.json keyed by guild. Each stat keeps a min-heap
+    of its TOP_K best (total, player) pairs; committing an import only touches
+    the heaps of the stats it changed, and because imported stats only add to
+    totals, a heap stays exact by updating its members in place and letting a
+    new total displace the smallest. A negative correction to a listed player
+    rebuilds that heap from the totals. Leaderboards read the heaps, never the history.
+    """
+
+    def __init__(self, path=STATS_FILE):
+        self.path = path
+        self._data = None
+        self._heaps = {}
+
+    def _load(self):
+        if self._data is None:
+            self._data = get_write_behind().load(self.path, {})
+        return self._data
+
+    def _guild(self, guild_id):
+        return self._load().setdefault(str(guild_id), {"players": {}, "imports": []})
+
+    def _rebuild(self, guild_id, stat):
+        players = self._guild(guild_id)["players"]
+        heap = heapq.nlargest(TOP_K, (
+            (player["stats"][stat], key)
+            for key, player in players.items() if stat in player["stats"]
+        ))
+        heapq.heapify(heap)
+        self._heaps.setdefault(str(guild_id), {})[stat] = heap
+        return heap
+
+    def _heap(self, guild_id, stat):
+        heap = self._heaps.get(str(guild_id), {}).get(stat)
+        return heap if heap is not None else self._rebuild(guild_id, stat)
+
+    def _offer(self, guild_id, stat, key, total, increased):
+        heap = self._heap(guild_id, stat)
+        for i, (_, member) in enumerate(heap):
+            if member == key:
+                if not increased:
+                    self._rebuild(guild_id, stat)
+                    return
+                heap[i] = (total, key)
+                heapq.heapify(heap)
+                return
+        if len(heap) < TOP_K:
+            heapq.heappush(heap, (total, key))
+        elif (total, key) > heap[0]:
+            heapq.heapreplace(heap, (total, key))
+
+    def already_imported(self, guild_id, digest):
+        return digest in self._guild(guild_id)["imports"]
+
+    def commit(self, guild_id, stat_import):
+        """Add an import's deltas to the season totals. Returns the number of players touched."""
+        guild = self._guild(guild_id)
+        for key, delta in stat_import.deltas.items():
+            player = guild["players"].setdefault(key, {"name": delta["name"], "team": None, "position": None, "stats": {}})
+            player["name"] = delta["name"]
+            player["team"] = delta["team"] or player["team"]
+            player["position"] = delta["position"] or player["position"]
+            for stat, amount in delta["stats"].items():
+                player["stats"][stat] = player["stats"].get(stat, 0) + amount
+                self._offer(guild_id, stat, key, player["stats"][stat], amount >= 0)
+        guild["imports"].append(stat_import.digest)
+        get_write_behind().save(self.path, self._data)
+        return len(stat_import.deltas)
+
+    def leaders(self, guild_id, stat, limit=5):
+        """[(player name, team, total)] for a stat, best first; players without a positive total are left out."""
+        players = self._guild(guild_id)["players"]
+        top = [entry for entry in sorted(self._heap(guild_id, stat), reverse=True) if entry[0] > 0][:limit]
+        return [(players[key]["name"], players[key].get("team"), total) for total, key in top]
+
+
+_player_stats = None
+
+
+def get_player_stats():
+    """Return the shared player stat store."""
+    global _player_stats
+    if _player_stats is None:
+        _player_stats = PlayerStats()
+    return _player_stats
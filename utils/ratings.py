@@ -0,0 +1,161 @@
+import math
+from utils.standings import get_standings
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; recomputes fall back to a plain loop
+    np = None
+
+BASE_RATING = 1500.0
+K_FACTOR = 20.0
+HOME_ADVANTAGE = 0.0  # Elo points; games are played online, so no home edge by default
+
+
+def expected_score(rating, opponent):
+    return 1.0 / (1.0 + 10 ** ((opponent - rating) / 400.0))
+
+
+def mov_multiplier(margin, winner_diff):
+    """Margin-of-victory multiplier, damped when the favourite wins big."""
+    if margin is None:
+        return 1.0
+    return math.log(abs(margin) + 1) * 2.2 / (winner_diff * 0.001 + 2.2)
+
+
+def _outcome(game):
+    if game.get("winner") is None:
+        return 0.5
+    return 1.0 if game["winner"] == game["home"] else 0.0
+
+
+def _margin(game):
+    if game.get("home_score") is None or game.get("away_score") is None:
+        return None
+    return game["home_score"] - game["away_score"]
+
+
+class Ratings:
+    """Elo ratings per guild, fed from the standings game log.
+
+    Ratings cover the current season only, so they match the records shown
+    beside them: every team starts a season at BASE_RATING. Each new result
+    is applied once as it is reported (margin of victory scales the update),
+    and the power-ranking order is cached until the next change. If the log
+    no longer extends what was applied, e.g. a result was removed, or a new
+    season has begun, the guild is recomputed from scratch: games are split
+    into rounds in which no team plays twice and each round is applied as one
+    vectorised NumPy step (a plain loop when NumPy is not installed).
+    """
+
+    def __init__(self):
+        self._ratings = {}
+        self._applied = {}
+        self._rankings = {}
+
+    def _sync(self, guild_id):
+        guild_id = str(guild_id)
+        standings = get_standings()
+        games = standings.games(guild_id)
+        season = standings.current_season(guild_id)
+        applied = self._applied.get(guild_id)
+        if (applied is None or applied[0] != season or applied[1] > len(games)
+                or (applied[1] and games[applied[1] - 1]["id"] != applied[2])):
+            self.recompute(guild_id)
+            return
+        if applied[1] < len(games):
+            ratings = self._ratings[guild_id]
+            for game in games[applied[1]:]:
+                if game.get("season", 1) == season:
+                    self._apply(ratings, game)
+            self._applied[guild_id] = (season, len(games), games[-1]["id"])
+            self._rankings.pop(guild_id, None)
+
+    @staticmethod
+    def _apply(ratings, game):
+        home, away = game["home"], game["away"]
+        home_rating = ratings.get(home, BASE_RATING)
+        away_rating = ratings.get(away, BASE_RATING)
+        outcome = _outcome(game)
+        diff = home_rating + HOME_ADVANTAGE - away_rating
+        expected = expected_score(home_rating + HOME_ADVANTAGE, away_rating)
+        winner_diff = diff if outcome == 1.0 else -diff if outcome == 0.0 else 0.0
+        multiplier = mov_multiplier(_margin(game), winner_diff) if outcome != 0.5 else 1.0
+        delta = K_FACTOR * multiplier * (outcome - expected)
+        ratings[home] = home_rating + delta
+        ratings[away] = away_rating - delta
+
+    @staticmethod
+    def _rounds(games):
+        """Split games, in order, into runs where no team appears twice."""
+        rounds, current, busy = [], [], set()
+        for game in games:
+            if game["home"] in busy or game["away"] in busy:
+                rounds.append(current)
+                current, busy = [], set()
+            current.append(game)
+            busy.update((game["home"], game["away"]))
+        if current:
+            rounds.append(current)
+        return rounds
+
+    def recompute(self, guild_id):
+        """Rebuild a guild's ratings from the current season's games."""
+        guild_id = str(guild_id)
+        standings = get_standings()
+        log = standings.games(guild_id)
+        season = standings.current_season(guild_id)
+        games = [game for game in log if game.get("season", 1) == season]
+        if np is None or not games:
+            ratings = {}
+            for game in games:
+                self._apply(ratings, game)
+        else:
+            teams = sorted({team for game in games for team in (game["home"], game["away"])})
+            index = {team: i for i, team in enumerate(teams)}
+            values = np.full(len(teams), BASE_RATING)
+            for batch in self._rounds(games):
+                home = np.array([index[game["home"]] for game in batch])
+                away = np.array([index[game["away"]] for game in batch])
+                outcome = np.array([_outcome(game) for game in batch])
+                margin = np.array([_margin(game) if _margin(game) is not None else np.nan for game in batch])
+                diff = values[home] + HOME_ADVANTAGE - values[away]
+                expected = 1.0 / (1.0 + 10 ** (-diff / 400.0))
+                winner_diff = np.where(outcome == 1.0, diff, -diff)
+                multiplier = np.where(
+                    np.isnan(margin) | (outcome == 0.5),
+                    1.0,
+                    np.log(np.abs(np.nan_to_num(margin)) + 1) * 2.2 / (winner_diff * 0.001 + 2.2)
+                )
+                delta = K_FACTOR * multiplier * (outcome - expected)
+                # No team repeats inside a round, so plain fancy-index updates are safe
+                values[home] += delta
+                values[away] -= delta
+            ratings = {team: float(values[i]) for team, i in index.items()}
+        self._ratings[guild_id] = ratings
+        self._applied[guild_id] = (season, len(log), log[-1]["id"] if log else None)
+        self._rankings.pop(guild_id, None)
+
+    def rating(self, guild_id, team):
+        self._sync(guild_id)
+        return self._ratings[str(guild_id)].get(team, BASE_RATING)
+
+    def rankings(self, guild_id):
+        """Teams with their ratings, best first (cached between results)."""
+        guild_id = str(guild_id)
+        self._sync(guild_id)
+        ranking = self._rankings.get(guild_id)
+        if ranking is None:
+            ranking = sorted(self._ratings[guild_id].items(), key=lambda item: (-item[1], item[0].lower()))
+            self._rankings[guild_id] = ranking
+        return ranking
+
+
+_ratings = None
+
+
+def get_ratings():
+    """Return the shared rating engine."""
+    global _ratings
+    if _ratings is None:
+        _ratings = Ratings()
+    return _ratings
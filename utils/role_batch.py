@@ -0,0 +1,119 @@
+import asyncio
+import time
+import discord
+
+
+class RoleBatch:
+    """A set of role additions and removals, grouped by member."""
+
+    def __init__(self, guild: discord.Guild, reason=None):
+        self.guild = guild
+        self.reason = reason
+        self._members = {}
+        self._adds = {}
+        self._removes = {}
+
+    def _track(self, member):
+        self._members[member.id] = member
+        return self._adds.setdefault(member.id, set()), self._removes.setdefault(member.id, set())
+
+    def add(self, member: discord.Member, *roles: discord.Role):
+        adds, removes = self._track(member)
+        for role in roles:
+            if role:
+                adds.add(role.id)
+                removes.discard(role.id)
+
+    def remove(self, member: discord.Member, *roles: discord.Role):
+        adds, removes = self._track(member)
+        for role in roles:
+            if role:
+                removes.add(role.id)
+                adds.discard(role.id)
+
+    def __len__(self):
+        return len(self._members)
+
+    def edits(self):
+        """Yield (member, new_roles) for every member whose roles actually change."""
+        for member_id, member in self._members.items():
+            current = {role.id for role in member.roles if not role.is_default()}
+            target = (current - self._removes[member_id]) | self._adds[member_id]
+            if target != current:
+                roles = [r for r in (self.guild.get_role(role_id) for role_id in target) if r]
+                yield member, roles
+
+
+class RoleExecutor:
+    """Applies role batches with one member edit per member.
+
+    Member edits share one rate-limit bucket per guild, so each guild gets its
+    own semaphore: a disband in one league never starves another, and the
+    number of in-flight requests stays under what the bucket refills.
+    """
+
+    def __init__(self, concurrency=5, progress_interval=2.0):
+        self.concurrency = concurrency
+        self.progress_interval = progress_interval
+        self._semaphores = {}
+
+    def _semaphore(self, guild_id):
+        semaphore = self._semaphores.get(guild_id)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.concurrency)
+            self._semaphores[guild_id] = semaphore
+        return semaphore
+
+    async def apply(self, batch: RoleBatch, progress=None):
+        """Apply a batch. Returns a list of (member, error) for edits that failed.
+
+        progress, if given, is awaited as progress(done, total) at most every
+        progress_interval seconds and once at the end.
+        """
+        edits = list(batch.edits())
+        total = len(edits)
+        semaphore = self._semaphore(batch.guild.id)
+        failures = []
+        done = 0
+        last_report = time.monotonic()
+
+        async def edit(member, roles):
+            nonlocal done, last_report
+            async with semaphore:
+                try:
+                    await member.edit(roles=roles, reason=batch.reason)
+                except discord.HTTPException as e:
+                    failures.append((member, e))
+            done += 1
+            if progress and done < total and time.monotonic() - last_report >= self.progress_interval:
+                last_report = time.monotonic()
+                try:
+                    await progress(done, total)
+                except discord.HTTPException:
+                    pass
+
+        await asyncio.gather(*(edit(member, roles) for member, roles in edits))
+        if progress and total:
+            try:
+                await progress(total, total)
+            except discord.HTTPException:
+                pass
+        return failures
+
+
+def interaction_progress(interaction: discord.Interaction, label):
+    """Progress callback that edits a deferred interaction's response."""
+    async def report(done, total):
+        await interaction.edit_original_response(content=f"{label}: {done}/{total} members updated")
+    return report
+
+
+_role_executor = None
+
+
+def get_role_executor():
+    """Return the shared role executor."""
+    global _role_executor
+    if _role_executor is None:
+        _role_executor = RoleExecutor()
+    return _role_executor
@@ -0,0 +1,184 @@
+import asyncio
+import discord
+from discord import app_commands
+
+
+class RosterIndex:
+    """Per-guild index of role ID -> member IDs.
+
+    The index for a guild is built from the member cache the first time it is
+    needed and then kept current from member gateway events, so roster lookups
+    cost O(team size) and roster counts O(1) instead of a scan of guild.members.
+
+    Guilds are not chunked at startup. start() requests a guild's member list
+    in the background without waiting; commands that read rosters either
+    refuse until it has arrived (roster_ready) or, once deferred, wait for
+    it with wait_chunked().
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+        self._guilds = {}
+        self._chunking = {}
+        bot.add_listener(self.on_member_update, "on_member_update")
+        bot.add_listener(self.on_member_join, "on_member_join")
+        bot.add_listener(self.on_member_remove, "on_member_remove")
+        bot.add_listener(self.on_guild_role_delete, "on_guild_role_delete")
+        bot.add_listener(self.on_guild_remove, "on_guild_remove")
+
+    def _build(self, guild: discord.Guild):
+        index = {}
+        for member in guild.members:
+            for role in member.roles:
+                if not role.is_default():
+                    index.setdefault(role.id, set()).add(member.id)
+        return index
+
+    def _index(self, guild: discord.Guild):
+        index = self._guilds.get(guild.id)
+        if index is None:
+            index = self._build(guild)
+            # An unchunked guild only has a partial member cache; don't pin that
+            if guild.chunked:
+                self._guilds[guild.id] = index
+        return index
+
+    def start(self, guild: discord.Guild):
+        """Begin loading a guild's full member list, if needed, without waiting for it."""
+        if guild is None or guild.chunked:
+            return None
+        task = self._chunking.get(guild.id)
+        if task is None:
+            task = asyncio.create_task(self._chunk(guild))
+            self._chunking[guild.id] = task
+        return task
+
+    def ready(self, guild: discord.Guild):
+        """Whether a guild's rosters are complete; starts loading them if not."""
+        return self.start(guild) is None
+
+    async def wait_chunked(self, guild: discord.Guild, timeout=30.0):
+        """Wait up to `timeout` seconds for a guild's member list. Returns whether it is complete.
+
+        Only for interactions that have already been deferred.
+        """
+        task = self.start(guild)
+        if task is not None:
+            try:
+                await asyncio.wait_for(asyncio.shield(task), timeout)
+            except asyncio.TimeoutError:
+                pass
+        return guild is None or guild.chunked
+
+    async def _chunk(self, guild: discord.Guild):
+        try:
+            await guild.chunk()
+        except (discord.HTTPException, discord.ClientException) as e:
+            print(f"Failed to chunk members for {guild.id}: {e}")
+        finally:
+            self._chunking.pop(guild.id, None)
+            self.invalidate(guild.id)
+
+    def invalidate(self, guild_id=None):
+        """Drop the index for one guild, or for every guild."""
+        if guild_id is None:
+            self._guilds.clear()
+        else:
+            self._guilds.pop(guild_id, None)
+
+    def member_ids(self, guild: discord.Guild, role: discord.Role):
+        """Return the set of member IDs holding a role (do not mutate)."""
+        if role is None:
+            return set()
+        return self._index(guild).get(role.id, set())
+
+    def members(self, guild: discord.Guild, role: discord.Role):
+        """Return the members holding a role."""
+        members = []
+        for member_id in self.member_ids(guild, role):
+            member = guild.get_member(member_id)
+            if member:
+                members.append(member)
+        return members
+
+    def count(self, guild: discord.Guild, role: discord.Role):
+        """Return the number of members holding a role."""
+        return len(self.member_ids(guild, role))
+
+    def members_with_all(self, guild: discord.Guild, *roles: discord.Role):
+        """Return the members holding every one of the given roles."""
+        if not roles or any(role is None for role in roles):
+            return []
+        id_sets = sorted((self.member_ids(guild, role) for role in roles), key=len)
+        common = set(id_sets[0]).intersection(*id_sets[1:])
+        return [m for m in (guild.get_member(member_id) for member_id in common) if m]
+
+    def first_with_all(self, guild: discord.Guild, *roles: discord.Role):
+        """Return one member holding every given role, or None."""
+        matches = self.members_with_all(guild, *roles)
+        return matches[0] if matches else None
+
+    async def on_member_update(self, before: discord.Member, after: discord.Member):
+        index = self._guilds.get(after.guild.id)
+        if index is None:
+            return
+        before_ids = {role.id for role in before.roles}
+        after_ids = {role.id for role in after.roles}
+        if before_ids == after_ids:
+            return
+        for role_id in before_ids - after_ids:
+            members = index.get(role_id)
+            if members:
+                members.discard(after.id)
+        for role_id in after_ids - before_ids:
+            if role_id != after.guild.id:
+                index.setdefault(role_id, set()).add(after.id)
+
+    async def on_member_join(self, member: discord.Member):
+        index = self._guilds.get(member.guild.id)
+        if index is None:
+            return
+        for role in member.roles:
+            if not role.is_default():
+                index.setdefault(role.id, set()).add(member.id)
+
+    async def on_member_remove(self, member: discord.Member):
+        index = self._guilds.get(member.guild.id)
+        if index is None:
+            return
+        for role in member.roles:
+            members = index.get(role.id)
+            if members:
+                members.discard(member.id)
+
+    async def on_guild_role_delete(self, role: discord.Role):
+        index = self._guilds.get(role.guild.id)
+        if index is not None:
+            index.pop(role.id, None)
+
+    async def on_guild_remove(self, guild: discord.Guild):
+        self.invalidate(guild.id)
+
+
+class RosterNotReady(app_commands.CheckFailure):
+    """Raised by roster_ready() while a guild's member list is still loading."""
+
+
+def roster_ready():
+    """App command check that refuses, without waiting, until the guild's rosters are loaded."""
+    async def predicate(interaction: discord.Interaction):
+        if get_roster_index(interaction.client).ready(interaction.guild):
+            return True
+        raise RosterNotReady("This server's member list is still loading. Please try again in a few seconds.")
+    return app_commands.check(predicate)
+
+
+_roster_index = None
+
+
+def get_roster_index(bot):
+    """Return the shared roster index, creating it on first use."""
+    global _roster_index
+    if _roster_index is None:
+        _roster_index = RosterIndex(bot)
+    return _roster_index
@@ -0,0 +1,333 @@
+import random
+import time
+
+
+def round_robin(teams, total_weeks, seed=None):
+    """Build a season of weekly matchups with the circle method.
+
+    One team stays fixed while the rest rotate a seat each week, so every pair
+    meets once per cycle before any pair meets again; longer seasons repeat
+    the cycle. With an even team count home goes, within the first cycle, to
+    whichever team of a pair has hosted less so far. With an odd count the
+    seats form a ring and in week r the team in seat r has the bye while
+    seats r+k and r-k meet, hosted by r+k for odd k and r-k for even k, so
+    every team hosts exactly half its games each cycle. Each repeat of the
+    cycle swaps home and away, so home and away counts stay within one game
+    of each other.
+
+    Returns a list of {"games": [[home, away], ...], "bye": [team, ...]}.
+    """
+    seats = list(teams)
+    random.Random(seed).shuffle(seats)
+    n = len(seats)
+    cycle = []
+    if n % 2:
+        for rotation in range(n):
+            games = []
+            for k in range(1, n // 2 + 1):
+                ahead, behind = seats[(rotation + k) % n], seats[(rotation - k) % n]
+                games.append([ahead, behind] if k % 2 else [behind, ahead])
+            cycle.append({"games": games, "bye": [seats[rotation]]})
+    else:
+        home_games = {team: 0 for team in teams}
+        last_home = {}
+        for rotation in range(max(n - 1, 1)):
+            rest = seats[1:]
+            order = seats[:1] + rest[len(rest) - rotation:] + rest[:len(rest) - rotation]
+            games = []
+            for i in range(n // 2):
+                team1, team2 = order[i], order[n - 1 - i]
+                # Fewer home games hosts; on a tie, avoid hosting twice in a row
+                key1 = (home_games[team1], last_home.get(team1, False))
+                key2 = (home_games[team2], last_home.get(team2, False))
+                home, away = (team1, team2) if key1 <= key2 else (team2, team1)
+                home_games[home] += 1
+                last_home[home] = True
+                last_home[away] = False
+                games.append([home, away])
+            cycle.append({"games": games, "bye": []})
+
+    # Later cycles replay the first with home and away swapped every other time
+    weeks = []
+    for week in range(total_weeks):
+        template = cycle[week % len(cycle)]
+        flip = (week // len(cycle)) % 2
+        weeks.append({
+            "games": [[away, home] if flip else [home, away] for home, away in template["games"]],
+            "bye": list(template["bye"])
+        })
+    return weeks
+
+
+def extend_season(season, total_weeks):
+    """Lengthen a stored season to total_weeks without changing the weeks it has.
+
+    A season drawn by round_robin with a stored seed is redrawn with that seed,
+    which reproduces its weeks and continues its cycle. Any other season (a
+    planned one, or one stored without a seed) repeats its own first
+    min(cycle, drawn) weeks, swapping home and away on each repeat.
+    """
+    weeks = season["weeks"]
+    if "seed" in season:
+        return weeks + round_robin(season["teams"], total_weeks, season["seed"])[len(weeks):]
+    if not weeks:
+        return round_robin(season["teams"], total_weeks)
+    team_count = len(season["teams"])
+    period = min(len(weeks), team_count if team_count % 2 else max(team_count - 1, 1))
+    extended = list(weeks)
+    for week in range(len(weeks), total_weeks):
+        template = weeks[week % period]
+        flip = (week // period) % 2
+        extended.append({
+            "games": [[away, home] if flip else [home, away] for home, away in template["games"]],
+            "bye": list(template["bye"])
+        })
+    return extended
+
+
+def _pair(team1, team2):
+    return (team1, team2) if team1 < team2 else (team2, team1)
+
+
+class ScheduleSolver:
+    """Builds a season that satisfies scheduling rules.
+
+    Rules: no pair meets more than max_meetings times, a pair never meets in
+    consecutive weeks, rivalries (week, team1, team2) are played in their
+    week, and teams sit out their blackout weeks.
+
+    The season is first built from the rounds of one round-robin cycle (each
+    round is a full set of pairings and every pair is in exactly one round):
+    each week gets a round, never the one used the week before, rivalry
+    weeks get the round that holds their pair, and a blacked-out team's game
+    is dropped, so its opponent has a bye. Rounds are picked to drop as few
+    games as possible. Only if that fails (conflicting rivalries, a tight
+    meeting limit) does a backtracking search run, week by week with the most
+    constrained team matched first, capped by a node budget and time_limit
+    seconds so a request never ties up a worker for long.
+    """
+
+    BYE = None
+
+    def __init__(self, teams, total_weeks, max_meetings=None, rivalries=(), blackouts=None, seed=None,
+                 budget=500000, time_limit=3.0):
+        self.teams = sorted(set(teams))
+        self.total_weeks = total_weeks
+        if len(self.teams) < 2:
+            raise ValueError("Need at least 2 teams to build a season.")
+        rounds = len(self.teams) - 1 + len(self.teams) % 2
+        self.max_meetings = max_meetings or -(-total_weeks // rounds)
+        self.blackouts = {team: set(weeks) for team, weeks in (blackouts or {}).items()}
+        self.budget = budget
+        self.time_limit = time_limit
+        # One seed drives the rounds, the hints and the tie-break order, so they agree
+        self._seed = seed if seed is not None else random.randrange(2 ** 32)
+        self._rank = {team: i for i, team in enumerate(random.Random(self._seed).sample(self.teams, len(self.teams)))}
+        self._hints = []
+        for week in round_robin(self.teams, total_weeks, self._seed):
+            hint = {}
+            for home, away in week["games"]:
+                hint[home], hint[away] = away, home
+            self._hints.append(hint)
+
+        self.rivalries = {}
+        self._rival_weeks = {}
+        for week, team1, team2 in rivalries:
+            for team in (team1, team2):
+                if team not in self._rank:
+                    raise ValueError(f"Unknown team in rivalry: {team}")
+                if week in self.blackouts.get(team, ()):
+                    raise ValueError(f"{team} has a rivalry in blackout week {week + 1}.")
+            if team1 == team2 or not 0 <= week < total_weeks:
+                raise ValueError(f"Invalid rivalry: week {week + 1}, {team1} vs {team2}")
+            games = self.rivalries.setdefault(week, [])
+            if any(team in game for game in games for team in (team1, team2)):
+                raise ValueError(f"A team has two rivalry games in week {week + 1}.")
+            games.append(_pair(team1, team2))
+            self._rival_weeks.setdefault(_pair(team1, team2), []).append(week)
+        for pair, weeks in self._rival_weeks.items():
+            weeks.sort()
+            if len(weeks) > self.max_meetings:
+                raise ValueError(f"{pair[0]} and {pair[1]} have more rivalry games than the meeting limit.")
+            if any(b - a == 1 for a, b in zip(weeks, weeks[1:])):
+                raise ValueError(f"{pair[0]} and {pair[1]} have rivalry games in back-to-back weeks.")
+
+        # Every week each free team but at most one plays, which needs this many distinct meetings
+        needed = sum(
+            sum(1 for team in self.teams if week not in self.blackouts.get(team, ())) // 2
+            for week in range(total_weeks)
+        )
+        available = len(self.teams) * (len(self.teams) - 1) // 2 * self.max_meetings
+        if needed > available:
+            raise ValueError(
+                f"{total_weeks} weeks need {needed} games but {self.max_meetings} meeting(s) per pair "
+                f"allow only {available}; raise max_meetings or shorten the season."
+            )
+
+    def _reserved(self, pair, week):
+        return sum(1 for w in self._rival_weeks.get(pair, ()) if w >= week)
+
+    def _legal(self, pair, week):
+        return (
+            self._meetings.get(pair, 0) + self._reserved(pair, week) < self.max_meetings
+            and pair not in self._previous
+            and pair not in self._next_rivals
+        )
+
+    def _week_matchings(self, week):
+        forced = self.rivalries.get(week, [])
+        busy = {team for pair in forced for team in pair}
+        free = [
+            team for team in self.teams
+            if team not in busy and week not in self.blackouts.get(team, ())
+        ]
+        hints = self._hints[week]
+        fewest_byes = min((self._byes.get(team, 0) for team in free), default=0)
+
+        def options(team, unmatched, bye_open):
+            legal = [other for other in unmatched if other != team and self._legal(_pair(team, other), week)]
+            legal.sort(key=lambda other: (hints.get(team) != other, self._meetings.get(_pair(team, other), 0), self._rank[other]))
+            if bye_open:
+                # Byes go to the teams that have had the fewest so far
+                slot = 0 if self._byes.get(team, 0) <= fewest_byes else len(legal)
+                legal.insert(slot, self.BYE)
+            return legal
+
+        def extend(unmatched, bye_open):
+            if not unmatched:
+                yield []
+                return
+            self._nodes += 1
+            if self._nodes > self.budget or time.monotonic() > self._deadline:
+                raise ValueError("No schedule found within the search limit; relax the rules.")
+            team, choices = min(
+                ((team, options(team, unmatched, bye_open)) for team in unmatched),
+                key=lambda item: len(item[1])
+            )
+            for other in choices:
+                rest = [t for t in unmatched if t != team and t != other]
+                for matching in extend(rest, bye_open and other is not self.BYE):
+                    yield [(team, other)] + matching
+
+        for matching in extend(free, len(free) % 2 == 1):
+            yield [pair for pair in forced] + matching
+
+    def _solve(self, week):
+        if week == self.total_weeks:
+            return True
+        self._next_rivals = set(self.rivalries.get(week + 1, []))
+        previous = self._previous
+        for matching in self._week_matchings(week):
+            pairs = [_pair(a, b) for a, b in matching if b is not self.BYE]
+            byes = [a for a, b in matching if b is self.BYE]
+            for pair in pairs:
+                self._meetings[pair] = self._meetings.get(pair, 0) + 1
+            for team in byes:
+                self._byes[team] = self._byes.get(team, 0) + 1
+            self._chosen.append(matching)
+            self._previous = set(pairs)
+            if self._solve(week + 1):
+                return True
+            self._previous = previous
+            self._next_rivals = set(self.rivalries.get(week + 1, []))
+            self._chosen.pop()
+            for pair in pairs:
+                self._meetings[pair] -= 1
+            for team in byes:
+                self._byes[team] -= 1
+        return False
+
+    def _from_rounds(self):
+        """Assign round-robin rounds to weeks; returns the weekly matchings or None."""
+        rounds = [
+            [_pair(home, away) for home, away in week["games"]]
+            for week in round_robin(self.teams, len(self.teams) - 1 + len(self.teams) % 2, self._seed)
+        ]
+        round_of = {pair: i for i, pairs in enumerate(rounds) for pair in pairs}
+        required = {}
+        for week, pairs in self.rivalries.items():
+            needed = {round_of[pair] for pair in pairs}
+            if len(needed) > 1:
+                return None
+            required[week] = needed.pop()
+        still_required = [0] * len(rounds)
+        for index in required.values():
+            still_required[index] += 1
+
+        used = [0] * len(rounds)
+        chosen = []
+        previous = None
+        for week in range(self.total_weeks):
+            blacked = {team for team in self.teams if week in self.blackouts.get(team, ())}
+            if week in required:
+                candidates = [required[week]]
+                still_required[required[week]] -= 1
+            else:
+                candidates = range(len(rounds))
+            best = None
+            for index in candidates:
+                if index == previous or index == required.get(week + 1):
+                    continue
+                if used[index] + 1 + still_required[index] > self.max_meetings:
+                    continue
+                dropped = sum(1 for team1, team2 in rounds[index] if team1 in blacked or team2 in blacked)
+                # Fewest dropped games, then least used, then the round-robin order
+                key = (dropped, used[index], (index - week) % len(rounds))
+                if best is None or key < best[0]:
+                    best = (key, index)
+            if best is None:
+                return None
+            index = best[1]
+            used[index] += 1
+            previous = index
+            matching = []
+            for team1, team2 in rounds[index]:
+                if team1 in blacked or team2 in blacked:
+                    matching.extend((team, self.BYE) for team in (team1, team2) if team not in blacked)
+                else:
+                    matching.append((team1, team2))
+            playing = {team for pair in matching for team in pair}
+            matching.extend((team, self.BYE) for team in self.teams if team not in playing and team not in blacked)
+            chosen.append(matching)
+        return chosen
+
+    def solve(self):
+        """Return the season in round_robin's format, or raise ValueError."""
+        self._chosen = self._from_rounds()
+        if self._chosen is None:
+            self._meetings = {}
+            self._byes = {}
+            self._previous = set()
+            self._next_rivals = set()
+            self._chosen = []
+            self._nodes = 0
+            self._deadline = time.monotonic() + self.time_limit
+            if not self._solve(0):
+                raise ValueError("These rules cannot all be satisfied.")
+
+        home_games = {team: 0 for team in self.teams}
+        last_host = {}
+        hosted_last_week = set()
+        weeks = []
+        for matching in self._chosen:
+            games = []
+            playing = set()
+            for team1, team2 in matching:
+                if team2 is self.BYE:
+                    continue
+                pair = _pair(team1, team2)
+                if pair in last_host:
+                    # Return fixture: the other team hosts
+                    home = team2 if last_host[pair] == team1 else team1
+                else:
+                    key1 = (home_games[team1], team1 in hosted_last_week)
+                    key2 = (home_games[team2], team2 in hosted_last_week)
+                    home = team1 if key1 <= key2 else team2
+                away = team2 if home == team1 else team1
+                home_games[home] += 1
+                last_host[pair] = home
+                playing.update(pair)
+                games.append([home, away])
+            hosted_last_week = {home for home, _ in games}
+            weeks.append({"games": games, "bye": [team for team in self.teams if team not in playing]})
+        return weeks
@@ -0,0 +1,365 @@
+import time
+from utils.config_store import get_config_store
+from utils.persistence import get_write_behind
+
+STANDINGS_FILE = "standings.json"
+
+
+def report_key(scope, team1, team2):
+    """Key for one game's report: its scope (game ID, week or date) and the team pair."""
+    return f"{scope}:" + "|".join(sorted((team1, team2)))
+
+
+def _season(game):
+    return game.get("season", 1)
+
+
+def _pct(wins, losses, ties):
+    games = wins + losses + ties
+    return (wins + 0.5 * ties) / games if games else 0.0
+
+
+class TeamRecord:
+    """Running totals for one team."""
+
+    __slots__ = ("team", "wins", "losses", "ties", "points_for", "points_against",
+                 "streak", "division", "conference", "head_to_head")
+
+    def __init__(self, team):
+        self.team = team
+        self.wins = self.losses = self.ties = 0
+        self.points_for = self.points_against = 0
+        self.streak = 0  # +n for n straight wins, -n for n straight losses
+        self.division = [0, 0, 0]
+        self.conference = [0, 0, 0]
+        self.head_to_head = {}
+
+    @property
+    def pct(self):
+        return _pct(self.wins, self.losses, self.ties)
+
+    @property
+    def point_diff(self):
+        return self.points_for - self.points_against
+
+    def streak_text(self):
+        if self.streak > 0:
+            return f"W{self.streak}"
+        if self.streak < 0:
+            return f"L{-self.streak}"
+        return "-"
+
+    def apply(self, opponent, result, scored, allowed, division_game, conference_game):
+        """Add one game; result is 0 for a win, 1 for a loss, 2 for a tie."""
+        if result == 0:
+            self.wins += 1
+            self.streak = self.streak + 1 if self.streak > 0 else 1
+        elif result == 1:
+            self.losses += 1
+            self.streak = self.streak - 1 if self.streak < 0 else -1
+        else:
+            self.ties += 1
+            self.streak = 0
+        if scored is not None and allowed is not None:
+            self.points_for += scored
+            self.points_against += allowed
+        if division_game:
+            self.division[result] += 1
+        if conference_game:
+            self.conference[result] += 1
+        self.head_to_head.setdefault(opponent, [0, 0, 0])[result] += 1
+
+
+class Standings:
+    """Per-guild standings built from a single log of game results.
+
+    Every reported game is appended once to standings.json, tagged with the
+    guild's current season (games logged before seasons were tracked count
+    as season 1); team records (W-L-T, points for/against, streak, division
+    and conference splits and head-to-head) are updated in place from each
+    new game, and the sorted table is recomputed once per report and cached
+    until the next one, so viewing standings is a cached read. Records are
+    rebuilt by replaying the log only when a guild is first loaded or its
+    alignment changes. Records, tables and lookups are per season and
+    default to the current one; start_season() begins the next.
+
+    Reports that carry a key (the game's scope plus the team pair, see
+    report_key) are indexed by it, so a repeated report is caught with one
+    dict lookup. A report that disagrees with the recorded result is kept on
+    the game as a conflict for an admin to settle, unless the caller asks
+    to replace it. Removing a game rebuilds the guild's records from the log.
+
+    Ties in win percentage are broken, within the tied group, by
+    head-to-head record among the tied teams, then division record,
+    conference record, point differential, points scored and name.
+    """
+
+    def __init__(self, path=STANDINGS_FILE):
+        self.path = path
+        self._data = None
+        self._records = {}
+        self._tables = {}
+        self._versions = {}
+        self._keys = {}
+
+    def _load(self):
+        if self._data is None:
+            self._data = get_write_behind().load(self.path, {})
+        return self._data
+
+    def _persist(self):
+        get_write_behind().save(self.path, self._data)
+
+    def _guild(self, guild_id):
+        guild_id = str(guild_id)
+        data = self._load()
+        if guild_id not in data:
+            data[guild_id] = {"next_id": 1, "games": [], "baseline": self._legacy_records(guild_id), "alignment": {}}
+        return data[guild_id]
+
+    @staticmethod
+    def _legacy_records(guild_id):
+        # Win/loss counts kept in config/setup.json before results were logged
+        records = get_config_store().get_global().get(guild_id, {}).get("team_records", {})
+        return {
+            team: {"wins": record.get("wins", 0), "losses": record.get("losses", 0)}
+            for team, record in records.items() if isinstance(record, dict)
+        }
+
+    def current_season(self, guild_id):
+        return self._guild(guild_id).get("season", 1)
+
+    def start_season(self, guild_id):
+        """Begin a guild's next season; new results count towards it. Returns its number."""
+        guild_id = str(guild_id)
+        guild = self._guild(guild_id)
+        guild["season"] = guild.get("season", 1) + 1
+        self._changed(guild_id)
+        self._persist()
+        return guild["season"]
+
+    def seasons(self, guild_id):
+        """Season numbers with at least one result, oldest first."""
+        return sorted({_season(game) for game in self.games(guild_id)})
+
+    def _state(self, guild_id, season=None):
+        guild_id = str(guild_id)
+        season = season or self.current_season(guild_id)
+        seasons = self._records.setdefault(guild_id, {})
+        records = seasons.get(season)
+        if records is None:
+            guild = self._guild(guild_id)
+            records = {}
+            # Win/loss totals from before results were logged belong to the first season
+            for team, base in (guild.get("baseline", {}) if season == 1 else {}).items():
+                record = records.setdefault(team, TeamRecord(team))
+                record.wins += base.get("wins", 0)
+                record.losses += base.get("losses", 0)
+            seasons[season] = records
+            for game in guild["games"]:
+                if _season(game) == season:
+                    self._apply(guild_id, game)
+        return records
+
+    def _apply(self, guild_id, game):
+        records = self._records.get(guild_id, {}).get(_season(game))
+        if records is None:
+            return
+        alignment = self._guild(guild_id).get("alignment", {})
+        home, away = game["home"], game["away"]
+        home_align, away_align = alignment.get(home, {}), alignment.get(away, {})
+        division_game = bool(home_align.get("division")) and home_align.get("division") == away_align.get("division")
+        conference_game = bool(home_align.get("conference")) and home_align.get("conference") == away_align.get("conference")
+        winner = game.get("winner")
+        home_result = 2 if winner is None else (0 if winner == home else 1)
+        away_result = 2 if winner is None else 1 - home_result
+        records.setdefault(home, TeamRecord(home)).apply(
+            away, home_result, game.get("home_score"), game.get("away_score"), division_game, conference_game
+        )
+        records.setdefault(away, TeamRecord(away)).apply(
+            home, away_result, game.get("away_score"), game.get("home_score"), division_game, conference_game
+        )
+
+    def _changed(self, guild_id):
+        guild_id = str(guild_id)
+        self._versions[guild_id] = self._versions.get(guild_id, 0) + 1
+        self._tables.pop(guild_id, None)
+
+    def version(self, guild_id):
+        """Counter that moves whenever a guild's standings change."""
+        return self._versions.get(str(guild_id), 0)
+
+    def _key_index(self, guild_id):
+        guild_id = str(guild_id)
+        index = self._keys.get(guild_id)
+        if index is None:
+            index = {game["key"]: game for game in self._guild(guild_id)["games"] if game.get("key")}
+            self._keys[guild_id] = index
+        return index
+
+    def record_game(self, guild_id, home, away, home_score=None, away_score=None, winner=None, week=None, key=None):
+        """Log a result and fold it into the standings. Returns the stored game.
+
+        With scores the winner is derived (equal scores are a tie); without
+        scores, pass the winner.
+        """
+        guild_id = str(guild_id)
+        guild = self._guild(guild_id)
+        if home_score is not None and away_score is not None:
+            winner = home if home_score > away_score else away if away_score > home_score else None
+        game = {
+            "id": guild["next_id"],
+            "season": guild.get("season", 1),
+            "home": home,
+            "away": away,
+            "home_score": home_score,
+            "away_score": away_score,
+            "winner": winner,
+            "week": week,
+            "reported_at": time.time()
+        }
+        if key:
+            game["key"] = key
+            self._key_index(guild_id)[key] = game
+        guild["next_id"] += 1
+        guild["games"].append(game)
+        self._apply(guild_id, game)
+        self._changed(guild_id)
+        self._persist()
+        return game
+
+    def report_game(self, guild_id, key, home, away, home_score=None, away_score=None, winner=None, week=None, replace=False):
+        """Idempotent record_game for a report key. Returns (game, status).
+
+        status is "new" for a first report and "duplicate" when the same
+        result was already reported under the key (nothing changes). A
+        different result is "conflict": the recorded game is returned as it
+        was, with the disputed result appended to its "conflicts". With
+        replace it is "updated" instead and the new result takes its place.
+        """
+        existing = self.find_report(guild_id, key)
+        status = "new"
+        if existing:
+            if home_score is not None and away_score is not None:
+                winner = home if home_score > away_score else away if away_score > home_score else None
+            scores = {home: home_score, away: away_score}
+            if (existing.get("winner") == winner
+                    and scores.get(existing["home"], "") == existing.get("home_score")
+                    and scores.get(existing["away"], "") == existing.get("away_score")):
+                return existing, "duplicate"
+            if not replace:
+                existing.setdefault("conflicts", []).append({
+                    "home": home,
+                    "away": away,
+                    "home_score": home_score,
+                    "away_score": away_score,
+                    "winner": winner,
+                    "reported_at": time.time()
+                })
+                self._persist()
+                return existing, "conflict"
+            self.remove_game(guild_id, existing["id"])
+            status = "updated"
+        return self.record_game(guild_id, home, away, home_score, away_score, winner, week, key=key), status
+
+    def annotate(self, guild_id, game, **fields):
+        """Attach bookkeeping fields (not results) to a logged game."""
+        game.update(fields)
+        self._persist()
+        return game
+
+    def find_report(self, guild_id, key):
+        """The game reported under a key, or None."""
+        return self._key_index(guild_id).get(key)
+
+    def remove_game(self, guild_id, game_id):
+        """Take a result out of the log and the standings. Returns it, or None if absent."""
+        guild_id = str(guild_id)
+        games = self._guild(guild_id)["games"]
+        for i, game in enumerate(games):
+            if game["id"] == game_id:
+                break
+        else:
+            return None
+        del games[i]
+        if game.get("key") and self._key_index(guild_id).get(game["key"]) is game:
+            del self._keys[guild_id][game["key"]]
+        self._records.pop(guild_id, None)
+        self._changed(guild_id)
+        self._persist()
+        return game
+
+    def set_alignment(self, guild_id, team, division=None, conference=None):
+        """Place a team in a division and conference; splits are recomputed."""
+        guild_id = str(guild_id)
+        self._guild(guild_id)["alignment"][team] = {"division": division, "conference": conference}
+        self._records.pop(guild_id, None)
+        self._changed(guild_id)
+        self._persist()
+
+    def alignment(self, guild_id, team):
+        return self._guild(guild_id).get("alignment", {}).get(team, {})
+
+    def record(self, guild_id, team, season=None):
+        """The TeamRecord for a team in a season (an empty one if it has not played)."""
+        return self._state(guild_id, season).get(team) or TeamRecord(team)
+
+    def games(self, guild_id):
+        return self._guild(guild_id)["games"]
+
+    def _break_tie(self, group):
+        names = {record.team for record in group}
+
+        def key(record):
+            h2h = [0, 0, 0]
+            for opponent, result in record.head_to_head.items():
+                if opponent in names:
+                    h2h = [a + b for a, b in zip(h2h, result)]
+            return (
+                -_pct(*h2h),
+                -_pct(*record.division),
+                -_pct(*record.conference),
+                -record.point_diff,
+                -record.points_for,
+                record.team.lower()
+            )
+
+        return sorted(group, key=key)
+
+    def table(self, guild_id, teams=None, season=None):
+        """Sorted list of TeamRecords for a season (default the current one).
+
+        teams adds 0-0 rows for teams that have not played.
+        """
+        guild_id = str(guild_id)
+        season = season or self.current_season(guild_id)
+        key = (season, tuple(sorted(teams)) if teams else None)
+        cached = self._tables.get(guild_id)
+        if cached and cached[0] == key:
+            return cached[1]
+
+        records = self._state(guild_id, season)
+        rows = [records.get(team) or TeamRecord(team) for team in teams] if teams else list(records.values())
+        rows.sort(key=lambda record: -record.pct)
+        ordered = []
+        start = 0
+        while start < len(rows):
+            end = start + 1
+            while end < len(rows) and rows[end].pct == rows[start].pct:
+                end += 1
+            group = rows[start:end]
+            ordered.extend(self._break_tie(group) if len(group) > 1 else group)
+            start = end
+        self._tables[guild_id] = (key, ordered)
+        return ordered
+
+
+_standings = None
+
+
+def get_standings():
+    """Return the shared standings engine."""
+    global _standings
+    if _standings is None:
+        _standings = Standings()
+    return _standings
@@ -0,0 +1,245 @@
+import glob
+import json
+import os
+import re
+import sqlite3
+import stat
+import tempfile
+import threading
+import time
+
+DEFAULT_DB_PATH = "data/league.db"
+
+# Every JSON file the bot persists; the migrator walks these.
+JSON_DOCUMENTS = [
+    "config/setup.json",
+    "config/setup_*.json",
+    "config/draft.json",
+    "config/pending_actions.json",
+    "config/timers.json",
+    "league_data.json",
+    "game_registry.json",
+    "player_stats.json",
+    "voice_config.json",
+]
+
+_GUILD_FILE = re.compile(r"^(?P<document>.+)_(?P<guild_id>\d+)\.json$")
+
+
+def atomic_write(path, text):
+    """Write text to path via a temp file and rename, so readers never see a partial file.
+
+    The file keeps its permissions (mkstemp creates 0600); a new file gets 0644.
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = 0o644
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp_", suffix=".json")
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class JsonFileBackend:
+    """Stores each document as a whole JSON file at its path."""
+
+    def exists(self, path):
+        return os.path.exists(path)
+
+    def read(self, path, default=None):
+        if os.path.exists(path):
+            with open(path, 'r') as f:
+                content = f.read().strip()
+            if content:
+                return json.loads(content)
+        return default
+
+    def encode(self, path, data):
+        return json.dumps(data)
+
+    def write(self, path, payload):
+        atomic_write(path, payload)
+
+    def close(self):
+        pass
+
+
+class SQLiteBackend:
+    """Stores documents as one row per top-level key in an SQLite database.
+
+    A file path maps to a document name plus an optional guild ID
+    ("config/setup_123.json" -> ("config/setup_*", "123")). Rows whose key is a
+    guild ID (league_data.json, draft.json) carry it in guild_id too, so every
+    guild-scoped row is reachable through the guild_id index. Only keys whose
+    encoded value changed since the last write are upserted, so saving one
+    guild's league data or one draft is a single row update.
+    """
+
+    def __init__(self, db_path=DEFAULT_DB_PATH):
+        self.db_path = db_path
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._written = {}
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS documents ("
+                " document TEXT NOT NULL,"
+                " guild_id TEXT NOT NULL DEFAULT '',"
+                " key TEXT NOT NULL,"
+                " data TEXT NOT NULL,"
+                " updated_at REAL NOT NULL,"
+                " PRIMARY KEY (document, guild_id, key))"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_documents_guild ON documents (guild_id)")
+
+    @staticmethod
+    def locate(path):
+        """Map a JSON file path to (document, guild_id)."""
+        path = path.replace(os.sep, "/")
+        match = _GUILD_FILE.match(path)
+        if match:
+            return match.group("document") + "_*", match.group("guild_id")
+        return path[:-5] if path.endswith(".json") else path, ""
+
+    @staticmethod
+    def _row_guild(guild_id, key):
+        if guild_id:
+            return guild_id
+        return key if key.isdigit() else ""
+
+    def exists(self, path):
+        document, guild_id = self.locate(path)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM documents WHERE document = ? AND (? = '' OR guild_id = ?) LIMIT 1",
+                (document, guild_id, guild_id)
+            ).fetchone()
+        return row is not None
+
+    def _rows(self, document, guild_id):
+        if guild_id:
+            return self._conn.execute(
+                "SELECT key, data FROM documents WHERE document = ? AND guild_id = ?",
+                (document, guild_id)
+            ).fetchall()
+        return self._conn.execute(
+            "SELECT key, data FROM documents WHERE document = ?",
+            (document,)
+        ).fetchall()
+
+    def read(self, path, default=None):
+        document, guild_id = self.locate(path)
+        with self._lock:
+            rows = self._rows(document, guild_id)
+        if not rows:
+            return default
+        written = self._written.setdefault(path, {})
+        data = {}
+        for key, text in rows:
+            written[key] = text
+            data[key] = json.loads(text)
+        return data
+
+    def encode(self, path, data):
+        return {str(key): json.dumps(value) for key, value in data.items()}
+
+    def write(self, path, payload):
+        document, guild_id = self.locate(path)
+        now = time.time()
+        with self._lock:
+            written = self._written.get(path)
+            if written is None:
+                # Nothing read or written yet in this process: diff against what is stored
+                written = self._written[path] = dict(self._rows(document, guild_id))
+            changed = [
+                (document, self._row_guild(guild_id, key), key, text, now)
+                for key, text in payload.items()
+                if written.get(key) != text
+            ]
+            removed = [key for key in written if key not in payload]
+            if not changed and not removed:
+                return
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT INTO documents (document, guild_id, key, data, updated_at) VALUES (?, ?, ?, ?, ?)"
+                    " ON CONFLICT (document, guild_id, key) DO UPDATE SET data = excluded.data, updated_at = excluded.updated_at",
+                    changed
+                )
+                self._conn.executemany(
+                    "DELETE FROM documents WHERE document = ? AND guild_id = ? AND key = ?",
+                    [(document, self._row_guild(guild_id, key), key) for key in removed]
+                )
+            for _, _, key, text, _ in changed:
+                written[key] = text
+            for key in removed:
+                del written[key]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_backend = None
+
+
+def get_storage_backend():
+    """Return the configured backend (LEAGUE_STORAGE=json|sqlite, default json)."""
+    global _backend
+    if _backend is None:
+        if os.getenv("LEAGUE_STORAGE", "json").lower() == "sqlite":
+            _backend = SQLiteBackend(os.getenv("LEAGUE_DB_PATH", DEFAULT_DB_PATH))
+        else:
+            _backend = JsonFileBackend()
+    return _backend
+
+
+def migrate_json_to_sqlite(db_path=DEFAULT_DB_PATH, root="."):
+    """Copy every existing JSON document into an SQLite database. Returns the paths copied."""
+    source = JsonFileBackend()
+    target = SQLiteBackend(db_path)
+    migrated = []
+    try:
+        for pattern in JSON_DOCUMENTS:
+            for full_path in sorted(glob.glob(os.path.join(root, pattern))):
+                path = os.path.relpath(full_path, root)
+                try:
+                    data = source.read(full_path)
+                except (json.JSONDecodeError, ValueError) as e:
+                    print(f"Skipping malformed {path}: {e}")
+                    continue
+                if not isinstance(data, dict):
+                    continue
+                target.write(path, target.encode(path, data))
+                migrated.append(path)
+    finally:
+        target.close()
+    return migrated
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Migrate the bot's JSON files into SQLite.")
+    parser.add_argument("--db", default=os.getenv("LEAGUE_DB_PATH", DEFAULT_DB_PATH), help="SQLite database path")
+    parser.add_argument("--root", default=".", help="Directory the bot runs from")
+    args = parser.parse_args()
+    for path in migrate_json_to_sqlite(args.db, args.root):
+        print(f"Migrated {path}")
@@ -0,0 +1,86 @@
+import discord
+from utils.config_store import get_config_store
+
+
+class TeamResolver:
+    """Resolves which registered team a member belongs to.
+
+    Keeps a per-guild map of team role ID -> team name so a lookup is a hashed
+    probe per member role. The maps are rebuilt whenever the shared config is
+    saved (which is how /addteam and /setupteams change the team list) or a
+    role in the guild is created, renamed or deleted.
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+        self._guilds = {}
+        self._config_version = None
+        bot.add_listener(self.on_guild_role_create, "on_guild_role_create")
+        bot.add_listener(self.on_guild_role_update, "on_guild_role_update")
+        bot.add_listener(self.on_guild_role_delete, "on_guild_role_delete")
+        bot.add_listener(self.on_guild_remove, "on_guild_remove")
+
+    def invalidate(self, guild_id=None):
+        """Forget the team map for one guild, or for every guild."""
+        if guild_id is None:
+            self._guilds.clear()
+        else:
+            self._guilds.pop(guild_id, None)
+
+    def _maps(self, guild: discord.Guild):
+        store = get_config_store()
+        if self._config_version != store.global_version:
+            self._guilds.clear()
+            self._config_version = store.global_version
+        maps = self._guilds.get(guild.id)
+        if maps is None:
+            teams = set(store.get_global().get("teams", []))
+            by_id = {}
+            by_name = {}
+            for role in guild.roles:
+                if role.name in teams and not role.is_default():
+                    by_id[role.id] = role.name
+                    by_name.setdefault(role.name, role.id)
+            maps = (by_id, by_name)
+            self._guilds[guild.id] = maps
+        return maps
+
+    def get_team_info(self, member: discord.Member):
+        """Return (team_role, team_name, team_emoji) for a member, or Nones."""
+        team_map = self._maps(member.guild)[0]
+        for role in member.roles:
+            team_name = team_map.get(role.id)
+            if team_name:
+                # Callers put the emoji straight into messages, so a missing one is "" (never None)
+                team_emojis = get_config_store().get_global().get("team_emojis") or {}
+                return role, team_name, team_emojis.get(team_name) or ""
+        return None, None, None
+
+    def get_team_role(self, guild: discord.Guild, team_name: str):
+        """Return the role registered for a team name, or None."""
+        role_id = self._maps(guild)[1].get(team_name)
+        return guild.get_role(role_id) if role_id else None
+
+    async def on_guild_role_create(self, role: discord.Role):
+        self.invalidate(role.guild.id)
+
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role):
+        if before.name != after.name:
+            self.invalidate(after.guild.id)
+
+    async def on_guild_role_delete(self, role: discord.Role):
+        self.invalidate(role.guild.id)
+
+    async def on_guild_remove(self, guild: discord.Guild):
+        self.invalidate(guild.id)
+
+
+_team_resolver = None
+
+
+def get_team_resolver(bot):
+    """Return the shared team resolver, creating it on first use."""
+    global _team_resolver
+    if _team_resolver is None:
+        _team_resolver = TeamResolver(bot)
+    return _team_resolver
@@ -0,0 +1,107 @@
+import difflib
+import discord
+from discord import app_commands
+from utils.config_store import get_config_store
+
+MAX_CHOICES = 25  # Discord's autocomplete limit
+FUZZY_CUTOFF = 0.5
+
+
+class TeamIndex:
+    """Search index over one guild's team names.
+
+    Every prefix of each name, and of each word in it, maps to the teams it
+    starts, so prefix matches are a single dict lookup. Names that only contain
+    the query further in are found by a scan of the lowered names, and when
+    that still leaves room, close spellings are added by fuzzy ratio.
+    """
+
+    def __init__(self, teams):
+        self.teams = sorted(set(teams), key=str.lower)
+        self._lowered = [team.lower() for team in self.teams]
+        self._prefixes = {}
+        for position, name in enumerate(self._lowered):
+            starts = {0} | {i + 1 for i, char in enumerate(name) if char in " -_" and i + 1 < len(name)}
+            for start in starts:
+                word = name[start:]
+                for end in range(1, len(word) + 1):
+                    # (0 for the start of the name, 1 for a later word) keeps full-name prefixes first
+                    self._prefixes.setdefault(word[:end], {}).setdefault(position, int(start > 0))
+
+    def search(self, query, limit=MAX_CHOICES):
+        """Return up to `limit` team names ranked for a partial query."""
+        query = query.strip().lower()
+        if not query:
+            return self.teams[:limit]
+
+        ranked = {}
+        for position, rank in self._prefixes.get(query, {}).items():
+            ranked[position] = (rank, 0)
+        if len(ranked) < limit:
+            for position, name in enumerate(self._lowered):
+                if position not in ranked:
+                    offset = name.find(query)
+                    if offset >= 0:
+                        ranked[position] = (2, offset)
+        if len(ranked) < limit:
+            matcher = difflib.SequenceMatcher()
+            matcher.set_seq2(query)
+            for position, name in enumerate(self._lowered):
+                if position in ranked:
+                    continue
+                matcher.set_seq1(name)
+                if matcher.real_quick_ratio() < FUZZY_CUTOFF or matcher.quick_ratio() < FUZZY_CUTOFF:
+                    continue
+                ratio = matcher.ratio()
+                if ratio >= FUZZY_CUTOFF:
+                    ranked[position] = (3, -ratio)
+
+        order = sorted(ranked, key=lambda position: (ranked[position], self._lowered[position]))
+        return [self.teams[position] for position in order[:limit]]
+
+
+class TeamSearch:
+    """Per-guild TeamIndex cache, rebuilt when the team list is saved."""
+
+    def __init__(self):
+        self._indexes = {}
+
+    def _teams(self, guild_id):
+        store = get_config_store()
+        if guild_id is not None and store.has_guild(guild_id):
+            teams = store.get_guild(guild_id).get("teams")
+            if teams:
+                return teams
+        return store.get_global().get("teams", [])
+
+    def index(self, guild_id):
+        store = get_config_store()
+        version = (store.global_version, store.guild_versions.get(str(guild_id), 0))
+        cached = self._indexes.get(guild_id)
+        if cached is None or cached[0] != version:
+            cached = (version, TeamIndex(self._teams(guild_id)))
+            self._indexes[guild_id] = cached
+        return cached[1]
+
+    def search(self, guild_id, query, limit=MAX_CHOICES):
+        return self.index(guild_id).search(query, limit)
+
+
+_team_search = None
+
+
+def get_team_search():
+    """Return the shared team search cache."""
+    global _team_search
+    if _team_search is None:
+        _team_search = TeamSearch()
+    return _team_search
+
+
+async def team_autocomplete(interaction: discord.Interaction, current: str) -> list[app_commands.Choice[str]]:
+    """Autocomplete a team name for any command."""
+    guild_id = interaction.guild.id if interaction.guild else None
+    return [
+        app_commands.Choice(name=team[:100], value=team)
+        for team in get_team_search().search(guild_id, current)
+    ]
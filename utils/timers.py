@@ -0,0 +1,116 @@
+import asyncio
+import heapq
+import time
+from utils.persistence import get_write_behind
+
+TIMERS_FILE = "config/timers.json"
+MAX_SLEEP = 3600  # Re-check the clock at least hourly in case it jumps
+
+
+class TimerService:
+    """Persistent one-shot timers fired by a single sleeping task.
+
+    Entries are {kind, due, data} records keyed by a timer ID and stored in
+    config/timers.json; a min-heap of (due, timer_id) orders them. The runner
+    sleeps until the earliest entry is due (or until an earlier one is
+    scheduled), removes everything that has come due with one state write,
+    then calls the handler registered for each entry's kind. Rescheduling or
+    cancelling leaves a stale heap entry behind, which is skipped when popped.
+    """
+
+    def __init__(self, path=TIMERS_FILE):
+        self.path = path
+        self._timers = None
+        self._heap = []
+        self._handlers = {}
+        self._wakeup = None
+        self._runner = None
+        self._bot = None
+
+    def _load(self):
+        if self._timers is None:
+            self._timers = get_write_behind().load(self.path, {})
+            self._heap = [(entry["due"], timer_id) for timer_id, entry in self._timers.items()]
+            heapq.heapify(self._heap)
+        return self._timers
+
+    def _persist(self):
+        get_write_behind().save(self.path, self._timers)
+
+    def register(self, kind, handler):
+        """Call handler(data) when a timer of this kind comes due."""
+        self._handlers[kind] = handler
+
+    def schedule(self, kind, due, data=None, timer_id=None):
+        """Fire kind at the epoch time due; a timer_id replaces any timer with that ID."""
+        timers = self._load()
+        timer_id = timer_id or f"{kind}:{time.time_ns()}"
+        timers[timer_id] = {"kind": kind, "due": due, "data": data or {}}
+        heapq.heappush(self._heap, (due, timer_id))
+        self._persist()
+        if self._wakeup and self._heap[0] == (due, timer_id):
+            self._wakeup.set()
+        return timer_id
+
+    def has(self, timer_id):
+        return timer_id in self._load()
+
+    def cancel(self, timer_id):
+        if self._load().pop(timer_id, None) is not None:
+            self._persist()
+
+    def start(self, bot):
+        """Start the runner; it waits for the bot to be ready before firing anything."""
+        self._bot = bot
+        if self._runner is None or self._runner.done():
+            self._wakeup = asyncio.Event()
+            self._runner = asyncio.create_task(self._run())
+
+    def stop(self):
+        if self._runner:
+            self._runner.cancel()
+            self._runner = None
+
+    def _pop_due(self, now):
+        timers = self._load()
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            when, timer_id = heapq.heappop(self._heap)
+            entry = timers.get(timer_id)
+            # Skip heap entries left behind by a cancel or a reschedule
+            if entry is not None and entry["due"] == when:
+                due.append((timer_id, timers.pop(timer_id)))
+        if due:
+            self._persist()
+        return due
+
+    async def _run(self):
+        await self._bot.wait_until_ready()
+        self._load()
+        while True:
+            for timer_id, entry in self._pop_due(time.time()):
+                handler = self._handlers.get(entry["kind"])
+                if handler is None:
+                    print(f"No handler for timer {timer_id} ({entry['kind']}), dropping it")
+                    continue
+                try:
+                    await handler(entry["data"])
+                except Exception as e:
+                    print(f"Timer {timer_id} ({entry['kind']}) failed: {e}")
+            delay = min(self._heap[0][0] - time.time(), MAX_SLEEP) if self._heap else MAX_SLEEP
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=max(delay, 0))
+            except asyncio.TimeoutError:
+                pass
+
+
+_timer_service = None
+
+
+def get_timer_service():
+    """Return the shared timer service."""
+    global _timer_service
+    if _timer_service is None:
+        _timer_service = TimerService()
+    return _timer_service
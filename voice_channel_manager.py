@@ -5,27 +5,29 @@ import json
 import os
 import asyncio
 from datetime import datetime
+from utils.persistence import get_write_behind
+from utils.fanout import bounded_gather
+from utils.log_sink import get_log_sink
 
 CONFIG_FILE = "voice_config.json"
 
 def load_config():
-    if os.path.exists(CONFIG_FILE):
-        with open(CONFIG_FILE, 'r') as f:
-            return json.load(f)
-    return {}
+    return get_write_behind().load(CONFIG_FILE, {})
 
 def save_config(config):
-    with open(CONFIG_FILE, 'w') as f:
-        json.dump(config, f, indent=4)
+    get_write_behind().save(CONFIG_FILE, config)
 
 class VoiceChannelManagerCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.channel_ids = set()
         self.team_channels = {}
+        self.voice_config = load_config()
+        self._categories = {}
+        self._category_locks = {}
 
     async def log_action(self, guild: discord.Guild, action: str, details: str):
-        config = load_config()
+        config = self.voice_config
         logs_channel_id = config.get("logs")
         if logs_channel_id:
             logs_channel = guild.get_channel(int(logs_channel_id))
@@ -36,7 +38,7 @@ class VoiceChannelManagerCog(commands.Cog):
                     color=discord.Color.blue(),
                     timestamp=discord.utils.utcnow()
                 )
-                await logs_channel.send(embed=embed)
+                get_log_sink(self.bot).post(logs_channel, embed)
 
     async def cog_unload(self):
         for channels in self.team_channels.values():
@@ -60,28 +62,112 @@ class VoiceChannelManagerCog(commands.Cog):
                 del self.team_channels[game_id]
                 await self.log_action(thread.guild, "Thread Cleanup", f"Deleted voice channels for thread {thread.id}")
 
-    async def create_team_voice_channels(self, guild: discord.Guild, team1_name: str, team2_name: str, category_id: str = None):
-        category = guild.get_channel(int(category_id)) if category_id else None
-        if not category:
-            category = await guild.create_category("Game Voice Channels")
+    async def resolve_category(self, guild: discord.Guild, category_id: str = None):
+        """Return the game voice category for a guild, creating the fallback once.
 
+        Cached per (guild, configured category), so changing the configured
+        category takes effect on the next game.
+        """
+        key = (guild.id, str(category_id) if category_id else None)
+        category = guild.get_channel(self._categories.get(key, 0))
+        if category:
+            return category
+        # Matchups are set up concurrently; only one of them may create the fallback category
+        lock = self._category_locks.setdefault(guild.id, asyncio.Lock())
+        async with lock:
+            category = guild.get_channel(self._categories.get(key, 0))
+            if not category and category_id:
+                category = guild.get_channel(int(category_id))
+            if not category:
+                category = discord.utils.get(guild.categories, name="Game Voice Channels")
+            if not category:
+                category = await guild.create_category("Game Voice Channels")
+            self._categories[key] = category.id
+        return category
+
+    async def create_team_voice_channel(self, category: discord.CategoryChannel, team_role: discord.Role, announce=True):
+        """Create a team's private voice channel with its permissions set at creation."""
+        overwrites = {
+            category.guild.default_role: discord.PermissionOverwrite(connect=False, view_channel=False),
+            team_role: discord.PermissionOverwrite(connect=True, view_channel=True)
+        }
+        channel = await category.create_voice_channel(f"{team_role.name} Voice", overwrites=overwrites)
+        self.channel_ids.add(str(channel.id))
+        if announce:
+            await channel.send(f"{team_role.mention} Your voice channel is ready!")
+        return channel
+
+    async def create_team_voice_channels(self, guild: discord.Guild, team1_name: str, team2_name: str, category_id: str = None, announce=True):
         team1_role = discord.utils.get(guild.roles, name=team1_name)
         team2_role = discord.utils.get(guild.roles, name=team2_name)
         if not team1_role or not team2_role:
             return None, None
 
-        team1_channel = await category.create_voice_channel(f"{team1_name} Voice")
-        team2_channel = await category.create_voice_channel(f"{team2_name} Voice")
+        category = await self.resolve_category(guild, category_id)
+        team1_channel, team2_channel = await asyncio.gather(
+            self.create_team_voice_channel(category, team1_role, announce),
+            self.create_team_voice_channel(category, team2_role, announce)
+        )
+        return team1_channel, team2_channel
 
-        await team1_channel.set_permissions(guild.default_role, connect=False, view_channel=False)
-        await team1_channel.set_permissions(team1_role, connect=True, view_channel=True)
-        await team1_channel.send(f"{team1_role.mention} Your voice channel is ready!")
+    async def create_week_voice_channels(self, guild: discord.Guild, matchups, category_id: str = None, limit=4):
+        """Create voice channels for every matchup of a week in one batch.
 
-        await team2_channel.set_permissions(guild.default_role, connect=False, view_channel=False)
-        await team2_channel.set_permissions(team2_role, connect=True, view_channel=True)
-        await team2_channel.send(f"{team2_role.mention} Your voice channel is ready!")
+        Returns one entry per matchup: a (team1_channel, team2_channel) tuple,
+        (None, None) if a team role is missing, or the exception that stopped
+        it, in which case the pair's other channel has been deleted again.
+        """
+        category = await self.resolve_category(guild, category_id)
+        jobs = []
+        slots = []
+        for team1, team2 in matchups:
+            team1_role = discord.utils.get(guild.roles, name=team1)
+            team2_role = discord.utils.get(guild.roles, name=team2)
+            if not team1_role or not team2_role:
+                slots.append(None)
+                continue
+            slots.append(len(jobs))
+            jobs.append(lambda role=team1_role: self.create_team_voice_channel(category, role, announce=False))
+            jobs.append(lambda role=team2_role: self.create_team_voice_channel(category, role, announce=False))
 
-        return team1_channel, team2_channel
+        channels = await bounded_gather(jobs, limit)
+        results = []
+        for (team1, team2), slot in zip(matchups, slots):
+            if slot is None:
+                results.append((None, None))
+                continue
+            pair = channels[slot], channels[slot + 1]
+            error = next((c for c in pair if isinstance(c, BaseException)), None)
+            if error:
+                await self.delete_voice_channels(pair)
+                results.append(error)
+            else:
+                self.team_channels[f"{team1}-{team2}"] = list(pair)
+                results.append(pair)
+        return results
+
+    async def delete_voice_channels(self, channels, game_id=None):
+        """Delete voice channels created for a game that won't go ahead.
+
+        Entries that are None or an exception (channels never created) are
+        skipped; game_id also drops the game from team_channels.
+        """
+        for channel in channels:
+            if channel is None or isinstance(channel, BaseException):
+                continue
+            try:
+                await channel.delete()
+                self.channel_ids.discard(str(channel.id))
+            except discord.HTTPException as e:
+                print(f"Failed to delete voice channel {channel.id}: {e}")
+        if game_id:
+            self.team_channels.pop(game_id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel):
+        for key, category_id in list(self._categories.items()):
+            if key[0] == channel.guild.id and category_id == channel.id:
+                del self._categories[key]
 
     # CPU Break
     # asyncio.sleep(2)
@@ -89,7 +175,7 @@ class VoiceChannelManagerCog(commands.Cog):
     @app_commands.command(name="create_vc", description="Create temporary voice channels for a scheduled game.")
     @app_commands.describe(game_id="Game identifier (e.g., Team1 vs Team2)")
     async def create_vc(self, interaction: discord.Interaction, game_id: str):
-        config = load_config()
+        config = self.voice_config
         schedule = load_schedule()  # Assuming load_schedule from ScheduleCog
         teams = schedule.get(game_id)
         if not teams:
@@ -106,8 +192,6 @@ class VoiceChannelManagerCog(commands.Cog):
         team1_channel, team2_channel = await self.create_team_voice_channels(interaction.guild, team1, team2, category_id)
         if team1_channel and team2_channel:
             self.team_channels[channel_name] = [team1_channel, team2_channel]
-            self.channel_ids.add(str(team1_channel.id))
-            self.channel_ids.add(str(team2_channel.id))
             await interaction.response.send_message(
                 f"Created voice channels: {team1_channel.mention} and {team2_channel.mention}",
                 ephemeral=True
@@ -177,9 +261,9 @@ class VoiceChannelManagerCog(commands.Cog):
     @app_commands.checks.has_permissions(administrator=True)
     @app_commands.describe(category="The voice channel category")
     async def set_voice_category(self, interaction: discord.Interaction, category: discord.CategoryChannel):
-        config = load_config()
-        config["voice_category_id"] = str(category.id)
-        save_config(config)
+        self.voice_config["voice_category_id"] = str(category.id)
+        save_config(self.voice_config)
+        self._categories[(interaction.guild.id, str(category.id))] = category.id
         await interaction.response.send_message(f"Voice category set to: {category.name}", ephemeral=True)
         await self.log_action(interaction.guild, "Voice Category Set", f"Category: {category.name}")
 